@@ -0,0 +1,123 @@
+# 📍 benchmarks/coingecko_coin_doc.py
+"""
+Bandingkan biaya ambil metadata dari dokumen CoinGecko /coins/{id}:
+  - full   : query default + resp.json() (cara lama)
+  - lean   : COIN_DOC_LEAN_PARAMS + json.loads penuh
+  - stream : COIN_DOC_LEAN_PARAMS + JSONFieldExtractor (stop setelah field ketemu)
+
+Dokumen dibuat sintetis dengan urutan key & ukuran mirip respons asli,
+jadi bisa dijalankan offline:  python benchmarks/coingecko_coin_doc.py
+"""
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.coingecko import JSONFieldExtractor  # noqa: E402
+from lib.token_metadata import COIN_DOC_FIELDS  # noqa: E402
+
+LANGS = [f"l{i}" for i in range(40)]
+CURRENCIES = [f"c{i}" for i in range(60)]
+CHUNK_SIZE = 4096
+ROUNDS = 200
+
+
+def build_doc(lean: bool) -> bytes:
+    doc = {
+        "id": "ethereum",
+        "symbol": "eth",
+        "name": "Ethereum",
+        "web_slug": "ethereum",
+        "asset_platform_id": None,
+        "platforms": {"": ""},
+        "detail_platforms": {"": {"decimal_place": None, "contract_address": ""}},
+        "block_time_in_minutes": 0,
+        "hashing_algorithm": "Ethash",
+        "categories": ["Smart Contract Platform", "Layer 1 (L1)"],
+        "public_notice": None,
+        "additional_notices": [],
+    }
+    if not lean:
+        doc["localization"] = {lang: "Ethereum" for lang in LANGS}
+    doc["description"] = (
+        {"en": "Ethereum is a global, open-source platform. " * 120}
+        if lean
+        else {lang: "Ethereum is a global, open-source platform. " * 120 for lang in LANGS}
+    )
+    doc["links"] = {"homepage": ["https://www.ethereum.org/"], "blockchain_site": ["https://etherscan.io/"] * 10}
+    doc["image"] = {"thumb": "https://x/thumb.png", "small": "https://x/small.png", "large": "https://x/large.png"}
+    doc["sentiment_votes_up_percentage"] = 80.1
+    if not lean:
+        doc["market_data"] = {
+            field: {c: 1234.5678 for c in CURRENCIES}
+            for field in [
+                "current_price", "ath", "ath_change_percentage", "atl", "market_cap",
+                "total_volume", "high_24h", "low_24h", "price_change_24h_in_currency",
+                "price_change_percentage_1h_in_currency", "price_change_percentage_7d_in_currency",
+                "price_change_percentage_30d_in_currency", "market_cap_change_24h_in_currency",
+            ]
+        }
+        doc["community_data"] = {"twitter_followers": 3000000, "reddit_subscribers": 1000000}
+        doc["developer_data"] = {"forks": 20000, "stars": 45000, "commit_count_4_weeks": 100}
+        doc["tickers"] = [
+            {
+                "base": "ETH",
+                "target": "USDT",
+                "market": {"name": f"Exchange {i}", "identifier": f"ex{i}", "has_trading_incentive": False},
+                "last": 3456.78,
+                "volume": 123456.78,
+                "converted_last": {"btc": 0.05, "eth": 1.0, "usd": 3456.78},
+                "converted_volume": {"btc": 100.0, "eth": 2000.0, "usd": 7000000.0},
+                "trust_score": "green",
+                "timestamp": "2024-01-01T00:00:00+00:00",
+                "trade_url": f"https://exchange{i}.example/trade/ETH_USDT",
+                "coin_id": "ethereum",
+                "target_coin_id": "tether",
+            }
+            for i in range(100)
+        ]
+    doc["last_updated"] = "2024-01-01T00:00:00.000Z"
+    return json.dumps(doc).encode()
+
+
+def cpu_per_call(fn) -> float:
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.process_time() - start) / ROUNDS * 1000
+
+
+def parse_full(raw: bytes):
+    data = json.loads(raw)
+    return {k: data.get(k) for k in COIN_DOC_FIELDS}
+
+
+def parse_stream(raw: bytes) -> tuple[dict, int]:
+    extractor = JSONFieldExtractor(COIN_DOC_FIELDS)
+    consumed = 0
+    for i in range(0, len(raw), CHUNK_SIZE):
+        consumed += len(raw[i : i + CHUNK_SIZE])
+        if extractor.feed(raw[i : i + CHUNK_SIZE]):
+            break
+    return extractor.found, consumed
+
+
+def main():
+    full = build_doc(lean=False)
+    lean = build_doc(lean=True)
+    assert parse_full(full) == parse_stream(lean)[0]
+
+    rows = [
+        ("full + json.loads", len(full), cpu_per_call(lambda: parse_full(full))),
+        ("lean + json.loads", len(lean), cpu_per_call(lambda: parse_full(lean))),
+        ("lean + stream", parse_stream(lean)[1], cpu_per_call(lambda: parse_stream(lean))),
+    ]
+    print(f"{'mode':<20}{'bytes read':>12}{'parse CPU/call':>18}")
+    for name, size, cpu_ms in rows:
+        print(f"{name:<20}{size:>12,}{cpu_ms:>15.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# 📍 benchmarks/gateway_middleware.py
+"""
+Overhead per request middleware gateway RapidAPI di /ping:
+  - none   : tanpa middleware (baseline)
+  - legacy : @app.middleware("http") lama (list PUBLIC_PATHS per request, log INFO)
+  - asgi   : RapidAPIGatewayMiddleware (frozenset, compare_digest, tanpa log INFO)
+
+Jalankan:  python benchmarks/gateway_middleware.py
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request, HTTPException  # noqa: E402
+from routers.crypto.ping import ping_router  # noqa: E402
+from lib.rapidapi_gateway import RapidAPIGatewayMiddleware  # noqa: E402
+
+SECRET = "bench-secret"
+REQUESTS = 3000
+PUBLIC_PATHS = [
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/api/v1/crypto/ping",
+    "/api/v1/crypto/tokens",
+    "/api/v1/crypto/token_info",
+]
+PING_PATH = "/api/v1/crypto/ping"
+# handler /ping yang sama tapi di luar whitelist → ukur jalur cek header
+GATED_PATH = "/api/v1/crypto/gated_ping"
+
+logging.basicConfig(level=logging.INFO, stream=open(os.devnull, "w"))
+logger = logging.getLogger("bench")
+
+
+def make_app(mode: str) -> FastAPI:
+    app = FastAPI()
+    app.include_router(ping_router, prefix="/api/v1/crypto")
+    app.add_api_route(GATED_PATH, ping_router.routes[0].endpoint)
+
+    if mode == "legacy":
+
+        @app.middleware("http")
+        async def enforce_rapidapi_proxy(request: Request, call_next):
+            path = request.url.path
+            public_paths = list(PUBLIC_PATHS)
+            if path in public_paths:
+                return await call_next(request)
+            proxy_secret = request.headers.get("X-RapidAPI-Proxy-Secret")
+            if proxy_secret != SECRET:
+                raise HTTPException(status_code=403, detail="Forbidden")
+            logger.info(f"✅ Akses RapidAPI valid ke {path}")
+            return await call_next(request)
+
+    elif mode == "asgi":
+        app.add_middleware(
+            RapidAPIGatewayMiddleware, secret=SECRET, public_paths=PUBLIC_PATHS
+        )
+    return app
+
+
+async def per_request_us(app: FastAPI, path: str) -> float:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"X-RapidAPI-Proxy-Secret": SECRET}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get(path, headers=headers)
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            resp = await client.get(path, headers=headers)
+        elapsed = time.perf_counter() - start
+    assert resp.status_code == 200
+    return elapsed / REQUESTS * 1e6
+
+
+async def main():
+    for path in (PING_PATH, GATED_PATH):
+        results = {
+            mode: await per_request_us(make_app(mode), path)
+            for mode in ("none", "legacy", "asgi")
+        }
+        print(path)
+        print(f"  {'mode':<8}{'us/request':>12}{'overhead':>12}")
+        for mode, us in results.items():
+            print(f"  {mode:<8}{us:>12.1f}{us - results['none']:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,153 @@
+# 📍 benchmarks/import_time.py
+"""
+Laporan waktu import worker (python -X importtime) per konfigurasi chain:
+  - boot      : `import main` (yang dibayar tiap worker gunicorn saat start)
+  - top modul : cumulative terbesar di bawah main (gaya -X importtime)
+  - SDK       : keluarga chain yang ikut ter-import saat boot (harusnya tidak ada)
+  - first use : biaya import SDK + helper keluarga chain saat pertama dipakai
+  - RSS       : memori proses setelah boot
+
+Jalankan:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 5 --top 15
+    python benchmarks/import_time.py --env CHAIN_FAMILIES_DISABLED=sol,trx
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFIGS = {
+    "semua chain": {},
+    "hanya evm": {"CHAIN_FAMILIES_DISABLED": "sol,trx"},
+    "hanya sol": {"CHAIN_FAMILIES_DISABLED": "evm,trx"},
+}
+
+# dijalankan di subprocess setelah -X importtime mencatat `import main`
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+boot = time.perf_counter() - start
+from lib.chains import FAMILIES, loaded_families, preload_families
+rss_kb = 0
+with open("/proc/self/status") as f:
+    for line in f:
+        if line.startswith("VmRSS:"):
+            rss_kb = int(line.split()[1])
+result = {"boot": boot, "loaded": loaded_families(), "rss_kb": rss_kb, "first_use": {}}
+for family in FAMILIES:
+    result["first_use"][family] = preload_families([family])
+print(json.dumps(result))
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Baris `import time: self | cumulative | name` → (nama, depth, self_us, cumulative_us)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        # nama diawali 1 spasi + 2 spasi per level import bersarang
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative)))
+    return rows
+
+
+def report(extra_env: dict | None = None, top: int = 10) -> dict:
+    """Satu kali boot di subprocess dengan env tambahan"""
+    env = {
+        **os.environ,
+        "RAPIDAPI_SECRET": os.getenv("RAPIDAPI_SECRET", "bench-secret"),
+        "LOG_LEVEL": "WARNING",
+        "PYTHONWARNINGS": "ignore",
+        **(extra_env or {}),
+    }
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    rows = parse_importtime(proc.stderr)
+    # modul yang di-import main (depth 1 di bawah baris "main")
+    main_index = next(i for i, row in enumerate(rows) if row[0] == "main" and row[1] == 0)
+    children, i = [], main_index - 1
+    while i >= 0 and rows[i][1] > 0:
+        if rows[i][1] == 1:
+            children.append(rows[i])
+        i -= 1
+    result["main_cumulative_us"] = rows[main_index][3]
+    result["top"] = [
+        {"module": name, "cumulative_ms": cumulative / 1000, "self_ms": self_us / 1000}
+        for name, _, self_us, cumulative in sorted(children, key=lambda r: -r[3])[:top]
+    ]
+    return result
+
+
+def summarize(runs: list[dict]) -> dict:
+    best = min(runs, key=lambda r: r["boot"])
+    return {
+        "boot_ms": statistics.median(r["boot"] for r in runs) * 1000,
+        "boot_best_ms": best["boot"] * 1000,
+        "rss_mb": statistics.median(r["rss_kb"] for r in runs) / 1024,
+        "loaded_at_boot": best["loaded"],
+        "first_use_ms": {
+            family: statistics.median(r["first_use"][family] for r in runs) * 1000
+            for family in best["first_use"]
+        },
+        "top": best["top"],
+    }
+
+
+def print_summary(name: str, s: dict, top: bool = True):
+    first_use = "  ".join(f"{f}={ms:.0f}ms" for f, ms in s["first_use_ms"].items())
+    print(
+        f"{name:<14} boot {s['boot_ms']:>6.0f}ms (best {s['boot_best_ms']:.0f})  "
+        f"RSS {s['rss_mb']:>5.1f}MB  SDK saat boot: {','.join(s['loaded_at_boot']) or '-'}  "
+        f"first use: {first_use}"
+    )
+    if top:
+        for entry in s["top"]:
+            print(
+                f"    {entry['cumulative_ms']:>8.1f}ms cumulative {entry['self_ms']:>7.1f}ms self  {entry['module']}"
+            )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--env", action="append", default=[], help="hanya ukur konfigurasi ini, KEY=VALUE")
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    configs = CONFIGS
+    if args.env:
+        configs = {"custom": dict(item.split("=", 1) for item in args.env)}
+
+    results = {}
+    for name, env in configs.items():
+        runs = [report(env, args.top) for _ in range(args.runs)]
+        results[name] = summarize(runs)
+        print_summary(name, results[name])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 hasil disimpan ke {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# 📍 benchmarks/logging_throughput.py
+"""
+Throughput /price & /balance dengan logging lama vs logging_setup:
+  - basic : logging.basicConfig(INFO) → StreamHandler sinkron ke stderr
+  - queue : setup_logging() → QueueHandler + sampling, tulis di thread listener
+
+Setiap mode jalan di subprocess terpisah, stderr diarahkan ke file
+(seperti di server, log ditulis ke file/journald). /price pakai price store
+yang sudah terisi, /balance pakai RPC stand-in lokal (eth_getBalance).
+
+Jalankan:  python benchmarks/logging_throughput.py
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+import threading
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+REQUESTS = 2000
+RPC_PORT = 18645
+WALLET = "0x" + "1" * 40
+
+
+def start_rpc_stand_in():
+    from aiohttp import web
+
+    async def handle(request):
+        body = await request.json()
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": body["id"], "result": hex(10**18)}
+        )
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app, access_log=None)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", RPC_PORT).start())
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    time.sleep(0.3)
+
+
+async def requests_per_second(client, url: str, headers: dict) -> float:
+    for _ in range(100):
+        await client.get(url, headers=headers)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        resp = await client.get(url, headers=headers)
+    elapsed = time.perf_counter() - start
+    assert resp.status_code == 200, resp.text
+    return REQUESTS / elapsed
+
+
+def run_mode(mode: str):
+    import logging
+    import httpx
+    import main
+    from lib import price_store
+    from lib.logging_setup import shutdown_logging
+
+    if mode == "basic":
+        shutdown_logging()
+        logging.basicConfig(level=logging.INFO, force=True)
+
+    price_store._prices["solana"] = {"idr": 2_500_000, "usd": 150, "fetched_at": time.time()}
+    start_rpc_stand_in()
+    headers = {"X-RapidAPI-Proxy-Secret": main.RAPIDAPI_SECRET or ""}
+
+    async def bench():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return {
+                "/price": await requests_per_second(
+                    client, "/api/v1/crypto/price?token=sol", headers
+                ),
+                "/balance": await requests_per_second(
+                    client,
+                    f"/api/v1/crypto/balance?chain=eth&wallet={WALLET}"
+                    f"&rpc_url=http://127.0.0.1:{RPC_PORT}",
+                    headers,
+                ),
+            }
+
+    result = asyncio.run(bench())
+    shutdown_logging()
+    print(json.dumps(result))
+
+
+def main():
+    results = {}
+    for mode in ("basic", "queue"):
+        with tempfile.TemporaryFile() as log_file:
+            out = subprocess.run(
+                [sys.executable, __file__, mode],
+                cwd=ROOT,
+                stdout=subprocess.PIPE,
+                stderr=log_file,
+                check=True,
+                text=True,
+            ).stdout
+            log_file.seek(0, os.SEEK_END)
+            results[mode] = (json.loads(out.strip().splitlines()[-1]), log_file.tell())
+
+    print(f"{'mode':<8}{'/price rps':>12}{'/balance rps':>14}{'log bytes':>12}")
+    for mode, (rps, log_bytes) in results.items():
+        print(f"{mode:<8}{rps['/price']:>12.0f}{rps['/balance']:>14.0f}{log_bytes:>12,}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+    else:
+        main()
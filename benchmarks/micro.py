@@ -0,0 +1,383 @@
+# 📍 benchmarks/micro.py
+"""
+Microbenchmark jalur CPU murni per request (tanpa jaringan):
+  - wallet_validator: validate_wallet (hit LRU) & cek penuh tanpa cache
+    (checksum EIP-55, titik ed25519, base58check TRON)
+  - explorer_mapper.get_explorer_url
+  - gateway RapidAPI (RapidAPIGatewayMiddleware, pengganti enforce_rapidapi_proxy)
+  - validasi + serialisasi response model pydantic (jalur FastAPI serialize_response)
+  - encode receipt tx_status (200 log web3, balances Solana): orjson vs stdlib
+  - parsing key base58 (create_admin_keypair / load_keypair)
+  - signer per request: derive dari private_key vs signer resident (key_alias)
+  - Web3.to_checksum_address
+
+Tiap case: timeit autorange → N loop per ronde, --repeat ronde diselang-seling
+antar case, GC mati selama ronde (default timeit). Yang dibandingkan dengan
+baseline: ronde tercepat dibagi ronde tercepat calibration_loop ("relative"),
+jadi mesin yang sedang lambat / CPU yang di-throttle tidak terbaca sebagai regresi.
+Log INFO aktif seperti produksi, tapi record hanya sampai QueueHandler
+(biaya di thread request), tidak ada thread penulis yang ikut rebutan GIL.
+
+Jalankan:
+    python benchmarks/micro.py                       # bandingkan dengan baseline
+    python benchmarks/micro.py --only wallet,gateway
+    python benchmarks/micro.py --save                # tulis ulang baseline
+Baseline: benchmarks/baselines/micro.json (hanya sebanding di mesin + Python yang sama).
+"""
+import os
+import sys
+import json
+import timeit
+import logging
+import platform
+import argparse
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from web3 import Web3  # noqa: E402
+from hexbytes import HexBytes  # noqa: E402
+from web3.datastructures import AttributeDict  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from lib.logging_setup import _DroppingQueueHandler  # noqa: E402
+from lib.json_response import OrjsonResponse  # noqa: E402
+from lib.wallet_validator import _check_evm, _check_sol, _check_trx, validate_wallet  # noqa: E402
+from lib.explorer_mapper import get_explorer_url  # noqa: E402
+from lib.rapidapi_gateway import RapidAPIGatewayMiddleware  # noqa: E402
+from lib.solana_helper import create_admin_keypair  # noqa: E402
+from lib.helpers.usdt.sol import load_keypair  # noqa: E402
+from lib.signer_registry import as_signer, derive_signer  # noqa: E402
+from routers.crypto.balance import balance_router  # noqa: E402
+from routers.crypto.price import price_router  # noqa: E402
+from routers.crypto.send import send_router  # noqa: E402
+from routers.crypto.token_info import token_info_router  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines", "micro.json")
+
+SECRET = "bench-secret"
+EVM_WALLET = "0x2222222222222222222222222222222222222222"
+EVM_LOWER = "0xdac17f958d2ee523a2206206994597c13d831ec7"
+EVM_CHECKSUM = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+SOL_WALLET = "9C6hybhQ6Aycep9jaUnP6uL9ZYvDjUp1aSkFWPUFJtpj"
+TRX_WALLET = "TWbNxh3feKxRTFEDVk3fn9z3EznSuWvWMu"
+SOL_KEY_64 = "1GMkH3brNXiNNs1tiFZHu4yZSRrzJwxi5wB9bHFtMikjwpAW9DMZzU2Pqakc5it8X3N5vPmqdN7KF4CCUpmKhq"
+EVM_KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+TRX_KEY = "ab" * 32
+EVM_TX = "0x" + "ab" * 32
+
+
+class _Sink:
+    """Pengganti queue log: record dibuang setelah disiapkan QueueHandler"""
+
+    def put_nowait(self, record):
+        pass
+
+
+def setup_bench_logging():
+    root = logging.getLogger()
+    root.handlers[:] = [_DroppingQueueHandler(_Sink())]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+# ====================== HELPER ======================
+def run_coro(coro):
+    """Jalankan coroutine yang tidak pernah suspend tanpa event loop (overhead minimal)"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspend, tidak bisa dijalankan sinkron")
+
+
+def response_field(router, path: str):
+    for route in router.routes:
+        if route.path == path and getattr(route, "response_field", None) is not None:
+            return route.response_field
+    raise LookupError(path)
+
+
+def response_case(field, content: dict):
+    def run():
+        value = run_coro(serialize_response(field=field, response_content=content))
+        return OrjsonResponse(value).body
+
+    return run
+
+
+def evm_receipt(logs: int) -> dict:
+    """Bentuk hasil get_evm_tx_status: log AttributeDict berisi HexBytes seperti web3"""
+    return {
+        "status": "success",
+        "tx_hash": EVM_TX,
+        "from": EVM_CHECKSUM,
+        "to": EVM_WALLET,
+        "value": 0.0,
+        "gasUsed": 5_123_456,
+        "gasPriceGwei": 12.5,
+        "cumulativeGasUsed": 9_876_543,
+        "transactionIndex": 17,
+        "blockNumber": 21_000_000,
+        "logs": [
+            AttributeDict(
+                {
+                    "address": EVM_CHECKSUM,
+                    "topics": [HexBytes(bytes([i % 256]) * 32) for _ in range(3)],
+                    "data": HexBytes(i.to_bytes(32, "big")),
+                    "blockNumber": 21_000_000,
+                    "transactionHash": HexBytes(bytes.fromhex(EVM_TX[2:])),
+                    "transactionIndex": 17,
+                    "blockHash": HexBytes(b"\x11" * 32),
+                    "logIndex": i,
+                    "removed": False,
+                }
+            )
+            for i in range(logs)
+        ],
+    }
+
+
+def sol_status(accounts: int) -> dict:
+    return {
+        "status": "success",
+        "tx_hash": EVM_TX,
+        "slot": 250_000_000,
+        "fee": 5000,
+        "pre_balances": [1_000_000_000 + i for i in range(accounts)],
+        "post_balances": [999_995_000 + i for i in range(accounts)],
+        "err": None,
+    }
+
+
+def stdlib_case(content: dict):
+    """Jalur lama: jsonable_encoder + json stdlib (HexBytes perlu encoder khusus)"""
+    encoders = {bytes: lambda b: "0x" + b.hex()}
+    return lambda: JSONResponse(jsonable_encoder(content, custom_encoder=encoders)).body
+
+
+def orjson_case(content: dict):
+    return lambda: OrjsonResponse(content).body
+
+
+def gateway_case(path: str, secret: bytes):
+    async def app(scope, receive, send):
+        pass
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    middleware = RapidAPIGatewayMiddleware(
+        app, secret=SECRET, public_paths=["/docs", "/api/v1/crypto/ping"]
+    )
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [
+            (b"host", b"api.example"),
+            (b"user-agent", b"bench"),
+            (b"x-rapidapi-proxy-secret", secret),
+        ],
+        "client": ("127.0.0.1", 50000),
+    }
+    return lambda: run_coro(middleware(scope, receive, send))
+
+
+# ====================== CASE ======================
+def cases() -> dict:
+    balance = response_field(balance_router, "/balance")
+    price = response_field(price_router, "/price")
+    token_info = response_field(token_info_router, "/token_info")
+    send = response_field(send_router, "/send/native")
+    signers = {
+        "evm": derive_signer("evm", EVM_KEY, alias="bench"),
+        "trx": derive_signer("trx", TRX_KEY, alias="bench"),
+        "sol": derive_signer("sol", SOL_KEY_64, alias="bench"),
+    }
+    return {
+        "wallet.validate[evm]": lambda: validate_wallet("eth", EVM_WALLET),
+        "wallet.validate[sol]": lambda: validate_wallet("sol", SOL_WALLET),
+        "wallet.validate[trx]": lambda: validate_wallet("trx", TRX_WALLET),
+        "wallet.validate[invalid]": lambda: validate_wallet("sol", "not-a-wallet"),
+        "wallet.check[evm eip55]": lambda: _check_evm(EVM_CHECKSUM),
+        "wallet.check[sol ed25519]": lambda: _check_sol(SOL_WALLET),
+        "wallet.check[trx b58check]": lambda: _check_trx(TRX_WALLET),
+        "explorer.url[sol]": lambda: get_explorer_url("sol", EVM_TX),
+        "explorer.url[ton]": lambda: get_explorer_url("ton", EVM_TX),
+        "gateway[public]": gateway_case("/api/v1/crypto/ping", b""),
+        "gateway[secret ok]": gateway_case("/api/v1/crypto/balance", SECRET.encode()),
+        "gateway[forbidden]": gateway_case("/api/v1/crypto/balance", b"wrong"),
+        "response[balance]": response_case(
+            balance, {"status": "success", "chain": "ETH", "wallet": EVM_WALLET, "balance": 12.34}
+        ),
+        "response[price]": response_case(
+            price, {"status": "success", "token": "SOL", "price_idr": 2450000.5, "age_seconds": 3.2}
+        ),
+        "response[token_info]": response_case(
+            token_info,
+            {
+                "status": "success",
+                "token": "usdt",
+                "metadata": {
+                    "name": "Tether",
+                    "symbol": "USDT",
+                    "decimals": 6,
+                    "contract_address": EVM_CHECKSUM,
+                    "coingecko_id": "tether",
+                },
+            },
+        ),
+        "response[send]": response_case(
+            send, {"status": "success", "tx_hash": EVM_TX, "message": f"https://etherscan.io/tx/{EVM_TX}"}
+        ),
+        "tx_status[evm 200 log] stdlib": stdlib_case(evm_receipt(200)),
+        "tx_status[evm 200 log] orjson": orjson_case(evm_receipt(200)),
+        "tx_status[sol 64 akun] stdlib": stdlib_case(sol_status(64)),
+        "tx_status[sol 64 akun] orjson": orjson_case(sol_status(64)),
+        "keypair.admin[64 byte]": lambda: create_admin_keypair(SOL_KEY_64),
+        "keypair.load[64 byte]": lambda: load_keypair(SOL_KEY_64),
+        "signer[evm private_key]": lambda: as_signer("evm", EVM_KEY),
+        "signer[evm alias]": lambda: as_signer("evm", signers["evm"]),
+        "signer[trx private_key]": lambda: as_signer("trx", TRX_KEY),
+        "signer[trx alias]": lambda: as_signer("trx", signers["trx"]),
+        "signer[sol alias]": lambda: create_admin_keypair(signers["sol"]),
+        "checksum[lowercase]": lambda: Web3.to_checksum_address(EVM_LOWER),
+        "checksum[checksummed]": lambda: Web3.to_checksum_address(EVM_CHECKSUM),
+    }
+
+
+# ====================== UKUR ======================
+CALIBRATION = "calibration"
+
+
+def calibration_loop():
+    """Beban Python murni tetap (dict + str + int) sebagai patokan kecepatan mesin saat ini"""
+    data = {}
+    for i in range(64):
+        data[f"k{i}"] = i * 3
+    return sum(v for k, v in data.items() if k.endswith("1"))
+
+
+def loops_for(fn, min_time: float) -> int:
+    number, elapsed = timeit.Timer(fn).autorange()
+    # autorange berhenti di >= 0.2 detik; skala ke min_time per ronde
+    return max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+
+def measure(selected: dict, repeat: int, min_time: float) -> dict:
+    """
+    Ronde diselang-seling antar case (case A ronde 1, case B ronde 1, ...), jadi
+    perubahan kecepatan mesin di tengah jalan kena semua case sama rata.
+    Hasil juga dinormalisasi ke calibration_loop yang diukur dengan cara yang sama.
+    """
+    timers = {name: timeit.Timer(fn) for name, fn in selected.items()}
+    loops = {name: loops_for(fn, min_time) for name, fn in selected.items()}
+    rounds: dict[str, list[float]] = {name: [] for name in selected}
+    for _ in range(repeat):
+        for name, timer in timers.items():
+            rounds[name].append(timer.timeit(loops[name]) / loops[name] * 1e9)
+
+    calibration_ns = min(rounds[CALIBRATION])
+    return {
+        name: {
+            "best_ns": round(min(values), 1),
+            "median_ns": round(statistics.median(values), 1),
+            "relative": round(min(values) / calibration_ns, 5),
+            "loops": loops[name],
+        }
+        for name, values in rounds.items()
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, threshold: float) -> tuple[str, str | None]:
+    old = baseline.get(name)
+    if old is None:
+        return "baru", None
+    # bandingkan angka relatif ke kalibrasi → tahan terhadap mesin yang sedang lambat
+    change = result["relative"] / old["relative"] - 1
+    if change > threshold:
+        return f"{change:+.0%} ❌", "regresi"
+    if change < -threshold:
+        return f"{change:+.0%} ✅", "lebih cepat"
+    return f"{change:+.0%}", None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", default="", help="filter nama case (substring, pisah koma)")
+    parser.add_argument("--repeat", type=int, default=15, help="jumlah ronde per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="durasi satu ronde (detik)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.2, help="batas regresi (0.2 = 20%%)")
+    parser.add_argument("--save", action="store_true", help="tulis hasil sebagai baseline baru")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    setup_bench_logging()
+    filters = [f for f in args.only.split(",") if f]
+    selected = {
+        name: fn for name, fn in cases().items() if not filters or any(f in name for f in filters)
+    }
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        if saved.get("environment") != environment():
+            print(f"⚠️  baseline dari environment lain: {saved.get('environment')}")
+
+    for fn in selected.values():
+        fn()  # warm-up: import lazy, cache regex, dll
+    results = measure(
+        {CALIBRATION: calibration_loop, **selected}, args.repeat, args.min_time
+    )
+
+    print(f"{'case':<28}{'best':>12}{'median':>12}{'relative':>10}  vs baseline")
+    regressed = []
+    for name, result in results.items():
+        if name == CALIBRATION:
+            delta, verdict = "-", None
+        else:
+            delta, verdict = compare(name, result, baseline, args.threshold)
+        if verdict == "regresi":
+            regressed.append(name)
+        print(
+            f"{name:<28}{result['best_ns'] / 1000:>10.2f}µs{result['median_ns'] / 1000:>10.2f}µs"
+            f"{result['relative']:>10.3f}  {delta if baseline else '-'}",
+            flush=True,
+        )
+
+    if args.save:
+        if filters and os.path.exists(args.baseline):
+            # --only + --save → perbarui sebagian case saja
+            with open(args.baseline) as f:
+                results = {**json.load(f)["results"], **results}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"💾 baseline disimpan ke {os.path.relpath(args.baseline, ROOT)}")
+    elif regressed:
+        print(f"❌ regresi > {args.threshold:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# 📍 benchmarks/preload.py
+"""
+Bandingkan gunicorn tanpa & dengan PRELOAD_APP=1 (lib/preload.py):
+  - ready      : detik dari start gunicorn sampai semua worker menjawab
+  - boot       : fork/exec worker → lifespan siap (median per worker)
+  - RSS / PSS  : per worker (median) dari /proc/<pid>/smaps_rollup; PSS membagi
+                 halaman copy-on-write rata ke proses yang berbagi, jadi total PSS
+                 (master + semua worker) = memori nyata yang dipakai server
+  - private    : halaman milik worker sendiri (yang tidak dibagi dengan master)
+
+Upstream diarahkan ke stand-in lokal (benchmarks/stand_ins.py) supaya warm-up
+lifespan tidak keluar ke jaringan.
+
+Jalankan:
+    python benchmarks/preload.py
+    python benchmarks/preload.py --workers 8 --env CHAIN_FAMILIES_DISABLED=trx
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.run import SECRET, free_port  # noqa: E402
+from benchmarks.stand_ins import StandIns  # noqa: E402
+
+MODES = {"tanpa preload": "0", "preload": "1"}
+
+
+def memory_kb(pid: int) -> dict:
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                    fields[name] = int(value.split()[0])
+    except OSError:
+        return {"Rss": 0, "Pss": 0, "Private": 0}
+    fields["Private"] = fields.pop("Private_Clean", 0) + fields.pop("Private_Dirty", 0)
+    return fields
+
+
+def start_gunicorn(urls: dict, port: int, workers: int, preload: str, extra_env: dict):
+    env = {
+        **os.environ,
+        "RAPIDAPI_SECRET": SECRET,
+        "COINGECKO_BASE_URL": urls["coingecko"],
+        "TRONPY_HTTP_PROVIDER_URI": urls["tron"],
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+        "PRELOAD_APP": preload,
+        "WEB_CONCURRENCY": str(workers),
+        "BIND": f"127.0.0.1:{port}",
+        "PROMETHEUS_MULTIPROC_DIR": f"/tmp/crypto-api-metrics-bench-{port}",
+        **extra_env,
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "main:app", "-c", "gunicorn.conf.py"],
+        cwd=ROOT,
+        env=env,
+        stderr=subprocess.DEVNULL if not os.getenv("BENCH_API_LOGS") else None,
+    )
+
+
+def wait_workers(port: int, workers: int, timeout: float) -> dict[int, dict]:
+    """Request dengan koneksi baru sampai semua worker (pid berbeda) menjawab"""
+    seen: dict[int, dict] = {}
+    deadline = time.time() + timeout
+    url = f"http://127.0.0.1:{port}/api/v1/crypto/diagnostics/upstreams"
+    while time.time() < deadline:
+        try:
+            resp = httpx.get(url, headers={"X-RapidAPI-Proxy-Secret": SECRET, "Connection": "close"}, timeout=2)
+            process = resp.json()["process"]
+            if process["boot_ms"] is not None:
+                seen[process["pid"]] = process
+        except (httpx.HTTPError, ValueError, KeyError):
+            time.sleep(0.05)
+        if len(seen) >= workers:
+            return seen
+    raise RuntimeError(f"hanya {len(seen)}/{workers} worker siap dalam {timeout} detik")
+
+
+def measure(urls: dict, workers: int, preload: str, extra_env: dict, timeout: float) -> dict:
+    port = free_port()
+    start = time.perf_counter()
+    proc = start_gunicorn(urls, port, workers, preload, extra_env)
+    try:
+        seen = wait_workers(port, workers, timeout)
+        ready = time.perf_counter() - start
+        time.sleep(1)  # biarkan task lifespan (warm metadata, coin index) jalan dulu
+        worker_memory = {pid: memory_kb(pid) for pid in seen}
+        master_memory = memory_kb(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait(20)
+
+    def median(key):
+        return statistics.median(m[key] for m in worker_memory.values()) / 1024
+
+    return {
+        "ready_s": ready,
+        "boot_ms": statistics.median(p["boot_ms"] for p in seen.values()),
+        "master_warm_ms": next(iter(seen.values()))["master_warm_ms"],
+        "worker_rss_mb": median("Rss"),
+        "worker_pss_mb": median("Pss"),
+        "worker_private_mb": median("Private"),
+        "master_rss_mb": master_memory["Rss"] / 1024,
+        "total_pss_mb": (master_memory["Pss"] + sum(m["Pss"] for m in worker_memory.values())) / 1024,
+        "gc_frozen_objects": next(iter(seen.values()))["gc_frozen_objects"],
+    }
+
+
+HEADER = (
+    f"{'mode':<15}{'ready s':>9}{'boot ms':>9}{'RSS/w':>9}{'PSS/w':>9}"
+    f"{'priv/w':>9}{'master':>9}{'PSS total':>11}{'frozen':>9}"
+)
+
+
+def print_row(name: str, r: dict):
+    print(
+        f"{name:<15}{r['ready_s']:>9.2f}{r['boot_ms']:>9.0f}{r['worker_rss_mb']:>8.1f}M"
+        f"{r['worker_pss_mb']:>8.1f}M{r['worker_private_mb']:>8.1f}M{r['master_rss_mb']:>8.1f}M"
+        f"{r['total_pss_mb']:>10.1f}M{r['gc_frozen_objects']:>9}",
+        flush=True,
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=1, help="ulangi tiap mode, ambil median ready/boot")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--env", action="append", default=[], help="env tambahan untuk API, KEY=VALUE")
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    extra_env = dict(item.split("=", 1) for item in args.env)
+    stand_ins = StandIns()
+    urls = stand_ins.start()
+
+    print(f"{args.workers} worker, env: {extra_env or '-'}")
+    print(HEADER)
+    results = {}
+    for name, preload in MODES.items():
+        runs = [measure(urls, args.workers, preload, extra_env, args.timeout) for _ in range(args.runs)]
+        results[name] = {
+            key: statistics.median(r[key] for r in runs) if key != "master_warm_ms" else runs[0][key]
+            for key in runs[0]
+        }
+        print_row(name, results[name])
+    if results["preload"]["master_warm_ms"] is not None:
+        print(f"🔥 warm-up master (sekali, sebelum fork): {results['preload']['master_warm_ms']}ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"workers": args.workers, "env": extra_env, "results": results}, f, indent=2)
+        print(f"💾 hasil disimpan ke {args.json}")
+
+
+if __name__ == "__main__":
+    main()
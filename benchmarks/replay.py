@@ -0,0 +1,281 @@
+# 📍 benchmarks/replay.py
+"""
+Benchmark deterministik jalur send / balance / tx_status dari cassette (lib/cassette.py).
+
+1. record : API dijalankan dengan CASSETTE_MODE=record terhadap stand-in lokal
+            (atau cassette rekaman produksi, lihat CASSETTE_PATH di README),
+            semua call keluar + latency-nya tersimpan di cassette
+2. replay : API dijalankan dengan CASSETTE_MODE=replay → tidak ada jaringan,
+            response & profil latency diputar ulang (CASSETTE_LATENCY_SCALE)
+
+Laporan replay per skenario: rps, p50/p99, round trip upstream per request
+(dari header Server-Timing) dan CPU proses API per request. Dengan --baseline,
+round trip yang bertambah atau CPU yang naik > --max-cpu-regression → exit 1.
+Angka CPU hanya sebanding di mesin yang sama.
+
+Contoh:
+    python benchmarks/replay.py record --cassette cassettes/bench.jsonl.gz --faults "latency=40,jitter=20"
+    python benchmarks/replay.py replay --cassette cassettes/bench.jsonl.gz --latency-scale 0 --save base.json
+    python benchmarks/replay.py replay --cassette cassettes/bench.jsonl.gz --latency-scale 0 --baseline base.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.run import SECRET, free_port, percentile, scenarios, start_api  # noqa: E402
+from benchmarks.stand_ins import Faults, StandIns, UPSTREAMS  # noqa: E402
+
+DEFAULT_ONLY = "send_,balance_,tx_status_"
+UPSTREAM_TIMING = re.compile(r'upstream;dur=[\d.]+;desc="(\d+) calls"')
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def cpu_seconds(pid: int) -> float | None:
+    """utime + stime proses API (Linux /proc), None kalau tidak tersedia"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rpartition(")")[2].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def select(urls: dict, only: str) -> list:
+    filters = [f for f in only.split(",") if f]
+    return [s for s in scenarios(urls) if any(f in s[0] for f in filters)]
+
+
+async def drive(client, method, path, params, total: int, concurrency: int):
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    calls: list[int] = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                resp = await client.request(method, f"/api/v1/crypto{path}", params=params)
+                status = resp.status_code
+                match = UPSTREAM_TIMING.search(resp.headers.get("server-timing", ""))
+                calls.append(int(match.group(1)) if match else 0)
+            except httpx.HTTPError:
+                status = 0
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, sorted(latencies), statuses, calls
+
+
+def api_client(port: int, args) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}",
+        headers={"X-RapidAPI-Proxy-Secret": SECRET},
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    )
+
+
+# ====================== RECORD ======================
+async def record_traffic(port: int, selected: list, args):
+    async with api_client(port, args) as client:
+        for name, method, path, params in selected:
+            _, _, statuses, calls = await drive(
+                client, method, path, params, args.requests, args.concurrency
+            )
+            print(f"📼 {name:<22} {sum(calls):>6} call upstream  status={statuses}", flush=True)
+
+
+def cmd_record(args):
+    faults = {name: Faults.parse(args.faults) for name in UPSTREAMS}
+    stand_ins = StandIns(faults)
+    urls = stand_ins.start()
+    if os.path.exists(args.cassette):
+        os.remove(args.cassette)
+
+    port = free_port()
+    api = start_api(
+        urls,
+        port,
+        {"CASSETTE_MODE": "record", "CASSETTE_PATH": os.path.abspath(args.cassette)},
+    )
+    try:
+        asyncio.run(record_traffic(port, select(urls, args.only), args))
+    finally:
+        # cassette sudah di-flush per rekaman, aman walau worker langsung mati
+        api.terminate()
+        api.wait(10)
+
+    with open(args.cassette + ".meta.json", "w") as f:
+        json.dump({"urls": urls, "faults": {k: vars(v) for k, v in faults.items()}}, f, indent=2)
+    print(f"💾 cassette: {args.cassette} ({os.path.getsize(args.cassette)} byte)")
+
+
+# ====================== REPLAY ======================
+async def replay_traffic(port: int, pid: int, selected: list, args) -> tuple[list, dict]:
+    results = []
+    async with api_client(port, args) as client:
+        for name, method, path, params in selected:
+            await drive(client, method, path, params, max(1, args.requests // 10), args.concurrency)
+            cpu_before = cpu_seconds(pid)
+            elapsed, latencies, statuses, calls = await drive(
+                client, method, path, params, args.requests, args.concurrency
+            )
+            cpu_after = cpu_seconds(pid)
+            ok = sum(count for status, count in statuses.items() if 200 <= status < 300)
+            result = {
+                "scenario": name,
+                "requests": args.requests,
+                "rps": args.requests / elapsed,
+                "p50_ms": percentile(latencies, 0.50) * 1000,
+                "p99_ms": percentile(latencies, 0.99) * 1000,
+                "ok_ratio": ok / args.requests,
+                "statuses": statuses,
+                "upstream_calls_per_request": sum(calls) / max(1, len(calls)),
+                "cpu_ms_per_request": (
+                    (cpu_after - cpu_before) * 1000 / args.requests
+                    if cpu_before is not None
+                    else None
+                ),
+            }
+            results.append(result)
+            print_row(result)
+
+        resp = await client.get("/api/v1/crypto/diagnostics/upstreams")
+        cassette = resp.json().get("cassette", {})
+    return results, cassette
+
+
+HEADER = f"{'scenario':<22}{'rps':>9}{'p50 ms':>9}{'p99 ms':>9}{'2xx':>7}{'calls/req':>11}{'cpu ms/req':>12}"
+
+
+def print_row(r: dict):
+    cpu = f"{r['cpu_ms_per_request']:.2f}" if r["cpu_ms_per_request"] is not None else "-"
+    print(
+        f"{r['scenario']:<22}{r['rps']:>9.1f}{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+        f"{r['ok_ratio'] * 100:>6.0f}%{r['upstream_calls_per_request']:>11.2f}{cpu:>12}",
+        flush=True,
+    )
+
+
+def regressions(results: list, baseline: list, max_cpu: float) -> list[str]:
+    previous = {r["scenario"]: r for r in baseline}
+    found = []
+    for r in results:
+        old = previous.get(r["scenario"])
+        if old is None:
+            continue
+        if r["upstream_calls_per_request"] > old["upstream_calls_per_request"] + 0.01:
+            found.append(
+                f"{r['scenario']}: round trip {old['upstream_calls_per_request']:.2f} → "
+                f"{r['upstream_calls_per_request']:.2f} per request"
+            )
+        if r["ok_ratio"] < old["ok_ratio"] - 0.01:
+            found.append(f"{r['scenario']}: 2xx {old['ok_ratio']:.0%} → {r['ok_ratio']:.0%}")
+        if r["cpu_ms_per_request"] and old.get("cpu_ms_per_request"):
+            # /proc dihitung per tick (10ms) → selisih di bawah 2 tick per run = noise
+            noise = 2 * 1000 / CLOCK_TICKS / min(r["requests"], old["requests"])
+            limit = max(old["cpu_ms_per_request"] * (1 + max_cpu), old["cpu_ms_per_request"] + noise)
+            if r["cpu_ms_per_request"] > limit:
+                found.append(
+                    f"{r['scenario']}: CPU {old['cpu_ms_per_request']:.2f} → "
+                    f"{r['cpu_ms_per_request']:.2f} ms/request"
+                )
+    return found
+
+
+def cmd_replay(args):
+    if args.urls:
+        urls = json.loads(args.urls)
+    else:
+        with open(args.cassette + ".meta.json") as f:
+            urls = json.load(f)["urls"]
+
+    port = free_port()
+    api = start_api(
+        urls,
+        port,
+        {
+            "CASSETTE_MODE": "replay",
+            "CASSETTE_PATH": os.path.abspath(args.cassette),
+            "CASSETTE_LATENCY_SCALE": str(args.latency_scale),
+        },
+    )
+    print(f"replay: {args.cassette} (latency x{args.latency_scale})")
+    print(HEADER)
+    try:
+        results, cassette = asyncio.run(
+            replay_traffic(port, api.pid, select(urls, args.only), args)
+        )
+    finally:
+        api.terminate()
+        api.wait(10)
+
+    print(
+        "📼 cassette: exact={exact} loose={loose} miss={miss} passthrough={passthrough}".format(
+            **{k: cassette.get(k, 0) for k in ("exact", "loose", "miss", "passthrough")}
+        )
+    )
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"cassette": cassette, "results": results}, f, indent=2)
+        print(f"💾 hasil disimpan ke {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f)["results"], args.max_cpu_regression)
+        for line in found:
+            print(f"❌ {line}")
+        if found:
+            sys.exit(1)
+        print("✅ tidak ada regresi terhadap baseline")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("record", "replay"):
+        p = sub.add_parser(name)
+        p.add_argument("--cassette", default="cassettes/bench.jsonl.gz")
+        p.add_argument("--only", default=DEFAULT_ONLY, help="filter skenario benchmarks/run.py (substring, pisah koma)")
+        p.add_argument("--concurrency", type=int, default=8)
+        p.add_argument("--timeout", type=float, default=60)
+
+    record = sub.choices["record"]
+    record.add_argument("--requests", type=int, default=20, help="request direkam per skenario")
+    record.add_argument("--faults", default="latency=40,jitter=20", help="profil latency/fault stand-in")
+
+    replay = sub.choices["replay"]
+    replay.add_argument("--requests", type=int, default=200, help="request per skenario")
+    replay.add_argument("--latency-scale", type=float, default=1.0, help="1 = latency rekaman, 0 = tanpa jeda")
+    replay.add_argument("--urls", help='JSON {"evm":..,"solana":..,"tron":..,"coingecko":..} (default dari .meta.json)')
+    replay.add_argument("--save", help="simpan hasil ke file JSON (bisa dipakai sebagai baseline)")
+    replay.add_argument("--baseline", help="file hasil --save sebelumnya")
+    replay.add_argument("--max-cpu-regression", type=float, default=0.2, help="toleransi kenaikan CPU (0.2 = 20%%)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "record":
+        cmd_record(args)
+    else:
+        cmd_replay(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+# 📍 benchmarks/run.py
+"""
+Benchmark offline semua route FastAPI terhadap stand-in lokal (benchmarks/stand_ins.py).
+
+- stand-in EVM / Solana / TronGrid / CoinGecko dijalankan di proses ini
+- API dijalankan sebagai subprocess uvicorn (1 worker, lifespan aktif) yang
+  diarahkan ke stand-in lewat env (COINGECKO_BASE_URL, TRONPY_HTTP_PROVIDER_URI,
+  rpc_url di query)
+- tiap skenario: warm-up, lalu N request dengan concurrency tetap
+- laporan: rps, p50/p95/p99, persentase 2xx, upstream call per request
+- di awal: laporan import worker (benchmarks/import_time.py) dengan env yang sama
+
+Contoh:
+    python benchmarks/run.py
+    python benchmarks/run.py --concurrency 32 --requests 2000 --only balance
+    python benchmarks/run.py --faults "latency=40,jitter=20" \\
+        --upstream-faults "coingecko:429=0.05" --json results.json
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.import_time import print_summary, report, summarize  # noqa: E402
+from benchmarks.stand_ins import Faults, StandIns, UPSTREAMS  # noqa: E402
+
+SECRET = "bench-secret"
+ADMIN_TOKEN = "bench-admin"
+
+# 🔑 key & alamat dummy (deterministik, hanya untuk stand-in)
+EVM_KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+EVM_DEST = "0x2222222222222222222222222222222222222222"
+EVM_USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+SOL_KEY = "1GMkH3brNXiNNs1tiFZHu4yZSRrzJwxi5wB9bHFtMikjwpAW9DMZzU2Pqakc5it8X3N5vPmqdN7KF4CCUpmKhq"
+SOL_WALLET = "9C6hybhQ6Aycep9jaUnP6uL9ZYvDjUp1aSkFWPUFJtpj"
+SOL_USDT_MINT = "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB"
+TRX_KEY = "ab" * 32
+TRX_WALLET = "TWbNxh3feKxRTFEDVk3fn9z3EznSuWvWMu"
+TRX_DEST = "TNXDAf1HBaiGkR73n3Y9KhaC9ye1iftqeC"
+TRX_USDT = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+EVM_TX = "0x" + "ab" * 32
+SOL_TX = "99eUso3aSbE9tqGSTXzo3TLfKb9RkMTURrHKQ1K7Zh3BbeqPevr5E1iCbpTjqHuTFLtfxTTD5ekfVuZFzQyEQf8"
+TRX_TX = "cd" * 32
+
+
+def scenarios(urls: dict) -> list[tuple[str, str, str, dict]]:
+    """(nama, method, path, query) — mencakup semua route publik"""
+    evm, sol, tron = urls["evm"], urls["solana"], urls["tron"]
+    return [
+        ("ping", "GET", "/ping", {}),
+        ("tokens", "GET", "/tokens", {}),
+        ("price", "GET", "/price", {"token": "sol"}),
+        ("swap", "POST", "/swap/simulasi", {"from_token": "eth", "to_token": "usdt", "amount": 1}),
+        ("token_info", "GET", "/token_info", {"token": "usdt"}),
+        ("token_info_contract", "GET", "/token_info", {"token": EVM_USDT, "chain": "eth"}),
+        ("estimate_gas", "GET", "/estimate-gas", {"chain": "eth", "token": "eth", "amount": 0.1, "rpc_url": evm}),
+        ("balance_eth", "GET", "/balance", {"chain": "eth", "wallet": EVM_DEST, "rpc_url": evm}),
+        ("balance_sol", "GET", "/balance", {"chain": "sol", "wallet": SOL_WALLET, "rpc_url": sol}),
+        ("balance_trx", "GET", "/balance", {"chain": "trx", "wallet": TRX_WALLET, "rpc_url": tron}),
+        ("tx_status_eth", "GET", "/tx_status", {"chain": "eth", "tx_hash": EVM_TX, "rpc_url": evm}),
+        ("tx_status_sol", "GET", "/tx_status", {"chain": "sol", "tx_hash": SOL_TX, "rpc_url": sol}),
+        ("tx_status_trx", "GET", "/tx_status", {"chain": "trx", "tx_hash": TRX_TX}),
+        ("send_native_eth", "POST", "/send/native",
+         {"token": "eth", "destination_wallet": EVM_DEST, "amount": 0.01, "rpc_url": evm, "private_key": EVM_KEY}),
+        ("send_native_sol", "POST", "/send/native",
+         {"token": "sol", "destination_wallet": SOL_WALLET, "amount": 0.01, "rpc_url": sol, "private_key": SOL_KEY}),
+        ("send_native_trx", "POST", "/send/native",
+         {"token": "trx", "destination_wallet": TRX_DEST, "amount": 1, "rpc_url": tron, "private_key": TRX_KEY}),
+        ("send_usdt_eth", "POST", "/send/usdt",
+         {"chain": "eth", "destination_wallet": EVM_DEST, "amount": 1, "token_address": EVM_USDT,
+          "rpc_url": evm, "private_key": EVM_KEY}),
+        ("send_usdt_sol", "POST", "/send/usdt",
+         {"chain": "sol", "destination_wallet": SOL_WALLET, "amount": 1, "token_address": SOL_USDT_MINT,
+          "rpc_url": sol, "private_key": SOL_KEY}),
+        ("send_usdt_trx", "POST", "/send/usdt",
+         {"chain": "trx", "destination_wallet": TRX_DEST, "amount": 1, "token_address": TRX_USDT,
+          "rpc_url": tron, "private_key": TRX_KEY}),
+        ("send_usdc_eth", "POST", "/send/usdc",
+         {"chain": "eth", "destination_wallet": EVM_DEST, "amount": 1, "token_address": EVM_USDT,
+          "rpc_url": evm, "private_key": EVM_KEY}),
+        # key_alias → signer resident (SIGNER_KEY_BENCH_* di start_api), tanpa derivasi per request
+        ("send_native_sol_alias", "POST", "/send/native",
+         {"token": "sol", "destination_wallet": SOL_WALLET, "amount": 0.01, "rpc_url": sol, "key_alias": "bench_sol"}),
+        ("send_usdt_eth_alias", "POST", "/send/usdt",
+         {"chain": "eth", "destination_wallet": EVM_DEST, "amount": 1, "token_address": EVM_USDT,
+          "rpc_url": evm, "key_alias": "bench_evm"}),
+        ("send_usdt_trx_alias", "POST", "/send/usdt",
+         {"chain": "trx", "destination_wallet": TRX_DEST, "amount": 1, "token_address": TRX_USDT,
+          "rpc_url": tron, "key_alias": "bench_trx"}),
+    ]
+
+
+# ====================== SERVER API ======================
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api(urls: dict, port: int, extra_env: dict) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "RAPIDAPI_SECRET": SECRET,
+        "ADMIN_TOKEN": ADMIN_TOKEN,
+        "COINGECKO_BASE_URL": urls["coingecko"],
+        "TRONPY_HTTP_PROVIDER_URI": urls["tron"],
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+        "SIGNER_KEY_BENCH_EVM": f"evm:{EVM_KEY}",
+        "SIGNER_KEY_BENCH_SOL": f"sol:{SOL_KEY}",
+        "SIGNER_KEY_BENCH_TRX": f"trx:{TRX_KEY}",
+        **extra_env,
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT,
+        env=env,
+        stderr=subprocess.DEVNULL if not os.getenv("BENCH_API_LOGS") else None,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/v1/crypto/ping", timeout=1)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("API tidak bisa start dalam 30 detik")
+
+
+# ====================== LOAD ======================
+def percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def drive(client, method, path, params, total: int, concurrency: int):
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                resp = await client.request(method, f"/api/v1/crypto{path}", params=params)
+                status = resp.status_code
+            except httpx.HTTPError:
+                status = 0
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, sorted(latencies), statuses
+
+
+async def run_scenarios(port, stand_ins, selected, args) -> list[dict]:
+    results = []
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}",
+        # X-Admin-Token: skenario *_alias (key_alias wajib token operator)
+        headers={"X-RapidAPI-Proxy-Secret": SECRET, "X-Admin-Token": ADMIN_TOKEN},
+        timeout=args.timeout,
+        limits=limits,
+    ) as client:
+        for name, method, path, params in selected:
+            total = args.requests_slow if name.startswith("send_") else args.requests
+            await drive(client, method, path, params, max(1, total // 10), args.concurrency)
+            stand_ins.reset_calls()
+            elapsed, latencies, statuses = await drive(
+                client, method, path, params, total, args.concurrency
+            )
+            calls = stand_ins.snapshot_calls()
+            ok = sum(count for status, count in statuses.items() if 200 <= status < 300)
+            results.append(
+                {
+                    "scenario": name,
+                    "requests": total,
+                    "concurrency": args.concurrency,
+                    "rps": total / elapsed,
+                    "p50_ms": percentile(latencies, 0.50) * 1000,
+                    "p95_ms": percentile(latencies, 0.95) * 1000,
+                    "p99_ms": percentile(latencies, 0.99) * 1000,
+                    "ok_ratio": ok / total,
+                    "statuses": statuses,
+                    "upstream_calls_per_request": {
+                        upstream: round(sum(methods.values()) / total, 2)
+                        for upstream, methods in calls.items()
+                    },
+                    "upstream_calls": calls,
+                }
+            )
+            print_row(results[-1])
+    return results
+
+
+# ====================== LAPORAN ======================
+HEADER = f"{'scenario':<22}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'2xx':>7}  upstream calls/req"
+
+
+def print_row(r: dict):
+    upstream = " ".join(f"{k}={v}" for k, v in r["upstream_calls_per_request"].items()) or "-"
+    print(
+        f"{r['scenario']:<22}{r['rps']:>9.1f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+        f"{r['p99_ms']:>9.1f}{r['ok_ratio'] * 100:>6.0f}%  {upstream}",
+        flush=True,
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="request per skenario baca")
+    parser.add_argument("--requests-slow", type=int, default=64, help="request per skenario kirim")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--only", default="", help="filter nama skenario (substring, pisah koma)")
+    parser.add_argument("--faults", default="", help="fault semua upstream, mis. latency=30,jitter=10")
+    parser.add_argument(
+        "--upstream-faults", action="append", default=[],
+        help="fault per upstream, mis. coingecko:429=0.05,latency=200 (boleh berulang)",
+    )
+    parser.add_argument("--env", action="append", default=[], help="env tambahan untuk API, KEY=VALUE")
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    parser.add_argument("--no-import-report", action="store_true", help="lewati laporan waktu import")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    faults = {name: Faults.parse(args.faults) for name in UPSTREAMS}
+    for spec in args.upstream_faults:
+        name, _, rest = spec.partition(":")
+        faults[name] = Faults.parse(",".join(filter(None, [args.faults, rest])))
+
+    stand_ins = StandIns(faults)
+    urls = stand_ins.start()
+    port = free_port()
+    extra_env = dict(item.split("=", 1) for item in args.env)
+    api = start_api(urls, port, extra_env)
+
+    filters = [f for f in args.only.split(",") if f]
+    selected = [s for s in scenarios(urls) if not filters or any(f in s[0] for f in filters)]
+
+    import_report = None
+    if not args.no_import_report:
+        import_report = summarize([report(extra_env, top=5)])
+        print_summary("import main", import_report)
+    print(f"stand-ins: {json.dumps(urls)}")
+    print(f"faults: { {k: vars(v) for k, v in faults.items() if any(vars(v).values())} or 'none'}")
+    print(HEADER)
+    try:
+        results = asyncio.run(run_scenarios(port, stand_ins, selected, args))
+    finally:
+        api.terminate()
+        api.wait(10)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "faults": {k: vars(v) for k, v in faults.items()},
+                    "env": extra_env,
+                    "import": import_report,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"💾 hasil disimpan ke {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,502 @@
+# 📍 benchmarks/stand_ins.py
+"""
+Server stand-in lokal untuk semua upstream (tanpa jaringan):
+  - evm       : JSON-RPC Ethereum/BSC/Polygon/Base (saldo, nonce, gas, eth_call ERC20,
+                sendRawTransaction, receipt) — cukup untuk web3.py kirim & baca
+  - solana    : JSON-RPC Solana (getBalance, getLatestBlockhash, sendTransaction,
+                getTransaction, ATA & saldo SPL)
+  - tron      : HTTP API TronGrid (getaccount, getcontract, trigger*contract,
+                getsignweight, broadcast, gettransactioninfobyid)
+  - coingecko : /simple/price, /coins/{id}, /coins/list
+
+Tiap stand-in punya fault injection sendiri (latency, jitter, error 5xx, 429)
+dan menghitung call per method, supaya runner bisa lapor upstream calls / request.
+
+    stand_ins = StandIns({"evm": Faults(latency_ms=50, jitter_ms=20)})
+    urls = stand_ins.start()        # {"evm": "http://127.0.0.1:xxxx", ...}
+    ...
+    stand_ins.snapshot_calls()      # {"evm": {"eth_getBalance": 120, ...}, ...}
+"""
+import json
+import time
+import base64
+import random
+import asyncio
+import hashlib
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+import base58
+from aiohttp import web
+from eth_utils import keccak
+
+UPSTREAMS = ("evm", "solana", "tron", "coingecko")
+
+# 🔹 saldo besar supaya semua skenario kirim lolos cek saldo
+NATIVE_BALANCE_WEI = 10**24
+TOKEN_BALANCE_RAW = 10**15
+TOKEN_DECIMALS = 6
+SOL_LAMPORTS = 10**15
+TRX_SUN = 10**15
+
+ERC20_DECIMALS = "0x313ce567"
+ERC20_BALANCE_OF = "0x70a08231"
+
+TRC20_ABI_ENTRYS = [
+    {
+        "constant": True,
+        "name": "decimals",
+        "outputs": [{"type": "uint8"}],
+        "type": "Function",
+        "stateMutability": "View",
+    },
+    {
+        "constant": True,
+        "inputs": [{"name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"type": "uint256"}],
+        "type": "Function",
+        "stateMutability": "View",
+    },
+    {
+        "inputs": [
+            {"name": "recipient", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "name": "transfer",
+        "outputs": [{"type": "bool"}],
+        "type": "Function",
+        "stateMutability": "Nonpayable",
+    },
+]
+
+COINGECKO_PRICES = {
+    "bitcoin": {"usd": 65000.0, "idr": 1_050_000_000.0},
+    "ethereum": {"usd": 3200.0, "idr": 52_000_000.0},
+    "binancecoin": {"usd": 580.0, "idr": 9_400_000.0},
+    "solana": {"usd": 150.0, "idr": 2_450_000.0},
+    "tron": {"usd": 0.12, "idr": 1_950.0},
+    "tether": {"usd": 1.0, "idr": 16_250.0},
+    "usd-coin": {"usd": 1.0, "idr": 16_250.0},
+    "matic-network": {"usd": 0.7, "idr": 11_400.0},
+}
+COINGECKO_COINS = [
+    {
+        "id": "tether",
+        "symbol": "usdt",
+        "name": "Tether",
+        "platforms": {
+            "ethereum": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+            "binance-smart-chain": "0x55d398326f99059ff775485246999027b3197955",
+            "tron": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+            "solana": "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",
+        },
+    },
+    {
+        "id": "usd-coin",
+        "symbol": "usdc",
+        "name": "USDC",
+        "platforms": {"ethereum": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"},
+    },
+    {"id": "ethereum", "symbol": "eth", "name": "Ethereum", "platforms": {}},
+    {"id": "solana", "symbol": "sol", "name": "Solana", "platforms": {}},
+    {"id": "tron", "symbol": "trx", "name": "TRON", "platforms": {}},
+    {"id": "binancecoin", "symbol": "bnb", "name": "BNB", "platforms": {}},
+    {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin", "platforms": {}},
+]
+
+
+@dataclass
+class Faults:
+    """Perilaku upstream: latency dasar + jitter (ms), peluang 5xx dan 429"""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_429: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Faults":
+        """'latency=50,jitter=20,errors=0.01,429=0.02' → Faults"""
+        keys = {"latency": "latency_ms", "jitter": "jitter_ms", "errors": "error_rate", "429": "rate_429"}
+        values = {}
+        for item in filter(None, spec.split(",")):
+            key, _, value = item.partition("=")
+            values[keys[key.strip()]] = float(value)
+        return cls(**values)
+
+
+def _hex(value: int) -> str:
+    return hex(value)
+
+
+def _word(value: int) -> str:
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+def _fake_hash(*parts) -> str:
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+# ====================== EVM JSON-RPC ======================
+def evm_result(method: str, params: list, chain_id: int = 1):
+    if method == "eth_chainId":
+        return _hex(chain_id)
+    if method == "net_version":
+        return str(chain_id)
+    if method == "eth_blockNumber":
+        return _hex(19_000_000)
+    if method == "eth_getBalance":
+        return _hex(NATIVE_BALANCE_WEI)
+    if method == "eth_gasPrice":
+        return _hex(20 * 10**9)
+    if method == "eth_maxPriorityFeePerGas":
+        return _hex(10**9)
+    if method == "eth_getTransactionCount":
+        return _hex(7)
+    if method == "eth_estimateGas":
+        return _hex(60_000)
+    if method == "eth_call":
+        data = (params[0].get("data") or params[0].get("input") or "")[:10]
+        if data == ERC20_DECIMALS:
+            return _word(TOKEN_DECIMALS)
+        if data == ERC20_BALANCE_OF:
+            return _word(TOKEN_BALANCE_RAW)
+        return _word(0)
+    if method == "eth_sendRawTransaction":
+        return "0x" + keccak(bytes.fromhex(params[0][2:])).hex()
+    if method == "eth_getTransactionReceipt":
+        return {
+            "transactionHash": params[0],
+            "transactionIndex": "0x0",
+            "blockHash": "0x" + "ab" * 32,
+            "blockNumber": _hex(19_000_000),
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "cumulativeGasUsed": _hex(21_000),
+            "gasUsed": _hex(21_000),
+            "effectiveGasPrice": _hex(20 * 10**9),
+            "contractAddress": None,
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": "0x1",
+            "type": "0x0",
+        }
+    if method == "eth_getTransactionByHash":
+        return {
+            "hash": params[0],
+            "blockHash": "0x" + "ab" * 32,
+            "blockNumber": _hex(19_000_000),
+            "transactionIndex": "0x0",
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "value": _hex(10**17),
+            "gas": _hex(21_000),
+            "gasPrice": _hex(20 * 10**9),
+            "nonce": "0x7",
+            "input": "0x",
+            "type": "0x0",
+            "chainId": _hex(chain_id),
+            "v": "0x25",
+            "r": "0x" + "01" * 32,
+            "s": "0x" + "02" * 32,
+        }
+    if method == "eth_getBlockByNumber":
+        return {
+            "number": _hex(19_000_000),
+            "hash": "0x" + "ab" * 32,
+            "parentHash": "0x" + "aa" * 32,
+            "baseFeePerGas": _hex(10 * 10**9),
+            "timestamp": _hex(int(time.time())),
+            "gasLimit": _hex(30_000_000),
+            "gasUsed": _hex(15_000_000),
+            "transactions": [],
+        }
+    if method == "web3_clientVersion":
+        return "stand-in/1.0"
+    raise KeyError(method)
+
+
+# ====================== SOLANA JSON-RPC ======================
+def _context(value) -> dict:
+    return {"context": {"slot": 250_000_000, "apiVersion": "1.18.0"}, "value": value}
+
+
+def _first_signature(raw_b64: str) -> str:
+    raw = base64.b64decode(raw_b64)
+    # compact-u16 jumlah signature (< 128 → 1 byte), lalu signature 64 byte
+    return base58.b58encode(raw[1:65]).decode()
+
+
+def solana_result(method: str, params: list):
+    if method == "getBalance":
+        return _context(SOL_LAMPORTS)
+    if method == "getLatestBlockhash":
+        blockhash = base58.b58encode(hashlib.sha256(str(time.time()).encode()).digest()).decode()
+        return _context({"blockhash": blockhash, "lastValidBlockHeight": 230_000_000})
+    if method == "sendTransaction":
+        return _first_signature(params[0])
+    if method == "getAccountInfo":
+        return _context(
+            {
+                "data": ["", "base64"],
+                "executable": False,
+                "lamports": 2_039_280,
+                "owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+                "rentEpoch": 0,
+                "space": 165,
+            }
+        )
+    if method == "getTokenAccountBalance":
+        amount = TOKEN_BALANCE_RAW
+        return _context(
+            {
+                "amount": str(amount),
+                "decimals": TOKEN_DECIMALS,
+                "uiAmount": amount / 10**TOKEN_DECIMALS,
+                "uiAmountString": str(amount / 10**TOKEN_DECIMALS),
+            }
+        )
+    if method == "getTransaction":
+        return {
+            "slot": 250_000_000,
+            "blockTime": int(time.time()),
+            "transaction": {
+                "signatures": [params[0]],
+                "message": {
+                    "accountKeys": ["11111111111111111111111111111111"],
+                    "header": {
+                        "numRequiredSignatures": 1,
+                        "numReadonlySignedAccounts": 0,
+                        "numReadonlyUnsignedAccounts": 0,
+                    },
+                    "recentBlockhash": "11111111111111111111111111111111",
+                    "instructions": [],
+                },
+            },
+            "meta": {
+                "err": None,
+                "fee": 5000,
+                "preBalances": [SOL_LAMPORTS],
+                "postBalances": [SOL_LAMPORTS - 5000],
+                "innerInstructions": [],
+                "logMessages": [],
+                "preTokenBalances": [],
+                "postTokenBalances": [],
+                "rewards": [],
+                "status": {"Ok": None},
+            },
+        }
+    if method == "getSignatureStatuses":
+        return _context(
+            [
+                {"slot": 250_000_000, "confirmations": None, "err": None,
+                 "confirmationStatus": "finalized", "status": {"Ok": None}}
+                for _ in params[0]
+            ]
+        )
+    if method == "getSlot":
+        return 250_000_000
+    if method == "getHealth":
+        return "ok"
+    if method == "getVersion":
+        return {"solana-core": "1.18.0", "feature-set": 1}
+    raise KeyError(method)
+
+
+# ====================== TRONGRID HTTP ======================
+def tron_result(method: str, body: dict):
+    if method == "wallet/getnodeinfo":
+        block_id = "0000000003d09000" + "ab" * 24
+        return {"block": f"Num:64000000,ID:{block_id}", "solidityBlock": f"Num:64000000,ID:{block_id}"}
+    if method == "wallet/getaccount":
+        return {"address": body.get("address"), "balance": TRX_SUN}
+    if method == "wallet/getcontract":
+        return {
+            "contract_address": body.get("value"),
+            "name": "TetherToken",
+            "abi": {"entrys": TRC20_ABI_ENTRYS},
+            "bytecode": "",
+        }
+    if method == "wallet/triggerconstantcontract":
+        selector = body.get("function_selector", "")
+        value = TOKEN_DECIMALS if selector.startswith("decimals") else TOKEN_BALANCE_RAW
+        return {"result": {"result": True}, "constant_result": [value.to_bytes(32, "big").hex()]}
+    if method == "wallet/triggersmartcontract":
+        raw = {"contract": [], "timestamp": int(time.time() * 1000)}
+        return {
+            "result": {"result": True},
+            "transaction": {"txID": _fake_hash(body, time.time()), "raw_data": raw},
+        }
+    if method == "wallet/getsignweight":
+        return {"transaction": {"transaction": {"txID": _fake_hash(body.get("raw_data"))}}}
+    if method == "wallet/broadcasttransaction":
+        return {"result": True, "txid": body.get("txID")}
+    if method in ("wallet/gettransactioninfobyid", "walletsolidity/gettransactioninfobyid"):
+        return {
+            "id": body.get("value"),
+            "fee": 345_000,
+            "blockNumber": 64_000_000,
+            "blockTimeStamp": int(time.time() * 1000),
+            "contractResult": [""],
+            "receipt": {"result": "SUCCESS", "net_usage": 345},
+            "log": [],
+        }
+    if method == "wallet/getchainparameters":
+        return {"chainParameter": [{"key": "getEnergyFee", "value": 420}]}
+    raise KeyError(method)
+
+
+# ====================== COINGECKO ======================
+def coingecko_result(path: str, query) -> dict | list:
+    if path == "/simple/price":
+        ids = query.get("ids", "").split(",")
+        currencies = query.get("vs_currencies", "usd").split(",")
+        return {
+            coin_id: {c: COINGECKO_PRICES[coin_id][c] for c in currencies if c in COINGECKO_PRICES[coin_id]}
+            for coin_id in ids
+            if coin_id in COINGECKO_PRICES
+        }
+    if path == "/coins/list":
+        return COINGECKO_COINS
+    if path.startswith("/coins/"):
+        coin_id = path.split("/")[2]
+        coin = next((c for c in COINGECKO_COINS if c["id"] == coin_id), None)
+        if coin is None:
+            raise LookupError(coin_id)
+        return {
+            "id": coin["id"],
+            "symbol": coin["symbol"],
+            "name": coin["name"],
+            "detail_platforms": {
+                platform: {"decimal_place": TOKEN_DECIMALS, "contract_address": address}
+                for platform, address in coin["platforms"].items()
+            },
+            # dokumen asli besar; isi padding supaya streaming parser ikut teruji
+            "description": {"en": "x" * 20_000},
+            "market_data": {"current_price": COINGECKO_PRICES.get(coin_id, {})},
+        }
+    raise KeyError(path)
+
+
+# ====================== SERVER ======================
+class StandIns:
+    """Jalankan semua stand-in di satu event loop, di thread sendiri"""
+
+    def __init__(self, faults: dict[str, Faults] | None = None, host: str = "127.0.0.1"):
+        self.faults = {name: Faults() for name in UPSTREAMS}
+        self.faults.update(faults or {})
+        self.host = host
+        self.calls = {name: Counter() for name in UPSTREAMS}
+        self.urls: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # 🔹 fault injection: latency/jitter dulu, lalu 429 / 5xx
+    async def _inject(self, name: str, method: str):
+        with self._lock:
+            self.calls[name][method] += 1
+        faults = self.faults[name]
+        delay = faults.latency_ms + random.uniform(-faults.jitter_ms, faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = random.random()
+        if roll < faults.rate_429:
+            return web.json_response({"error": "Too Many Requests"}, status=429)
+        if roll < faults.rate_429 + faults.error_rate:
+            return web.json_response({"error": "stand-in error"}, status=503)
+        return None
+
+    async def _json_rpc(self, name: str, resolve, request: web.Request):
+        payload = await request.json()
+        batch = isinstance(payload, list)
+        calls = payload if batch else [payload]
+        for call in calls:
+            failure = await self._inject(name, call["method"])
+            if failure is not None:
+                return failure
+        responses = []
+        for call in calls:
+            try:
+                result = resolve(call["method"], call.get("params") or [])
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": result})
+            except KeyError:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": call["id"],
+                     "error": {"code": -32601, "message": f"method {call['method']} not supported"}}
+                )
+        return web.json_response(responses if batch else responses[0])
+
+    async def _evm(self, request: web.Request):
+        return await self._json_rpc("evm", evm_result, request)
+
+    async def _solana(self, request: web.Request):
+        return await self._json_rpc("solana", solana_result, request)
+
+    async def _tron(self, request: web.Request):
+        method = request.match_info["method"]
+        failure = await self._inject("tron", method)
+        if failure is not None:
+            return failure
+        body = await request.json() if request.can_read_body else {}
+        try:
+            return web.json_response(tron_result(method, body))
+        except KeyError:
+            return web.json_response({"Error": f"{method} not supported"})
+
+    async def _coingecko(self, request: web.Request):
+        path = "/" + request.match_info["path"]
+        label = "/coins/{id}" if path.startswith("/coins/") and path != "/coins/list" else path
+        failure = await self._inject("coingecko", label)
+        if failure is not None:
+            return failure
+        try:
+            return web.json_response(coingecko_result(path, request.query))
+        except LookupError:
+            return web.json_response({"error": "coin not found"}, status=404)
+
+    def _apps(self) -> dict[str, web.Application]:
+        apps = {name: web.Application(client_max_size=4 * 1024**2) for name in UPSTREAMS}
+        apps["evm"].router.add_post("/{tail:.*}", self._evm)
+        apps["solana"].router.add_post("/{tail:.*}", self._solana)
+        apps["tron"].router.add_post("/{method:.+}", self._tron)
+        apps["coingecko"].router.add_get("/api/v3/{path:.+}", self._coingecko)
+        return apps
+
+    def start(self) -> dict[str, str]:
+        ready = threading.Event()
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            for name, app in self._apps().items():
+                runner = web.AppRunner(app, access_log=None)
+                loop.run_until_complete(runner.setup())
+                site = web.TCPSite(runner, self.host, 0)
+                loop.run_until_complete(site.start())
+                port = site._server.sockets[0].getsockname()[1]
+                base = f"http://{self.host}:{port}"
+                self.urls[name] = f"{base}/api/v3" if name == "coingecko" else f"{base}/"
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, name="stand-ins", daemon=True).start()
+        ready.wait(10)
+        return dict(self.urls)
+
+    def reset_calls(self):
+        with self._lock:
+            for counter in self.calls.values():
+                counter.clear()
+
+    def snapshot_calls(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(counter) for name, counter in self.calls.items() if counter}
+
+
+if __name__ == "__main__":
+    # jalankan stand-in saja (misal untuk uvicorn manual)
+    stand_ins = StandIns()
+    print(json.dumps(stand_ins.start(), indent=2))
+    threading.Event().wait()
@@ -0,0 +1,168 @@
+# 📍 benchmarks/tracing_overhead.py
+"""
+Overhead tracing di /price & /balance per konfigurasi exporter + sampling:
+  - none       : TRACING_EXPORTER=none (default, span no-op)
+  - file@1.0   : semua request di-trace, export ke file JSON lines
+  - file@0.1   : 10% request di-trace (default TRACING_SAMPLE_RATIO)
+  - otlp@1.0   : semua request di-trace, POST ke collector OTLP stand-in lokal
+
+Setiap mode jalan di subprocess terpisah (konfigurasi tracing dibaca saat import).
+/balance pakai RPC stand-in lokal → tiap request = span server + check_balance + span RPC.
+
+Jalankan:  python benchmarks/tracing_overhead.py
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+import threading
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+REQUESTS = 2000
+RPC_PORT = 18646
+COLLECTOR_PORT = 18647
+WALLET = "0x" + "1" * 40
+
+MODES = {
+    "none": {"TRACING_EXPORTER": "none"},
+    "file@1.0": {"TRACING_EXPORTER": "file", "TRACING_SAMPLE_RATIO": "1.0"},
+    "file@0.1": {"TRACING_EXPORTER": "file", "TRACING_SAMPLE_RATIO": "0.1"},
+    "otlp@1.0": {
+        "TRACING_EXPORTER": "otlp",
+        "TRACING_SAMPLE_RATIO": "1.0",
+        "TRACING_OTLP_ENDPOINT": f"http://127.0.0.1:{COLLECTOR_PORT}/v1/traces",
+    },
+}
+
+
+def start_stand_ins(collected: list):
+    from aiohttp import web
+
+    async def rpc(request):
+        body = await request.json()
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": body["id"], "result": hex(10**18)}
+        )
+
+    async def collector(request):
+        payload = await request.json()
+        for resource in payload["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                collected.append(len(scope["spans"]))
+        return web.json_response({})
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        for port, path, handler in (
+            (RPC_PORT, "/", rpc),
+            (COLLECTOR_PORT, "/v1/traces", collector),
+        ):
+            app = web.Application()
+            app.router.add_post(path, handler)
+            runner = web.AppRunner(app, access_log=None)
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    time.sleep(0.3)
+
+
+async def requests_per_second(client, url: str, headers: dict) -> float:
+    for _ in range(100):
+        await client.get(url, headers=headers)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        resp = await client.get(url, headers=headers)
+    elapsed = time.perf_counter() - start
+    assert resp.status_code == 200, resp.text
+    return REQUESTS / elapsed
+
+
+def count_spans(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    total = 0
+    with open(path) as f:
+        for line in f:
+            for resource in json.loads(line)["resourceSpans"]:
+                for scope in resource["scopeSpans"]:
+                    total += len(scope["spans"])
+    return total
+
+
+def run_mode():
+    import httpx
+    import main
+    from lib import price_store, tracing
+
+    collected: list[int] = []
+    price_store._prices["solana"] = {"idr": 2_500_000, "usd": 150, "fetched_at": time.time()}
+    start_stand_ins(collected)
+    headers = {"X-RapidAPI-Proxy-Secret": main.RAPIDAPI_SECRET or ""}
+
+    async def bench():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return {
+                "/price": await requests_per_second(
+                    client, "/api/v1/crypto/price?token=sol", headers
+                ),
+                "/balance": await requests_per_second(
+                    client,
+                    f"/api/v1/crypto/balance?chain=eth&wallet={WALLET}"
+                    f"&rpc_url=http://127.0.0.1:{RPC_PORT}",
+                    headers,
+                ),
+            }
+
+    result = asyncio.run(bench())
+    if tracing._processor:
+        tracing._processor.flush()
+    result["spans"] = count_spans(tracing.TRACING_FILE_PATH) + sum(collected)
+    print(json.dumps(result))
+
+
+def main():
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, env in MODES.items():
+            trace_path = os.path.join(tmp, f"{mode}.jsonl")
+            out = subprocess.run(
+                [sys.executable, __file__, "run"],
+                cwd=ROOT,
+                env={
+                    **os.environ,
+                    **env,
+                    "TRACING_FILE_PATH": trace_path,
+                    "LOG_LEVEL": "WARNING",
+                },
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                text=True,
+            ).stdout
+            results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    base = results["none"]
+    print(f"{'mode':<10}{'/price rps':>12}{'Δ':>8}{'/balance rps':>14}{'Δ':>8}{'spans':>9}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<10}{r['/price']:>12.0f}"
+            f"{(r['/price'] / base['/price'] - 1) * 100:>7.1f}%"
+            f"{r['/balance']:>14.0f}"
+            f"{(r['/balance'] / base['/balance'] - 1) * 100:>7.1f}%"
+            f"{r['spans']:>9,}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_mode()
+    else:
+        main()
@@ -0,0 +1,58 @@
+# 📍 gunicorn.conf.py
+import os
+import shutil
+
+# ====================== SERVER ======================
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# ====================== PRELOAD ======================
+# PRELOAD_APP=1 → master import main + warm-up (SDK chain aktif, ABI codec,
+# registry token, aset OpenAPI) lalu gc.freeze() sebelum fork; worker berbagi
+# semua itu lewat copy-on-write dan hanya membuat ulang thread + client (post_fork)
+preload_app = os.getenv("PRELOAD_APP", "0") == "1"
+
+# ====================== METRICS MULTIPROCESS ======================
+# 🔥 Harus diset sebelum worker import prometheus_client, supaya /metrics
+# menggabungkan nilai dari semua worker (bukan cuma worker yang kebetulan di-scrape)
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/crypto-api-metrics"
+)
+
+
+def _reset_metrics_dir():
+    # bersihkan sisa file metrik dari run sebelumnya
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+# preload → master sudah membuat metrik (file .db) sebelum on_starting dipanggil
+if preload_app:
+    _reset_metrics_dir()
+
+
+def on_starting(server):
+    if not preload_app:
+        _reset_metrics_dir()
+
+
+def when_ready(server):
+    if preload_app:
+        from lib.preload import warm_master
+
+        warm_master()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from lib.preload import after_fork
+
+        after_fork()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    # gauge livesum worker yang mati tidak ikut dihitung lagi
+    multiprocess.mark_process_dead(worker.pid)
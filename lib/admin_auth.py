@@ -0,0 +1,23 @@
+# 📍 lib/admin_auth.py
+import os
+import hmac
+
+# ====================== KONFIGURASI ======================
+# Credential operator, terpisah dari secret RapidAPI (secret itu ikut di request
+# semua subscriber). Wajib untuk fitur yang menyentuh proses / kunci server:
+# /debug/profile dan key_alias di /send/*.
+#   ADMIN_TOKEN : dikirim lewat header X-Admin-Token. Kosong → fitur admin mati.
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+ADMIN_HEADER = "x-admin-token"
+
+
+def admin_enabled() -> bool:
+    return bool(ADMIN_TOKEN)
+
+
+def is_admin(headers) -> bool:
+    """Header X-Admin-Token cocok dengan ADMIN_TOKEN (compare_digest, tidak bocor lewat timing)"""
+    if not ADMIN_TOKEN:
+        return False
+    token = headers.get(ADMIN_HEADER) or ""
+    return hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
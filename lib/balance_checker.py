@@ -1,74 +1,64 @@
 # 📍 lib/balance_checker.py
 import logging
-from web3 import Web3
-from tronpy import Tron
-from tronpy.providers import HTTPProvider
-from solana.rpc.api import Client
-from solders.pubkey import Pubkey
-import asyncio
+from lib.chains import require_chain
+from lib.rpc_pool import (
+    get_async_web3,
+    get_async_tron_client,
+    get_async_solana_client,
+)
+from lib.hedging import hedged_read
+from lib.tracing import current_span, traced
 
 logger = logging.getLogger(__name__)
 
+# SDK (web3 / solders) di-import di dalam fungsi per chain: worker tidak memuat
+# SDK chain yang tidak pernah diminta (lihat lib/chains.py)
 
-# ===================== ETH / BSC / BNB =====================
-def get_eth_bsc_balance(rpc_url: str, wallet: str) -> float:
-    if not rpc_url:
-        logger.error("❌ RPC tidak diberikan")
-        return 0.0
-    try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        balance_wei = w3.eth.get_balance(wallet)
-        balance = Web3.from_wei(balance_wei, "ether")
-        logger.info(f"💰 Balance untuk {wallet}: {balance}")
-        return float(balance)
-    except Exception as e:
-        logger.error(f"❌ Gagal cek wallet {wallet}: {e}")
-        return 0.0
 
+# ===================== ASYNC FETCH (bisa di-hedge) =====================
+async def fetch_eth_bsc_balance(rpc_url: str, wallet: str) -> float:
+    w3 = get_async_web3(rpc_url)
+    balance_wei = await w3.eth.get_balance(wallet)
+    return float(w3.from_wei(balance_wei, "ether"))
 
-# ===================== SOLANA =====================
-def get_solana_balance(rpc_url: str, wallet: str) -> float:
-    if not rpc_url:
-        logger.error("❌ RPC tidak diberikan")
-        return 0.0
-    try:
-        client = Client(rpc_url)
-        pubkey = Pubkey.from_string(wallet)
-        resp = client.get_balance(pubkey)
-        lamports = resp.value
-        sol = lamports / 1_000_000_000
-        logger.info(f"💰 SOL balance untuk {wallet}: {sol}")
-        return sol
-    except Exception as e:
-        logger.error(f"❌ Gagal cek SOL wallet {wallet}: {e}", exc_info=True)
-        return 0.0
 
+async def fetch_solana_balance(rpc_url: str, wallet: str) -> float:
+    from solders.pubkey import Pubkey
 
-# ===================== TRON =====================
-def get_trx_balance(node_url: str, wallet: str) -> float:
-    if not node_url:
-        logger.error("❌ Node URL tidak diberikan")
-        return 0.0
-    try:
-        client = Tron(provider=HTTPProvider(node_url))
-        balance_sun = client.get_account_balance(wallet)
-        balance_trx = balance_sun / 1_000_000
-        logger.info(f"💰 TRX balance untuk {wallet}: {balance_trx}")
-        return balance_trx
-    except Exception as e:
-        logger.error(f"❌ Gagal cek TRX wallet {wallet}: {e}")
-        return 0.0
+    client = get_async_solana_client(rpc_url)
+    resp = await client.get_balance(Pubkey.from_string(wallet))
+    return resp.value / 1_000_000_000
+
+
+async def fetch_trx_balance(rpc_url: str, wallet: str) -> float:
+    # tronpy sudah mengembalikan saldo dalam TRX (bukan SUN)
+    balance = await get_async_tron_client(rpc_url).get_account_balance(wallet)
+    return float(balance)
+
+
+BALANCE_FETCHERS = {
+    "eth": fetch_eth_bsc_balance,
+    "bsc": fetch_eth_bsc_balance,
+    "bnb": fetch_eth_bsc_balance,
+    "sol": fetch_solana_balance,
+    "trx": fetch_trx_balance,
+}
 
 
 # ===================== WRAPPER =====================
-async def check_balance(chain: str, wallet: str, rpc_url: str) -> float:
+@traced("check_balance")
+async def check_balance(chain: str, wallet: str, rpc_url: str | None) -> float:
+    """
+    Saldo wallet. Error RPC (termasuk semua endpoint pool gagal) diteruskan ke
+    caller, bukan dijadikan saldo 0 palsu.
+    """
     chain = chain.lower()
-    if chain in ["eth", "bsc", "bnb"]:
-        return get_eth_bsc_balance(rpc_url, wallet)
-    elif chain == "sol":
-        return await asyncio.to_thread(get_solana_balance, rpc_url, wallet)
-    elif chain == "trx":
-        return get_trx_balance(rpc_url, wallet)
-    else:
-        logger.error(f"❌ Chain {chain} tidak didukung")
-        return 0.0
+    current_span().set_attribute("chain", chain)
+    require_chain(chain)
+    fetch = BALANCE_FETCHERS.get(chain)
+    if not fetch:
+        raise ValueError(f"Chain {chain} tidak didukung")
+    # rpc_url kosong → endpoint pool, dengan hedging kalau pool punya >= 2 URL
+    balance = await hedged_read(chain, lambda url: fetch(url, wallet), rpc_url)
+    logger.info("💰 Balance %s untuk %s: %s", chain.upper(), wallet, balance)
+    return balance
@@ -1,7 +1,9 @@
 # 📍 lib/base_helper.py
 import logging
 from web3 import Web3
-from eth_account import Account
+from lib.signer_registry import as_signer
+from lib.rpc_pool import get_web3
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -9,18 +11,17 @@ logger = logging.getLogger(__name__)
 def get_balance(address: str, rpc_url: str) -> float:
     """Cek saldo BASE (native) dari wallet tertentu menggunakan RPC dari endpoint"""
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("BASE RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
         balance_wei = w3.eth.get_balance(Web3.to_checksum_address(address))
         balance_base = w3.from_wei(balance_wei, "ether")
-        logger.info(f"💰 Saldo {address}: {balance_base} BASE")
+        logger.debug("💰 Saldo %s: %s BASE", address, balance_base)
         return float(balance_base)
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo {address}: {e}", exc_info=True)
         return None
 
 
+@traced("send base", chain="base")
 async def send_base(
     destination_wallet: str,
     amount_base: float,
@@ -33,13 +34,10 @@ async def send_base(
     Lempar exception supaya crypto_sender.py yang handle notif/logging.
     """
     try:
-        if not private_key.startswith("0x"):
-            private_key = "0x" + private_key
-        admin_account = Account.from_key(private_key)
+        # 🔑 Signer resident (key_alias) atau derive dari private_key mentah
+        admin_account = as_signer("evm", private_key).account
 
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("BASE RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
 
         sender_address = admin_account.address
 
@@ -67,7 +65,7 @@ async def send_base(
         # Ambil gas price otomatis dari RPC
         tx_dict["gasPrice"] = w3.eth.gas_price
 
-        signed_tx = w3.eth.account.sign_transaction(tx_dict, private_key)
+        signed_tx = admin_account.sign_transaction(tx_dict)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         logger.info(
             f"✅ Kirim {amount_base} BASE ke {destination_wallet}, tx_hash: {tx_hash.hex()}"
@@ -1,7 +1,9 @@
 # 📍 lib/bnb_helper.py
 import logging
 from web3 import Web3
-from eth_account import Account
+from lib.signer_registry import as_signer
+from lib.rpc_pool import get_web3
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -9,18 +11,17 @@ logger = logging.getLogger(__name__)
 def get_balance(address: str, rpc_url: str) -> float:
     """Cek saldo BNB dari wallet tertentu, user input RPC URL"""
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("BSC RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
         balance_wei = w3.eth.get_balance(Web3.to_checksum_address(address))
         balance_bnb = w3.from_wei(balance_wei, "ether")
-        logger.info(f"💰 Saldo {address}: {balance_bnb} BNB")
+        logger.debug("💰 Saldo %s: %s BNB", address, balance_bnb)
         return float(balance_bnb)
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo {address}: {e}", exc_info=True)
         return None
 
 
+@traced("send bnb", chain="bsc")
 async def send_bnb(
     destination_wallet: str,
     amount_bnb: float,
@@ -29,13 +30,10 @@ async def send_bnb(
 ):
     """Kirim BNB ke wallet tujuan, gas fee dan gas limit otomatis dari RPC"""
     try:
-        if not private_key.startswith("0x"):
-            private_key = "0x" + private_key
-        admin_account = Account.from_key(private_key)
+        # 🔑 Signer resident (key_alias) atau derive dari private_key mentah
+        admin_account = as_signer("evm", private_key).account
 
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("BSC RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
 
         sender_address = admin_account.address
 
@@ -66,7 +64,7 @@ async def send_bnb(
         # Gas price otomatis dari RPC
         tx_dict["gasPrice"] = w3.eth.gas_price
 
-        signed_tx = w3.eth.account.sign_transaction(tx_dict, private_key)
+        signed_tx = admin_account.sign_transaction(tx_dict)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         tx_hash_hex = tx_hash.hex()
 
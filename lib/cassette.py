@@ -0,0 +1,580 @@
+# 📍 lib/cassette.py
+import os
+import json
+import gzip
+import glob
+import time
+import atexit
+import base64
+import asyncio
+import hashlib
+import re
+import logging
+import threading
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Record / replay semua call HTTP keluar di level transport:
+# - requests  (web3 HTTPProvider, tronpy HTTPProvider)
+# - httpx     (solana.rpc sync & async, tronpy AsyncHTTPProvider, estimate-gas)
+# - aiohttp   (web3 AsyncHTTPProvider, CoinGecko)
+# CASSETTE_MODE          : off (default) | record | replay
+# CASSETTE_PATH          : file JSON Lines (akhiran ".gz" → gzip). "{pid}" diganti pid
+#                          worker saat record (gunicorn multi worker); saat replay
+#                          "{pid}" jadi wildcard → semua file worker digabung
+# CASSETTE_LATENCY_SCALE : replay: jeda = latency rekaman × skala (1 = asli, 0 = tanpa jeda)
+# CASSETTE_PASSTHROUGH   : replay: "1" → request yang tidak ada di cassette diteruskan
+#                          ke jaringan (default: gagal seperti connection error)
+MODE = os.getenv("CASSETTE_MODE", "off").lower()
+PATH = os.getenv("CASSETTE_PATH", "cassettes/upstream-{pid}.jsonl.gz")
+LATENCY_SCALE = float(os.getenv("CASSETTE_LATENCY_SCALE", "1"))
+PASSTHROUGH = os.getenv("CASSETTE_PASSTHROUGH", "0") == "1"
+
+# 🔹 header yang ikut disimpan; sisanya (encoding, length, cookie) tidak relevan
+#    karena body disimpan sudah ter-decode
+KEPT_HEADER = "content-type"
+
+_lock = threading.Lock()
+_state = {"installed": False, "file": None}
+_stats = {"recorded": 0, "exact": 0, "loose": 0, "miss": 0, "passthrough": 0}
+# replay: key → daftar rekaman + kursor (diputar ulang kalau habis)
+_exact: dict[str, list[dict]] = {}
+_loose: dict[str, list[dict]] = {}
+_cursors: dict[str, int] = {}
+_missed: set[str] = set()
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+# ====================== KEY REQUEST ======================
+# URL di pesan error (requests / httpx / aiohttp menyertakan URL lengkap)
+_URL_PATTERN = re.compile(r"(https?://)(?:[^@/\s'\"]*@)?([^/?#\s'\"]+)([^\s'\"]*)")
+# urllib3: "Max retries exceeded with url: /v3/<key> (...)" → hanya path
+_URL_PATH_PATTERN = re.compile(r"(with url: )(/[^\s'\"]*)")
+
+
+def _redact_path(path: str) -> str:
+    """
+    Path + query URL bisa berisi API key (Infura /v3/<key>, Alchemy /v2/<key>,
+    ?api_key=) → yang masuk cassette / log hanya hash-nya
+    """
+    if path in ("", "/"):
+        return path
+    return "/~" + hashlib.sha1(path.encode()).hexdigest()[:12]
+
+
+def _redact_url(text: str) -> str:
+    """Semua URL di teks: credential dibuang, path + query diganti hash"""
+    text = _URL_PATTERN.sub(
+        lambda m: m.group(1) + m.group(2) + _redact_path(m.group(3)), text
+    )
+    return _URL_PATH_PATTERN.sub(lambda m: m.group(1) + _redact_path(m.group(2)), text)
+
+
+def _describe(method: str, url: str, body) -> tuple[str, str, object]:
+    """
+    (key exact, key loose, id JSON-RPC request).
+    - exact : method + URL lengkap + body tanpa "id" JSON-RPC
+    - loose : method + host + hash path + nama method RPC → fallback kalau body beda
+              (nonce, timestamp tx TRX, wallet lain), yang penting bentuk traffic-nya.
+              Tersimpan plaintext di cassette & log miss, jadi path di-hash (API key)
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    parts = urlsplit(url)
+    target = parts.netloc + parts.path
+    host = parts.netloc.rpartition("@")[2]
+    payload = None
+    if body:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = None
+
+    ids = None
+    rpc = ""
+    if isinstance(payload, dict):
+        ids = payload.pop("id", None)
+        rpc = str(payload.get("method") or "")
+    elif isinstance(payload, list):
+        calls = [p for p in payload if isinstance(p, dict)]
+        ids = [p.pop("id", None) for p in calls]
+        rpc = ",".join(str(p.get("method") or "") for p in calls)
+
+    loose = f"{method.upper()} {host}{_redact_path(parts.path)} {rpc}".rstrip()
+    if payload is not None:
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    else:
+        canonical = body or b""
+    digest = hashlib.sha1(
+        f"{method.upper()} {target}?{parts.query}\n".encode() + canonical
+    ).hexdigest()[:20]
+    return digest, loose, ids
+
+
+def _with_ids(body: bytes, ids) -> bytes:
+    """Samakan "id" response rekaman dengan id request sekarang (web3/solana cek ini)"""
+    if ids is None or b'"id"' not in body:
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if isinstance(data, dict) and not isinstance(ids, list):
+        data["id"] = ids
+    elif isinstance(data, list) and isinstance(ids, list):
+        for item, request_id in zip(data, ids):
+            if isinstance(item, dict):
+                item["id"] = request_id
+    else:
+        return body
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+# ====================== FILE ======================
+def _open_lines(path: str):
+    return gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path, encoding="utf-8")
+
+
+def load(path: str = PATH) -> int:
+    """Muat cassette untuk replay; "{pid}" = semua file worker"""
+    files = sorted(glob.glob(path.replace("{pid}", "*")))
+    count = 0
+    for name in files:
+        with _open_lines(name) as f:
+            try:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    _exact.setdefault(entry["k"], []).append(entry)
+                    _loose.setdefault(entry["l"], []).append(entry)
+                    count += 1
+            except EOFError:
+                # worker mati sebelum trailer gzip ditulis; isi sampai flush terakhir tetap utuh
+                pass
+    logger.info("📼 Cassette dimuat: %d rekaman dari %d file (%s)", count, len(files), path)
+    return count
+
+
+def _write(entry: dict):
+    line = json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n"
+    with _lock:
+        if _state["file"] is None:
+            path = PATH.replace("{pid}", str(os.getpid()))
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if path.endswith(".gz"):
+                # mode append → tiap restart jadi member gzip baru, tetap bisa dibaca utuh
+                _state["file"] = gzip.open(path, "at", encoding="utf-8")
+            else:
+                _state["file"] = open(path, "a", encoding="utf-8", buffering=1)
+            atexit.register(_close)
+            logger.info("📼 Cassette merekam ke %s", path)
+        _state["file"].write(line)
+        # flush per rekaman: worker bisa mati tanpa atexit (uvicorn re-raise SIGTERM,
+        # gunicorn kill). Flush gzip (Z_SYNC_FLUSH) tetap pakai window yang sama.
+        _state["file"].flush()
+        _stats["recorded"] += 1
+
+
+def _close():
+    with _lock:
+        if _state["file"] is not None:
+            _state["file"].close()
+            _state["file"] = None
+
+
+def _record(exact: str, loose: str, started: float, status=None, content_type=None, body=b"", error=None):
+    entry = {"k": exact, "l": loose, "t": round(time.perf_counter() - started, 4)}
+    if error is not None:
+        entry["e"] = _redact_url(f"{type(error).__name__}: {error}")
+    else:
+        entry["s"] = status
+        if content_type:
+            entry["c"] = content_type
+        try:
+            entry["b"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["b64"] = base64.b64encode(body).decode()
+    _write(entry)
+
+
+# ====================== REPLAY ======================
+def _next(table: dict[str, list[dict]], key: str, cursor_key: str) -> dict | None:
+    entries = table.get(key)
+    if not entries:
+        return None
+    with _lock:
+        index = _cursors.get(cursor_key, 0)
+        _cursors[cursor_key] = index + 1
+    return entries[index % len(entries)]
+
+
+def _lookup(exact: str, loose: str) -> dict | None:
+    """Rekaman berikutnya untuk request ini: exact dulu, lalu loose, None = miss"""
+    entry = _next(_exact, exact, "k:" + exact)
+    if entry is not None:
+        _stats["exact"] += 1
+        return entry
+    entry = _next(_loose, loose, "l:" + loose)
+    if entry is not None:
+        _stats["loose"] += 1
+        return entry
+    if PASSTHROUGH:
+        _stats["passthrough"] += 1
+        return None
+    _stats["miss"] += 1
+    if loose not in _missed:
+        _missed.add(loose)
+        logger.warning("📼 Cassette miss: %s", loose)
+    raise CassetteMiss(f"cassette miss: {loose}")
+
+
+def _body(entry: dict, ids) -> bytes:
+    if "b64" in entry:
+        return base64.b64decode(entry["b64"])
+    return _with_ids(entry.get("b", "").encode("utf-8"), ids)
+
+
+def _delay(entry: dict) -> float:
+    return entry["t"] * LATENCY_SCALE
+
+
+# ====================== REQUESTS ======================
+def _patch_requests():
+    from requests.adapters import HTTPAdapter
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+    from requests.exceptions import RequestException
+    from requests.models import Response
+    from requests.structures import CaseInsensitiveDict
+
+    original = HTTPAdapter.send
+
+    def send(self, request, **kwargs):
+        exact, loose, ids = _describe(request.method, request.url, request.body)
+        if MODE == "replay":
+            try:
+                entry = _lookup(exact, loose)
+            except CassetteMiss as e:
+                raise RequestsConnectionError(str(e), request=request) from e
+            if entry is not None:
+                time.sleep(_delay(entry))
+                if "e" in entry:
+                    raise RequestsConnectionError(entry["e"], request=request)
+                resp = Response()
+                resp.status_code = entry["s"]
+                resp._content = _body(entry, ids)
+                resp.headers = CaseInsensitiveDict({KEPT_HEADER: entry.get("c", "")})
+                resp.encoding = "utf-8"
+                resp.url = request.url
+                resp.request = request
+                resp.connection = self
+                return resp
+            return original(self, request, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            resp = original(self, request, **kwargs)
+        except RequestException as e:
+            _record(exact, loose, started, error=e)
+            raise
+        _record(exact, loose, started, resp.status_code, resp.headers.get(KEPT_HEADER), resp.content)
+        return resp
+
+    HTTPAdapter.send = send
+
+
+# ====================== HTTPX ======================
+def _patch_httpx():
+    import httpx
+
+    original_sync = httpx.HTTPTransport.handle_request
+    original_async = httpx.AsyncHTTPTransport.handle_async_request
+
+    def replayed(request, entry, ids) -> httpx.Response:
+        if "e" in entry:
+            raise httpx.ConnectError(entry["e"], request=request)
+        return httpx.Response(
+            entry["s"],
+            headers={KEPT_HEADER: entry.get("c", "")},
+            content=_body(entry, ids),
+            request=request,
+        )
+
+    def recorded(resp: httpx.Response, body: bytes) -> httpx.Response:
+        # body sudah ter-decode → header encoding/length lama tidak berlaku lagi
+        headers = [
+            (k, v)
+            for k, v in resp.headers.multi_items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            resp.status_code, headers=headers, content=body, extensions=resp.extensions
+        )
+
+    def handle_request(self, request):
+        exact, loose, ids = _describe(request.method, str(request.url), request.read())
+        if MODE == "replay":
+            try:
+                entry = _lookup(exact, loose)
+            except CassetteMiss as e:
+                raise httpx.ConnectError(str(e), request=request) from e
+            if entry is not None:
+                time.sleep(_delay(entry))
+                return replayed(request, entry, ids)
+            return original_sync(self, request)
+
+        started = time.perf_counter()
+        try:
+            resp = original_sync(self, request)
+            body = resp.read()
+        except httpx.HTTPError as e:
+            _record(exact, loose, started, error=e)
+            raise
+        _record(exact, loose, started, resp.status_code, resp.headers.get(KEPT_HEADER), body)
+        return recorded(resp, body)
+
+    async def handle_async_request(self, request):
+        exact, loose, ids = _describe(request.method, str(request.url), await request.aread())
+        if MODE == "replay":
+            try:
+                entry = _lookup(exact, loose)
+            except CassetteMiss as e:
+                raise httpx.ConnectError(str(e), request=request) from e
+            if entry is not None:
+                await asyncio.sleep(_delay(entry))
+                return replayed(request, entry, ids)
+            return await original_async(self, request)
+
+        started = time.perf_counter()
+        try:
+            resp = await original_async(self, request)
+            body = await resp.aread()
+        except httpx.HTTPError as e:
+            _record(exact, loose, started, error=e)
+            raise
+        _record(exact, loose, started, resp.status_code, resp.headers.get(KEPT_HEADER), body)
+        return recorded(resp, body)
+
+    httpx.HTTPTransport.handle_request = handle_request
+    httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+
+
+# ====================== AIOHTTP ======================
+class _ReplayedStream:
+    """Pengganti StreamReader (resp.content) dari body rekaman"""
+
+    def __init__(self, body: bytes):
+        self._body = body
+        self._offset = 0
+
+    def at_eof(self) -> bool:
+        return self._offset >= len(self._body)
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._body) if n < 0 else self._offset + n
+        data = self._body[self._offset:end]
+        self._offset += len(data)
+        return data
+
+    async def readany(self) -> bytes:
+        return await self.read()
+
+    async def iter_chunked(self, n: int):
+        while not self.at_eof():
+            yield await self.read(n)
+
+    async def iter_any(self):
+        while not self.at_eof():
+            yield await self.read()
+
+
+class _RecordingStream:
+    """
+    Tee StreamReader aiohttp: chunk yang dibaca pemanggil ikut dikumpulkan, lalu
+    direkam saat stream habis / response di-release. Pemanggil yang berhenti di
+    tengah (coingecko_get_fields) merekam prefix yang sama dengan yang dia butuhkan.
+    """
+
+    def __init__(self, stream, on_done):
+        self._stream = stream
+        self._chunks: list[bytes] = []
+        self._on_done = on_done
+
+    def _collect(self, data: bytes) -> bytes:
+        self._chunks.append(data)
+        if self._stream.at_eof():
+            self.finish()
+        return data
+
+    def finish(self):
+        if self._on_done is not None:
+            on_done, self._on_done = self._on_done, None
+            on_done(b"".join(self._chunks))
+
+    def at_eof(self) -> bool:
+        return self._stream.at_eof()
+
+    async def read(self, n: int = -1) -> bytes:
+        return self._collect(await self._stream.read(n))
+
+    async def readany(self) -> bytes:
+        return self._collect(await self._stream.readany())
+
+    async def iter_chunked(self, n: int):
+        async for chunk in self._stream.iter_chunked(n):
+            yield self._collect(chunk)
+        self.finish()
+
+    async def iter_any(self):
+        async for chunk in self._stream.iter_any():
+            yield self._collect(chunk)
+        self.finish()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class _ReplayedAiohttpResponse:
+    """Pengganti ClientResponse aiohttp secukupnya untuk web3 & coingecko_get"""
+
+    def __init__(self, method: str, url, status: int, content_type: str, body: bytes):
+        from multidict import CIMultiDict, CIMultiDictProxy
+
+        self.method = method
+        self.url = url
+        self.real_url = url
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = CIMultiDictProxy(CIMultiDict({KEPT_HEADER: content_type}))
+        self.content_type = content_type.split(";")[0].strip()
+        self.history = ()
+        self.content = _ReplayedStream(body)
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or "utf-8", errors)
+
+    async def json(self, *, encoding: str | None = None, loads=json.loads, content_type=None):
+        return loads(self._body.decode(encoding or "utf-8"))
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import aiohttp
+            from multidict import CIMultiDict, CIMultiDictProxy
+
+            info = aiohttp.RequestInfo(
+                self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.url
+            )
+            raise aiohttp.ClientResponseError(
+                info, (), status=self.status, message=self.reason, headers=self.headers
+            )
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def wait_for_close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+def _patch_aiohttp():
+    import aiohttp
+    from yarl import URL
+
+    original = aiohttp.ClientSession._request
+
+    async def _request(self, method, str_or_url, **kwargs):
+        url = URL(str_or_url)
+        if kwargs.get("params"):
+            url = url.extend_query(kwargs["params"])
+        body = kwargs.get("data")
+        if kwargs.get("json") is not None:
+            body = json.dumps(kwargs["json"])
+        elif isinstance(body, dict):
+            body = json.dumps(body, sort_keys=True)
+        exact, loose, ids = _describe(method, str(url), body)
+
+        if MODE == "replay":
+            try:
+                entry = _lookup(exact, loose)
+            except CassetteMiss as e:
+                raise aiohttp.ClientConnectionError(str(e)) from e
+            if entry is not None:
+                await asyncio.sleep(_delay(entry))
+                if "e" in entry:
+                    raise aiohttp.ClientConnectionError(entry["e"])
+                return _ReplayedAiohttpResponse(
+                    method, url, entry["s"], entry.get("c", ""), _body(entry, ids)
+                )
+            return await original(self, method, str_or_url, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            resp = await original(self, method, str_or_url, **kwargs)
+        except aiohttp.ClientError as e:
+            _record(exact, loose, started, error=e)
+            raise
+        # body tidak dibaca di sini: read()/json() maupun content.iter_chunked()
+        # pemanggil lewat tee, rekaman ditulis begitu stream habis / di-release
+        content_type = resp.headers.get(KEPT_HEADER)
+        stream = _RecordingStream(
+            resp.content,
+            lambda body: _record(exact, loose, started, resp.status, content_type, body),
+        )
+        resp.content = stream
+        release = resp.release
+
+        def release_and_record():
+            stream.finish()
+            return release()
+
+        resp.release = release_and_record
+        return resp
+
+    aiohttp.ClientSession._request = _request
+
+
+# ====================== INSTALL ======================
+def install():
+    """Pasang patch transport sesuai CASSETTE_MODE (sekali per proses)"""
+    if MODE not in ("record", "replay") or _state["installed"]:
+        return
+    if MODE == "replay":
+        load(PATH)
+    _patch_requests()
+    _patch_httpx()
+    _patch_aiohttp()
+    _state["installed"] = True
+    logger.warning(
+        "📼 Cassette mode=%s path=%s (latency x%s)", MODE, PATH, LATENCY_SCALE
+    )
+
+
+def cassette_snapshot() -> dict:
+    return {
+        "mode": MODE,
+        "path": PATH,
+        "latency_scale": LATENCY_SCALE,
+        **_stats,
+        "missed": sorted(_missed)[:50],
+    }
@@ -0,0 +1,167 @@
+# 📍 lib/chains.py
+import os
+import sys
+import time
+import logging
+import importlib
+import threading
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Registry chain: SDK per keluarga chain (web3 / solana+solders+spl / tronpy)
+# baru di-import saat chain itu pertama kali dipakai, bukan saat worker boot.
+# CHAIN_FAMILIES_DISABLED : keluarga chain yang dimatikan, pisah koma (evm,sol,trx)
+#                           → SDK-nya tidak pernah di-import, route menjawab 400
+FAMILIES = {
+    "evm": ("eth", "bsc", "bnb", "polygon", "matic", "base"),
+    "sol": ("sol",),
+    "trx": ("trx",),
+}
+_FAMILY_OF = {chain: family for family, chains in FAMILIES.items() for chain in chains}
+
+DISABLED_FAMILIES = frozenset(
+    f.strip().lower()
+    for f in os.getenv("CHAIN_FAMILIES_DISABLED", "").split(",")
+    if f.strip()
+)
+for _unknown in DISABLED_FAMILIES - FAMILIES.keys():
+    logger.warning("⚠️ CHAIN_FAMILIES_DISABLED: keluarga '%s' tidak dikenal", _unknown)
+
+# 🔹 modul SDK per keluarga (untuk preload & laporan)
+FAMILY_MODULES = {
+    "evm": ("web3", "eth_account"),
+    "sol": ("solana.rpc.api", "solana.rpc.async_api", "solders", "spl.token.instructions"),
+    "trx": ("tronpy", "tronpy.async_tron"),
+}
+
+# 🔹 kapabilitas → chain → "modul:fungsi", modul di-import saat pertama dipakai
+REGISTRY = {
+    "send_native": {
+        "sol": "lib.solana_helper:send_sol",
+        "bnb": "lib.bnb_helper:send_bnb",
+        "eth": "lib.eth_helper:send_eth",
+        "base": "lib.base_helper:send_base",
+        "polygon": "lib.polygon_helper:send_polygon",
+        "trx": "lib.trx_helper:send_trx",
+    },
+    "send_usdt": {
+        "eth": "lib.helpers.usdt.eth:send_usdt_eth",
+        "bsc": "lib.helpers.usdt.bsc:send_usdt_bsc",
+        "trx": "lib.helpers.usdt.trx:send_usdt_trx",
+        "base": "lib.helpers.usdt.base:send_usdt_base",
+        "sol": "lib.helpers.usdt.sol:send_usdt_solana",
+        "polygon": "lib.helpers.usdt.polygon:send_usdt_polygon",
+    },
+    "send_usdc": {
+        "eth": "lib.helpers.usdc.eth:send_usdc_eth",
+        "bsc": "lib.helpers.usdc.bsc:send_usdc_bsc",
+        "trx": "lib.helpers.usdc.trx:send_usdc_trx",
+        "base": "lib.helpers.usdc.base:send_usdc_base",
+        "sol": "lib.helpers.usdc.sol:send_usdc_solana",
+        "polygon": "lib.helpers.usdc.polygon:send_usdc_polygon",
+    },
+}
+
+_lock = threading.Lock()
+# modul yang di-import lewat registry → durasi import pertama (detik)
+_import_seconds: dict[str, float] = {}
+
+
+class ChainDisabled(ValueError):
+    pass
+
+
+# ====================== STATUS CHAIN ======================
+def family_of(chain: str | None) -> str | None:
+    return _FAMILY_OF.get((chain or "").lower())
+
+
+def chain_enabled(chain: str | None) -> bool:
+    """Chain tidak dikenal dianggap aktif → jalur "tidak didukung" lama yang menjawab"""
+    family = family_of(chain)
+    return family is None or family not in DISABLED_FAMILIES
+
+
+def disabled_reason(chain: str | None) -> str | None:
+    if chain_enabled(chain):
+        return None
+    return f"Chain {chain.lower()} (keluarga {family_of(chain)}) dinonaktifkan di server ini"
+
+
+def require_chain(chain: str | None):
+    reason = disabled_reason(chain)
+    if reason:
+        raise ChainDisabled(reason)
+
+
+def require_family(family: str):
+    if family in DISABLED_FAMILIES:
+        raise ChainDisabled(f"Keluarga chain {family} dinonaktifkan di server ini")
+
+
+# ====================== IMPORT LAZY ======================
+def import_module(name: str):
+    """importlib.import_module + catat durasi import pertama (untuk /diagnostics)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        elapsed = time.perf_counter() - start
+        _import_seconds[name] = elapsed
+    logger.info("📦 Import lazy %s: %.0fms", name, elapsed * 1000)
+    return module
+
+
+def chain_function(capability: str, chain: str):
+    """Fungsi helper untuk (kapabilitas, chain); None kalau chain tidak didukung"""
+    chain = chain.lower()
+    require_chain(chain)
+    target = REGISTRY[capability].get(chain)
+    if target is None:
+        return None
+    module_name, _, attr = target.partition(":")
+    return getattr(import_module(module_name), attr)
+
+
+def preload_families(families=None) -> float:
+    """
+    Import SDK + helper keluarga chain yang aktif sekarang juga (mis. sebelum fork
+    gunicorn / saat warm-up). Return total detik.
+    """
+    start = time.perf_counter()
+    selected = [
+        f for f in (families or FAMILIES) if f in FAMILIES and f not in DISABLED_FAMILIES
+    ]
+    for family in selected:
+        for name in FAMILY_MODULES[family]:
+            import_module(name)
+        for targets in REGISTRY.values():
+            for chain, target in targets.items():
+                if family_of(chain) == family:
+                    import_module(target.partition(":")[0])
+    return time.perf_counter() - start
+
+
+def loaded_families() -> list[str]:
+    return [
+        family
+        for family, modules in FAMILY_MODULES.items()
+        if modules[0] in sys.modules
+    ]
+
+
+def chains_snapshot() -> dict:
+    return {
+        "disabled_families": sorted(DISABLED_FAMILIES),
+        "loaded_families": loaded_families(),
+        "lazy_imports_ms": {
+            name: round(seconds * 1000, 1)
+            for name, seconds in sorted(_import_seconds.items(), key=lambda kv: -kv[1])
+        },
+    }
@@ -0,0 +1,205 @@
+# 📍 lib/coin_index.py
+import os
+import json
+import time
+import asyncio
+import tempfile
+import logging
+from lib.coingecko import coingecko_get
+from lib.rpc_pool import normalize_chain
+from lib.upstream_guard import UpstreamUnavailable
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Index lokal dari /coins/list?include_platform=true (semua coin + kontrak per platform).
+# Dipakai /token_info untuk lookup kontrak di chain mana pun & symbol → coin id
+# tanpa round trip ke CoinGecko. Di-refresh di background, opsional disimpan ke disk.
+REFRESH_SECONDS = float(os.getenv("COIN_INDEX_REFRESH_SECONDS", "21600"))
+RETRY_SECONDS = float(os.getenv("COIN_INDEX_RETRY_SECONDS", "300"))
+SNAPSHOT_PATH = os.getenv("COIN_INDEX_SNAPSHOT_PATH")
+
+# 🔹 Chain API → asset platform id CoinGecko
+CHAIN_PLATFORMS = {
+    "eth": "ethereum",
+    "bsc": "binance-smart-chain",
+    "polygon": "polygon-pos",
+    "base": "base",
+    "sol": "solana",
+    "trx": "tron",
+}
+
+class AmbiguousSymbol(LookupError):
+    """Symbol dipakai beberapa coin dan platform tidak bisa memilih satu"""
+
+    def __init__(self, symbol: str, candidates: list[str]):
+        super().__init__(f"Symbol {symbol} dipakai {len(candidates)} coin")
+        self.symbol = symbol
+        self.candidates = candidates
+
+
+# 🔹 Index aktif, diganti utuh setiap refresh (reader tidak pernah lihat setengah jadi)
+_index = {
+    "ids": set(),
+    "by_symbol": {},
+    "by_contract": {},
+    "platforms": {},
+    "built_at": 0.0,
+}
+
+
+def platform_for_chain(chain: str | None) -> str | None:
+    chain = normalize_chain(chain)
+    if not chain:
+        return None
+    return CHAIN_PLATFORMS.get(chain, chain)
+
+
+def normalize_address(address: str) -> str:
+    """Alamat EVM case-insensitive, base58 (Solana/Tron) case-sensitive"""
+    address = address.strip()
+    return address.lower() if address.startswith(("0x", "0X")) else address
+
+
+def build_index(coins: list[dict]) -> dict:
+    ids = set()
+    by_symbol: dict[str, list[str]] = {}
+    by_contract: dict[tuple[str, str], str] = {}
+    platforms: dict[str, set[str]] = {}
+    for coin in coins:
+        coin_id = coin.get("id")
+        if not coin_id:
+            continue
+        ids.add(coin_id)
+        symbol = (coin.get("symbol") or "").lower()
+        if symbol:
+            by_symbol.setdefault(symbol, []).append(coin_id)
+        for platform, address in (coin.get("platforms") or {}).items():
+            if platform and address:
+                by_contract[(platform, normalize_address(address))] = coin_id
+                platforms.setdefault(coin_id, set()).add(platform)
+    return {
+        "ids": ids,
+        "by_symbol": by_symbol,
+        "by_contract": by_contract,
+        "platforms": platforms,
+        "built_at": time.time(),
+    }
+
+
+# ====================== SNAPSHOT DISK ======================
+def load_snapshot() -> bool:
+    global _index
+    if not SNAPSHOT_PATH or not os.path.exists(SNAPSHOT_PATH):
+        return False
+    try:
+        with open(SNAPSHOT_PATH) as f:
+            snapshot = json.load(f)
+        _index = build_index(snapshot["coins"])
+        _index["built_at"] = snapshot["fetched_at"]
+        logger.info(f"💾 Coin index dimuat dari {SNAPSHOT_PATH}: {len(_index['ids'])} coin")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal load coin index {SNAPSHOT_PATH}: {e}")
+        return False
+
+
+def save_snapshot(coins: list[dict], fetched_at: float):
+    """Ditulis ke file temp unik per call: worker lain bisa menyimpan bersamaan"""
+    if not SNAPSHOT_PATH:
+        return
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(SNAPSHOT_PATH) or ".",
+            prefix=f"{os.path.basename(SNAPSHOT_PATH)}.",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fetched_at": fetched_at, "coins": coins}, f)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal simpan coin index {SNAPSHOT_PATH}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+# ====================== REFRESH ======================
+async def refresh_index():
+    global _index
+    coins = await coingecko_get(
+        "/coins/list",
+        params={"include_platform": "true"},
+        timeout=30,
+        parse_in_thread=True,
+    )
+    # ±15rb coin → build di thread supaya event loop tidak ketahan
+    index = await asyncio.to_thread(build_index, coins)
+    _index = index
+    await asyncio.to_thread(save_snapshot, coins, index["built_at"])
+    logger.info(
+        f"🗂️ Coin index diperbarui: {len(index['ids'])} coin, {len(index['by_contract'])} kontrak"
+    )
+
+
+async def coin_index_loop():
+    """Load snapshot, lalu refresh berkala (lebih cepat retry kalau gagal)"""
+    # master preload sudah memuat snapshot → index dipakai bersama, tidak dimuat ulang
+    if not index_ready():
+        await asyncio.to_thread(load_snapshot)
+    while True:
+        age = time.time() - _index["built_at"]
+        if age < REFRESH_SECONDS:
+            await asyncio.sleep(REFRESH_SECONDS - age)
+        try:
+            await refresh_index()
+        except UpstreamUnavailable as e:
+            logger.warning(f"⚠️ Refresh coin index ditunda: {e}")
+            await asyncio.sleep(RETRY_SECONDS)
+        except Exception as e:
+            logger.error(f"❌ Refresh coin index gagal: {e}")
+            await asyncio.sleep(RETRY_SECONDS)
+
+
+# ====================== LOOKUP ======================
+def index_ready() -> bool:
+    return bool(_index["ids"])
+
+
+def lookup_contract(platform: str, address: str) -> str | None:
+    return _index["by_contract"].get((platform, normalize_address(address)))
+
+
+def lookup_symbol(symbol: str, platform: str | None = None) -> str | None:
+    """
+    Symbol → coin id. Kalau dipakai beberapa coin, hanya coin yang punya kontrak
+    di platform yang dipertimbangkan; tetap lebih dari satu → AmbiguousSymbol
+    (kandidat urut id) supaya caller memilih coin id sendiri, tidak ditebak.
+    """
+    candidates = _index["by_symbol"].get(symbol.lower())
+    if not candidates:
+        return None
+    if platform and len(candidates) > 1:
+        on_platform = [
+            coin_id
+            for coin_id in candidates
+            if platform in _index["platforms"].get(coin_id, ())
+        ]
+        candidates = on_platform or candidates
+    if len(candidates) == 1:
+        return candidates[0]
+    raise AmbiguousSymbol(symbol, sorted(candidates))
+
+
+def has_coin(coin_id: str) -> bool:
+    return coin_id in _index["ids"]
+
+
+def coin_index_snapshot() -> dict:
+    return {
+        "coins": len(_index["ids"]),
+        "contracts": len(_index["by_contract"]),
+        "age_seconds": round(time.time() - _index["built_at"], 1)
+        if _index["built_at"]
+        else None,
+    }
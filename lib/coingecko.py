@@ -1,13 +1,28 @@
 # 📍 lib/coingecko.py
+import os
+import re
+import json
+import codecs
 import aiohttp
 import logging
 import asyncio
+from lib.upstream_guard import get_guard
+from lib.metrics import host_label, track_upstream
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
-# 🔹 URL Coingecko langsung, tidak dari env
-BASE_URL = "https://api.coingecko.com/api/v3/simple/price"
+# 🔹 URL Coingecko default publik, bisa diarahkan ke mirror/stand-in lewat env
+COINGECKO_API = os.getenv("COINGECKO_BASE_URL", "https://api.coingecko.com/api/v3")
+BASE_URL = f"{COINGECKO_API}/simple/price"
+COINGECKO_HOST = host_label(COINGECKO_API)
+
+
+def _method_label(path: str) -> str:
+    """/coins/ethereum → /coins/{id} supaya label metrik tidak meledak"""
+    parts = path.split("/")
+    if len(parts) == 3 and parts[1] == "coins" and parts[2] != "list":
+        return "/coins/{id}"
+    return path
 
 TOKEN_MAP = {
     "sol": "solana",
@@ -21,48 +36,256 @@ TOKEN_MAP = {
 }
 
 
-async def get_current_price(token: str, retries=3, delay=1) -> float:
-    coin_id = TOKEN_MAP.get(token.lower())
-    if not coin_id:
-        logger.warning(f"⚠️ Token {token} belum support")
-        return 0
+class CoinGeckoError(Exception):
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message or f"CoinGecko status {status}")
+        self.status = status
+
+
+async def coingecko_get(
+    path: str, params: dict = None, timeout: float = 10, parse_in_thread: bool = False
+) -> dict:
+    """
+    GET ke CoinGecko lewat guard bersama (token bucket + circuit breaker).
+    Raise UpstreamUnavailable kalau breaker open / rate limit habis.
+    parse_in_thread: dokumen besar (/coins/list, beberapa MB) di-parse di
+    thread supaya event loop tidak ketahan.
+    """
+    guard = get_guard("coingecko")
+    await guard.acquire()
+    body = None
+    try:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(timeout=client_timeout) as session:
+            with track_upstream(COINGECKO_HOST, _method_label(path)):
+                async with session.get(
+                    f"{COINGECKO_API}{path}", params=params
+                ) as resp:
+                    if resp.status != 200:
+                        raise CoinGeckoError(resp.status)
+                    if parse_in_thread:
+                        body = await resp.read()
+                    else:
+                        data = await resp.json()
+        if body is not None:
+            data = await asyncio.to_thread(json.loads, body)
+    except asyncio.CancelledError:
+        # client putus / warm-up timeout: slot probe half-open jangan ikut hilang
+        guard.release_probe()
+        raise
+    except Exception as e:
+        guard.record_failure(e)
+        raise
+    guard.record_success()
+    return data
+
+
+# ====================== DOKUMEN /coins/{id} ======================
+# Default /coins/{id} ikut kirim market_data, tickers, localization, dll (ratusan KB).
+# Profil ini memangkas semua bagian yang tidak dipakai.
+COIN_DOC_LEAN_PARAMS = {
+    "localization": "false",
+    "tickers": "false",
+    "market_data": "false",
+    "community_data": "false",
+    "developer_data": "false",
+    "sparkline": "false",
+}
+
+
+# 🔹 scanner akhir value JSON: lompat langsung ke karakter yang relevan
+_STRUCT_CHARS = re.compile(r'["\[\]{}]')
+_STRING_CHARS = re.compile(r'["\\]')
+_LITERAL_END = re.compile(r"[,}\]\s]")
+
+
+class JSONFieldExtractor:
+    """
+    Parser inkremental untuk object JSON top-level: ambil key tertentu saja,
+    berhenti begitu semua key ketemu (sisa dokumen tidak perlu diunduh/di-parse).
+    Akhir value dicari dengan scanner yang posisinya disimpan antar chunk (tiap
+    karakter discan sekali), value yang diminta di-decode sekali saat lengkap,
+    value lain dibuang tanpa di-decode.
+    """
+
+    def __init__(self, fields):
+        self.wanted = set(fields)
+        self.found = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._started = False
+        self.done = False
+        # value yang sedang discan (key sudah di-parse)
+        self._key = None
+        self._kind = ""
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
 
-    params = {"ids": ",".join(TOKEN_MAP.values()), "vs_currencies": "idr,usd"}
+    def _skip(self, chars: str):
+        while self._pos < len(self._buf) and self._buf[self._pos] in chars:
+            self._pos += 1
 
-    for attempt in range(1, retries + 1):
+    def _value_end(self) -> int | None:
+        """Posisi setelah value di self._buf, None kalau value belum lengkap"""
+        buf = self._buf
+        pos = self._scan
+        if self._kind not in '{["':
+            # angka/literal: selesai di pemisah berikutnya ("12" bisa saja "12.5")
+            match = _LITERAL_END.search(buf, pos)
+            if not match:
+                self._scan = len(buf)
+                return None
+            return match.start()
+        while True:
+            if self._in_string:
+                match = _STRING_CHARS.search(buf, pos)
+                if not match:
+                    self._scan = len(buf)
+                    return None
+                if match.group() == "\\":
+                    if match.end() >= len(buf):
+                        # escape terpotong di ujung chunk → scan ulang dari backslash
+                        self._scan = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    return pos
+                continue
+            match = _STRUCT_CHARS.search(buf, pos)
+            if not match:
+                self._scan = len(buf)
+                return None
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+    def _start_value(self) -> bool:
+        """Parse key + ":" di self._pos, siapkan scanner di awal value"""
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(BASE_URL, params=params) as resp:
+            key, end = self._decoder.raw_decode(self._buf, self._pos)
+            colon = self._buf.index(":", end)
+        except ValueError:
+            # key belum lengkap → tunggu chunk berikutnya
+            return False
+        start = colon + 1
+        while start < len(self._buf) and self._buf[start] in " \t\r\n":
+            start += 1
+        if start >= len(self._buf):
+            return False
+        self._key = key
+        self._kind = self._buf[start]
+        self._buf = self._buf[start:]
+        self._pos = self._scan = self._depth = 0
+        self._in_string = False
+        return True
+
+    def feed(self, chunk: bytes) -> bool:
+        """Tambah potongan data, return True kalau semua field sudah didapat"""
+        self._buf += self._text_decoder.decode(chunk)
+        while not self.done:
+            if self._key is None:
+                self._skip(" \t\r\n")
+                if not self._started:
+                    if self._pos >= len(self._buf):
+                        return False
+                    if self._buf[self._pos] != "{":
+                        raise ValueError("Dokumen JSON bukan object")
+                    self._pos += 1
+                    self._started = True
+                    continue
+                self._skip(" \t\r\n,")
+                if self._pos >= len(self._buf):
+                    return False
+                if self._buf[self._pos] == "}":
+                    self.done = True
+                    break
+                if not self._start_value():
+                    return False
+
+            end = self._value_end()
+            if end is None:
+                if self._key not in self.wanted:
+                    # value yang tidak diminta: bagian yang sudah discan dibuang
+                    self._buf = self._buf[self._scan :]
+                    self._scan = 0
+                return False
+            if self._key in self.wanted:
+                self.found[self._key], _ = self._decoder.raw_decode(self._buf[:end])
+                if len(self.found) == len(self.wanted):
+                    self.done = True
+            self._key = None
+            # buang bagian yang sudah di-parse supaya buffer tetap kecil
+            self._buf = self._buf[end:]
+            self._pos = 0
+        return self.done
+
+
+async def coingecko_get_fields(
+    path: str, fields, params: dict = None, timeout: float = 10
+) -> dict:
+    """
+    Sama seperti coingecko_get, tapi hanya ambil key top-level `fields`
+    dan stop download begitu semuanya ketemu.
+    """
+    guard = get_guard("coingecko")
+    await guard.acquire()
+    extractor = JSONFieldExtractor(fields)
+    try:
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(timeout=client_timeout) as session:
+            with track_upstream(COINGECKO_HOST, _method_label(path)):
+                async with session.get(
+                    f"{COINGECKO_API}{path}", params=params
+                ) as resp:
                     if resp.status != 200:
-                        logger.error(
-                            f"❌ Gagal fetch harga {token}, status: {resp.status}"
-                        )
-                        raise Exception("Status != 200")
-                    data = await resp.json()
-                    price_info = data.get(coin_id)
-                    if not price_info:
-                        logger.error(
-                            f"❌ Token {token.upper()} tidak ada di respons API"
-                        )
-                        raise Exception("Token tidak ada")
-                    price_idr = price_info.get("idr", 0)
-                    price_usd = price_info.get("usd", 0)
-                    if price_idr == 0 or price_usd == 0:
-                        raise Exception("Data harga kosong")
-                    kurs = price_idr / price_usd
-                    logger.info(
-                        f"💲 Harga real-time {token.upper()} : {price_idr:,.0f} IDR | {price_usd:.2f} USD | Kurs IDR/USD: {kurs:,.2f}"
-                    )
-                    return price_idr
-        except Exception as e:
-            logger.warning(
-                f"⚠️ Attempt {attempt} gagal untuk {token}, retry in {delay}s"
-            )
-            await asyncio.sleep(delay)
-    # fallback kalau semua retry gagal
-    logger.error(f"❌ Semua attempt gagal, gunakan fallback price untuk {token}")
-    return 0  # atau bisa pakai harga terakhir cache
+                        raise CoinGeckoError(resp.status)
+                    async for chunk in resp.content.iter_chunked(4096):
+                        if extractor.feed(chunk):
+                            break
+    except asyncio.CancelledError:
+        # client putus / warm-up timeout: slot probe half-open jangan ikut hilang
+        guard.release_probe()
+        raise
+    except Exception as e:
+        guard.record_failure(e)
+        raise
+    guard.record_success()
+    return extractor.found
+
+
+async def get_current_price(token: str) -> float:
+    """Harga IDR token dari price store (stale-while-revalidate), 0 kalau tidak ada"""
+    from lib.price_store import get_price_quote  # import lokal: price_store pakai modul ini
+
+    coin_id = TOKEN_MAP.get(token.lower())
+    if not coin_id:
+        logger.warning(f"⚠️ Token {token} belum support")
+        return 0
+    quote = await get_price_quote(coin_id)
+    if not quote or not quote["idr"]:
+        logger.error(f"❌ Harga {token.upper()} tidak tersedia (upstream & cache kosong)")
+        return 0
+    logger.info(
+        "💲 Harga %s : %s IDR | %s USD (umur %ss)",
+        token.upper(),
+        quote["idr"],
+        quote["usd"],
+        quote["age_seconds"],
+    )
+    return quote["idr"]
 
 
 async def log_all_prices():
@@ -73,18 +296,4 @@ async def log_all_prices():
 
 async def get_current_sol_price() -> float:
     """Ambil harga SOL dalam IDR saja"""
-    params = {"ids": "solana", "vs_currencies": "idr"}
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(BASE_URL, params=params) as resp:
-                if resp.status != 200:
-                    logger.error(f"❌ Gagal fetch harga SOL, status: {resp.status}")
-                    return 0
-                data = await resp.json()
-                price = data.get("solana", {}).get("idr", 0)
-                if price == 0:
-                    logger.error(f"❌ Respons API tidak sesuai untuk SOL, data: {data}")
-                return price
-    except Exception as e:
-        logger.exception("❌ Error ambil harga SOL")
-        return 0
+    return await get_current_price("sol")
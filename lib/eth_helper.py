@@ -1,7 +1,9 @@
 # 📍 lib/eth_helper.py
 import logging
 from web3 import Web3
-from eth_account import Account
+from lib.signer_registry import as_signer
+from lib.rpc_pool import get_web3
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -9,18 +11,17 @@ logger = logging.getLogger(__name__)
 def get_balance(address: str, rpc_url: str):
     """Cek saldo ETH dari wallet tertentu"""
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("Ethereum RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
         balance_wei = w3.eth.get_balance(Web3.to_checksum_address(address))
         balance_eth = w3.from_wei(balance_wei, "ether")
-        logger.info(f"💰 Saldo {address}: {balance_eth} ETH")
+        logger.debug("💰 Saldo %s: %s ETH", address, balance_eth)
         return balance_eth
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo {address}: {e}", exc_info=True)
         return None
 
 
+@traced("send eth", chain="eth")
 async def send_eth(
     destination_wallet: str,
     amount_eth: float,
@@ -36,14 +37,11 @@ async def send_eth(
     if not private_key:
         raise ValueError("❌ Private key harus diberikan!")
 
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
-    admin_account = Account.from_key(private_key)
+    # 🔑 Signer resident (key_alias) atau derive dari private_key mentah
+    admin_account = as_signer("evm", private_key).account
 
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("Ethereum RPC tidak terkoneksi!")
+        w3 = get_web3(rpc_url)
 
         sender_address = admin_account.address
 
@@ -68,7 +66,7 @@ async def send_eth(
             "chainId": w3.eth.chain_id,
         }
 
-        signed_tx = w3.eth.account.sign_transaction(tx, private_key)
+        signed_tx = admin_account.sign_transaction(tx)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         logger.info(
             f"✅ Kirim {amount_eth} ETH ke {destination_wallet}, tx_hash: {tx_hash.hex()}"
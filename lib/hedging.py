@@ -0,0 +1,113 @@
+# 📍 lib/hedging.py
+import os
+import asyncio
+import logging
+import threading
+from lib.rpc_pool import ranked_endpoints, normalize_chain
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Hedged read: kalau endpoint utama belum jawab setelah delay adaptif (p95-nya),
+# kirim request kedua ke endpoint pool berikutnya. Jawaban pertama menang,
+# yang kalah di-cancel. Hanya untuk read, dan hanya kalau pool punya >= 2 URL.
+HEDGE_ENABLED = os.getenv("RPC_HEDGE_ENABLED", "1") == "1"
+HEDGE_PERCENTILE = float(os.getenv("RPC_HEDGE_PERCENTILE", "0.95"))
+HEDGE_DEFAULT_DELAY = float(os.getenv("RPC_HEDGE_DEFAULT_DELAY", "0.3"))
+HEDGE_MIN_DELAY = float(os.getenv("RPC_HEDGE_MIN_DELAY", "0.02"))
+HEDGE_MAX_DELAY = float(os.getenv("RPC_HEDGE_MAX_DELAY", "2.0"))
+HEDGE_MIN_SAMPLES = int(os.getenv("RPC_HEDGE_MIN_SAMPLES", "20"))
+
+_lock = threading.Lock()
+_stats: dict[str, dict[str, int]] = {}
+
+
+def _count(chain: str, key: str):
+    with _lock:
+        chain_stats = _stats.setdefault(
+            chain,
+            {
+                "reads": 0,
+                "hedged": 0,
+                "hedge_won": 0,
+                "primary_won": 0,
+                "failover": 0,
+                "failed": 0,
+            },
+        )
+        chain_stats[key] += 1
+
+
+def hedge_delay(stats) -> float:
+    """Delay sebelum hedge = persentil latency endpoint utama (dibatasi min/max)"""
+    if len(stats.samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    delay = stats.percentile(HEDGE_PERCENTILE)
+    return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, delay))
+
+
+async def hedged_read(chain: str, fetch, rpc_url: str | None = None):
+    """
+    Jalankan read `fetch(url)` (coroutine) dengan hedging antar endpoint pool.
+    rpc_url dari user → langsung dipakai, tanpa hedging.
+    """
+    if rpc_url:
+        return await fetch(rpc_url)
+
+    chain = normalize_chain(chain)
+    ranked = ranked_endpoints(chain)
+    if not ranked:
+        raise ValueError(f"RPC URL harus diberikan untuk {chain.upper()}")
+
+    _count(chain, "reads")
+    if not HEDGE_ENABLED or len(ranked) < 2:
+        return await fetch(ranked[0].url)
+
+    primary, backup = ranked[0], ranked[1]
+    primary_task = asyncio.ensure_future(fetch(primary.url))
+    done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay(primary))
+    if done:
+        if primary_task.exception() is None:
+            _count(chain, "primary_won")
+            return primary_task.result()
+        # primary gagal cepat → langsung failover, tidak perlu tunggu delay
+        _count(chain, "failover")
+        logger.warning(
+            "⚠️ RPC %s gagal, failover ke %s: %s",
+            primary.host,
+            backup.host,
+            primary_task.exception(),
+        )
+        try:
+            return await fetch(backup.url)
+        except Exception:
+            _count(chain, "failed")
+            raise
+
+    _count(chain, "hedged")
+    backup_task = asyncio.ensure_future(fetch(backup.url))
+    pending = {primary_task, backup_task}
+    last_error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    _count(
+                        chain, "hedge_won" if task is backup_task else "primary_won"
+                    )
+                    return task.result()
+                last_error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    _count(chain, "failed")
+    raise last_error
+
+
+def hedge_snapshot() -> dict:
+    with _lock:
+        return {chain: dict(values) for chain, values in _stats.items()}
@@ -3,13 +3,12 @@
 import logging
 import time
 import asyncio
-from functools import partial
 from web3 import Web3
+from lib.rpc_pool import get_web3
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 # ERC20 ABI minimal
 ERC20_ABI = [
@@ -46,12 +45,13 @@ ERC20_ABI = [
 ]
 
 
+@traced("usdc balance base", chain="base")
 def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> float:
     """Cek saldo USDC Base (dinamis, mirip ETH)"""
     try:
         wallet_address = Web3.to_checksum_address(wallet_address)
         token_address = Web3.to_checksum_address(token_address.strip())
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = get_web3(rpc_url)
         contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
 
         try:
@@ -62,7 +62,7 @@ def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> f
 
         balance_raw = contract.functions.balanceOf(wallet_address).call()
         balance = balance_raw / (10**decimals)
-        logger.info(f"💰 Saldo USDC Base {wallet_address}: {balance}")
+        logger.debug("💰 Saldo USDC Base %s: %s", wallet_address, balance)
         return balance
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo Base USDC: {e}", exc_info=True)
@@ -80,8 +80,8 @@ def send_usdc_base_sync(
     try:
         destination_wallet = Web3.to_checksum_address(destination_wallet.strip())
         token_address = Web3.to_checksum_address(token_address.strip())
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        account = w3.eth.account.from_key(private_key)
+        w3 = get_web3(rpc_url)
+        account = as_signer("evm", private_key).account
         from_address = Web3.to_checksum_address(account.address)
         contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
 
@@ -112,7 +112,7 @@ def send_usdc_base_sync(
             }
         )
 
-        signed_txn = w3.eth.account.sign_transaction(txn, private_key=private_key)
+        signed_txn = account.sign_transaction(txn)
         tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
         logger.info(f"🕓 Menunggu konfirmasi transaksi {tx_hash.hex()}...")
 
@@ -149,6 +149,7 @@ def send_usdc_base_sync(
         return None
 
 
+@traced("send usdc base", chain="base")
 async def send_usdc_base(
     destination_wallet: str,
     amount: float,
@@ -157,15 +158,12 @@ async def send_usdc_base(
     token_address: str,
 ):
     """Kirim USDC Base (async-safe)"""
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        None,
-        partial(
-            send_usdc_base_sync,
-            destination_wallet,
-            amount,
-            rpc_url,
-            private_key,
-            token_address,
-        ),
+    # to_thread: contextvar request (Server-Timing) ikut ke thread
+    return await asyncio.to_thread(
+        send_usdc_base_sync,
+        destination_wallet,
+        amount,
+        rpc_url,
+        private_key,
+        token_address,
     )
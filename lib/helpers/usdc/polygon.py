@@ -2,11 +2,11 @@
 import logging
 import asyncio
 from web3 import Web3
+from lib.rpc_pool import get_web3
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 ERC20_ABI = [
     {
@@ -36,11 +36,10 @@ ERC20_ABI = [
 ]
 
 
+@traced("usdc balance polygon", chain="polygon")
 def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> float:
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("RPC tidak terhubung")
+        w3 = get_web3(rpc_url)
         contract = w3.eth.contract(
             address=Web3.to_checksum_address(token_address), abi=ERC20_ABI
         )
@@ -52,13 +51,14 @@ def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> f
         balance = contract.functions.balanceOf(
             Web3.to_checksum_address(wallet_address)
         ).call() / (10**decimals)
-        logger.info(f"💰 Saldo USDC {wallet_address}: {balance} USDC")
+        logger.debug("💰 Saldo USDC %s: %s USDC", wallet_address, balance)
         return balance
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo USDC: {e}", exc_info=True)
         return 0.0
 
 
+@traced("wait receipt polygon", chain="polygon")
 async def wait_tx_receipt_async(
     w3: Web3, tx_hash: str, poll_interval: int = 5, timeout: int = 180
 ):
@@ -77,6 +77,7 @@ async def wait_tx_receipt_async(
         await asyncio.sleep(poll_interval)
 
 
+@traced("send usdc polygon", chain="polygon")
 async def send_usdc_polygon(
     destination_wallet: str,
     amount: float,
@@ -89,11 +90,9 @@ async def send_usdc_polygon(
         if not rpc_url or not private_key or not token_address:
             raise Exception("RPC, private_key, dan token_address wajib diisi")
 
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("RPC tidak terhubung")
+        w3 = get_web3(rpc_url)
 
-        account = w3.eth.account.from_key(private_key)
+        account = as_signer("evm", private_key).account
         from_address = Web3.to_checksum_address(account.address)
         destination_wallet = Web3.to_checksum_address(destination_wallet)
         token_address = Web3.to_checksum_address(token_address)
@@ -133,7 +132,7 @@ async def send_usdc_polygon(
             }
         )
 
-        signed_tx = w3.eth.account.sign_transaction(tx, private_key)
+        signed_tx = account.sign_transaction(tx)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         logger.info(f"🕓 Menunggu konfirmasi transaksi {tx_hash.hex()}...")
 
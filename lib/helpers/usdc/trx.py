@@ -2,15 +2,12 @@
 
 import logging
 import time
-from tronpy import Tron
-from tronpy.keys import PrivateKey
-from tronpy.providers import HTTPProvider
 from tronpy.exceptions import TransactionNotFound
+from lib.rpc_pool import get_tron_client
+from lib.signer_registry import as_signer
+from lib.tracing import start_span, traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 # ABI TRC20 standar
 TRC20_ABI = [
@@ -47,12 +44,13 @@ TRC20_ABI = [
 ]
 
 
+@traced("usdc balance trx", chain="trx")
 def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> float:
     """
     Cek saldo USDC (TRC20) dari wallet_address
     """
     try:
-        client = Tron(HTTPProvider(rpc_url))
+        client = get_tron_client(rpc_url)
         contract = client.get_contract(token_address)
 
         try:
@@ -64,7 +62,7 @@ def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> f
         balance_raw = contract.functions.balanceOf(wallet_address)
         balance = balance_raw / (10**decimals)
 
-        logger.info(f"💰 Saldo USDC {wallet_address}: {balance} USDC")
+        logger.debug("💰 Saldo USDC %s: %s USDC", wallet_address, balance)
         return balance
 
     except Exception as e:
@@ -72,6 +70,7 @@ def get_usdc_balance(wallet_address: str, rpc_url: str, token_address: str) -> f
         return 0.0
 
 
+@traced("send usdc trx", chain="trx")
 async def send_usdc_trx(
     destination_wallet: str,
     amount: float,
@@ -83,9 +82,11 @@ async def send_usdc_trx(
     Kirim USDC TRC20 ke wallet tujuan, mirip style ETH.
     """
     try:
-        client = Tron(HTTPProvider(rpc_url))
-        account = PrivateKey(bytes.fromhex(private_key))
-        tron_address = account.public_key.to_base58check_address()
+        client = get_tron_client(rpc_url)
+        # 🔑 Signer resident (key_alias) atau derive dari private_key mentah
+        signer = as_signer("trx", private_key)
+        account = signer.account
+        tron_address = signer.address
 
         contract = client.get_contract(token_address)
 
@@ -125,7 +126,8 @@ async def send_usdc_trx(
         receipt = None
         for i in range(10):
             try:
-                receipt = client.get_transaction_info(tx_hash)
+                with start_span("trx get_transaction_info", chain="trx", attempt=i + 1):
+                    receipt = client.get_transaction_info(tx_hash)
                 break
             except TransactionNotFound:
                 logger.info(
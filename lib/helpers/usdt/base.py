@@ -2,13 +2,12 @@
 import logging
 import time
 import asyncio
-from functools import partial
 from web3 import Web3
+from lib.rpc_pool import get_web3
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 ERC20_ABI = [
     {
@@ -44,11 +43,12 @@ ERC20_ABI = [
 ]
 
 
+@traced("usdt balance base", chain="base")
 def get_usdt_balance(wallet_address: str, rpc_url: str, token_address: str) -> float:
     try:
         wallet_address = Web3.to_checksum_address(wallet_address)
         token_address = Web3.to_checksum_address(token_address.strip())
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = get_web3(rpc_url)
         contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
 
         try:
@@ -59,7 +59,7 @@ def get_usdt_balance(wallet_address: str, rpc_url: str, token_address: str) -> f
 
         balance_raw = contract.functions.balanceOf(wallet_address).call()
         balance = balance_raw / (10**decimals)
-        logger.info(f"💰 Saldo USDT Base {wallet_address}: {balance}")
+        logger.debug("💰 Saldo USDT Base %s: %s", wallet_address, balance)
         return balance
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo Base USDT: {e}", exc_info=True)
@@ -77,8 +77,8 @@ def send_usdt_base_sync(
     try:
         destination_wallet = Web3.to_checksum_address(destination_wallet.strip())
         token_address = Web3.to_checksum_address(token_address.strip())
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        account = w3.eth.account.from_key(private_key)
+        w3 = get_web3(rpc_url)
+        account = as_signer("evm", private_key).account
         from_address = Web3.to_checksum_address(account.address)
         contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
 
@@ -107,7 +107,7 @@ def send_usdt_base_sync(
             }
         )
 
-        signed_txn = w3.eth.account.sign_transaction(txn, private_key=private_key)
+        signed_txn = account.sign_transaction(txn)
         tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
         logger.info(f"🕓 Menunggu konfirmasi transaksi {tx_hash.hex()}...")
 
@@ -144,6 +144,7 @@ def send_usdt_base_sync(
         return None
 
 
+@traced("send usdt base", chain="base")
 async def send_usdt_base(
     destination_wallet: str,
     amount: float,
@@ -151,15 +152,12 @@ async def send_usdt_base(
     private_key: str,
     token_address: str,
 ):
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        None,
-        partial(
-            send_usdt_base_sync,
-            destination_wallet,
-            amount,
-            rpc_url,
-            private_key,
-            token_address,
-        ),
+    # to_thread: contextvar request (Server-Timing) ikut ke thread
+    return await asyncio.to_thread(
+        send_usdt_base_sync,
+        destination_wallet,
+        amount,
+        rpc_url,
+        private_key,
+        token_address,
     )
@@ -2,11 +2,11 @@
 import logging
 import asyncio
 from web3 import Web3
+from lib.rpc_pool import get_web3
+from lib.signer_registry import as_signer
+from lib.tracing import start_span, traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 ERC20_ABI = [
     {
@@ -36,13 +36,12 @@ ERC20_ABI = [
 ]
 
 
+@traced("usdt balance bsc", chain="bsc")
 def get_usdt_balance(
     wallet_address: str, rpc_url: str, token_address: str, retries: int = 3
 ) -> float:
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("RPC tidak terhubung")
+        w3 = get_web3(rpc_url)
         contract = w3.eth.contract(
             address=Web3.to_checksum_address(token_address), abi=ERC20_ABI
         )
@@ -56,11 +55,12 @@ def get_usdt_balance(
         attempt = 0
         while attempt < retries:
             try:
-                balance_raw = contract.functions.balanceOf(
-                    Web3.to_checksum_address(wallet_address)
-                ).call()
+                with start_span("bsc balanceOf", chain="bsc", attempt=attempt + 1):
+                    balance_raw = contract.functions.balanceOf(
+                        Web3.to_checksum_address(wallet_address)
+                    ).call()
                 balance = balance_raw / (10**decimals)
-                logger.info(f"💰 Saldo USDT {wallet_address}: {balance} USDT")
+                logger.debug("💰 Saldo USDT %s: %s USDT", wallet_address, balance)
                 return balance
             except Exception as e:
                 logger.warning(
@@ -78,6 +78,7 @@ def get_usdt_balance(
         return 0.0
 
 
+@traced("wait receipt bsc", chain="bsc")
 async def wait_tx_receipt_async(
     w3: Web3, tx_hash: str, poll_interval: int = 5, timeout: int = 180
 ):
@@ -96,6 +97,7 @@ async def wait_tx_receipt_async(
         await asyncio.sleep(poll_interval)
 
 
+@traced("send usdt bsc", chain="bsc")
 async def send_usdt_bsc(
     destination_wallet: str,
     amount: float,
@@ -108,15 +110,13 @@ async def send_usdt_bsc(
         if not rpc_url or not private_key or not token_address:
             raise Exception("RPC, private_key, dan token_address wajib diisi")
 
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise Exception("RPC tidak terhubung")
+        w3 = get_web3(rpc_url)
 
         if chain_id is None:
             rpc_lower = rpc_url.lower()
             chain_id = 97 if "testnet" in rpc_lower else 56
 
-        account = w3.eth.account.from_key(private_key)
+        account = as_signer("evm", private_key).account
         from_address = Web3.to_checksum_address(account.address)
         destination_wallet = Web3.to_checksum_address(destination_wallet)
         token_address = Web3.to_checksum_address(token_address)
@@ -157,7 +157,7 @@ async def send_usdt_bsc(
             }
         )
 
-        signed_tx = w3.eth.account.sign_transaction(tx, private_key)
+        signed_tx = account.sign_transaction(tx)
         tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         logger.info(f"🕓 Menunggu konfirmasi transaksi {tx_hash.hex()}...")
 
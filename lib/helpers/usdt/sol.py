@@ -1,6 +1,5 @@
 # 📍 lib/helpers/usdt/sol.py
 import logging
-import base58
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from solders.transaction import Transaction
@@ -13,27 +12,21 @@ from spl.token.instructions import (
     get_associated_token_address,
     TransferCheckedParams,
 )
+from lib.rpc_pool import get_solana_client
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
 
 def get_client(rpc_url: str) -> Client:
     """Inisialisasi Solana RPC client"""
-    return Client(rpc_url)
-
-
-def load_keypair(secret_key_base58: str) -> Keypair:
-    """Load keypair dari base58 string"""
-    key_bytes = base58.b58decode(secret_key_base58)
-    if len(key_bytes) == 32:
-        return Keypair.from_secret_key(key_bytes)
-    elif len(key_bytes) == 64:
-        return Keypair.from_bytes(key_bytes)
-    else:
-        raise ValueError(
-            f"❌ Private key salah, panjang {len(key_bytes)} bukan 32/64 bytes"
-        )
+    return get_solana_client(rpc_url)
+
+
+def load_keypair(secret_key_base58) -> Keypair:
+    """Keypair dari base58 string, atau Keypair resident kalau yang dikirim Signer (key_alias)"""
+    return as_signer("sol", secret_key_base58).account
 
 
 def get_or_create_ata(client: Client, owner_pub: Pubkey, mint_pub: Pubkey, payer: Keypair) -> Pubkey:
@@ -53,6 +46,7 @@ def get_or_create_ata(client: Client, owner_pub: Pubkey, mint_pub: Pubkey, payer
     return token_account
 
 
+@traced("usdt balance sol", chain="sol")
 def get_usdt_balance(client: Client, wallet_address: str, usdt_mint_address: str) -> float:
     """Cek saldo USDT SPL di wallet tertentu"""
     try:
@@ -68,7 +62,7 @@ def get_usdt_balance(client: Client, wallet_address: str, usdt_mint_address: str
         balance_raw = int(bal_resp.value.amount)
         decimals = int(bal_resp.value.decimals)
         balance = balance_raw / (10 ** decimals)
-        logger.info(f"💰 Saldo USDT {wallet_address}: {balance} USDT")
+        logger.debug("💰 Saldo USDT %s: %s USDT", wallet_address, balance)
         return balance
 
     except Exception as e:
@@ -88,6 +82,7 @@ def send_tx(client: Client, tx: Transaction, signer: Keypair) -> str:
     return str(signature)
 
 
+@traced("send usdt sol", chain="sol")
 def send_usdt_solana(
     destination_wallet: str,
     amount: float,
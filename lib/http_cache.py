@@ -0,0 +1,118 @@
+# 📍 lib/http_cache.py
+import os
+import time
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ====================== KONFIGURASI ======================
+# Route GET yang datanya statis / berubah terjadwal set Cache-Control +
+# Last-Modified sendiri (cache_headers), middleware ini menambah ETag dari
+# body (kecuali route sudah set ETag sendiri) dan menjawab 304 kalau
+# If-None-Match / If-Modified-Since cocok, jadi gateway RapidAPI & cache
+# client menyerap request ulang.
+#   /tokens     : daftar statis → CACHE_TOKENS_MAX_AGE
+#   /token_info : metadata CoinGecko → CACHE_TOKEN_INFO_MAX_AGE
+#   /price      : sisa umur segar harga (PRICE_FRESH_SECONDS - age_seconds),
+#                 ETag lemah per versi harga (age_seconds di body selalu berubah)
+#   /tx_status  : hanya tx finalized (tidak bisa reorg) → CACHE_TX_FINAL_MAX_AGE,
+#                 pending / belum final / provisional / stale → no-store
+CACHE_TOKENS_MAX_AGE = int(os.getenv("CACHE_TOKENS_MAX_AGE", "86400"))
+CACHE_TOKEN_INFO_MAX_AGE = int(os.getenv("CACHE_TOKEN_INFO_MAX_AGE", "3600"))
+CACHE_TX_FINAL_MAX_AGE = int(os.getenv("CACHE_TX_FINAL_MAX_AGE", "86400"))
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+# ====================== HEADER ======================
+def cache_headers(headers, max_age: int, last_modified: float | None = None):
+    """Cache-Control public (+ Last-Modified) di headers response / Response"""
+    headers["Cache-Control"] = f"public, max-age={max(0, int(max_age))}"
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(min(last_modified, time.time()), usegmt=True)
+
+
+def no_store(headers):
+    headers["Cache-Control"] = "no-store"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match dibandingkan lemah (W/ diabaikan), sesuai RFC 9110 untuk GET"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def not_modified_since(if_modified_since: str | None, last_modified: str | None) -> bool:
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_fresh(request_headers: Headers, etag: str, last_modified: str | None) -> bool:
+    # If-None-Match menang kalau ada, If-Modified-Since hanya dipakai tanpa itu
+    if "if-none-match" in request_headers:
+        return etag_matches(request_headers["if-none-match"], etag)
+    return not_modified_since(request_headers.get("if-modified-since"), last_modified)
+
+
+# ====================== MIDDLEWARE ======================
+class HTTPCacheMiddleware:
+    """
+    ASGI: response 200 GET/HEAD dengan Cache-Control public → body di-buffer,
+    ETag = sha256 body (kalau route belum set), lalu 304 tanpa body kalau
+    request kondisional cocok. Response lain (no-store, non-200) lewat apa adanya.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in CACHEABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] == 200 and "public" in headers.get("cache-control", ""):
+                    start = message
+                    return
+                await send(message)
+                return
+
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start["headers"])
+            etag = headers.get("etag")
+            if etag is None:
+                etag = f'"{hashlib.sha256(body).hexdigest()[:20]}"'
+                headers["ETag"] = etag
+            if _is_fresh(request_headers, etag, headers.get("last-modified")):
+                for name in ("content-length", "content-type", "content-encoding"):
+                    if name in headers:
+                        del headers[name]
+                await send({**start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,57 @@
+# 📍 lib/json_response.py
+import json
+from decimal import Decimal
+from collections.abc import Mapping
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# ====================== KONVERSI TIPE CHAIN ======================
+# orjson menulis dict / list / str / int / float langsung di C dan hanya
+# memanggil json_default untuk tipe yang tidak dikenalnya, jadi receipt web3
+# (AttributeDict + HexBytes), objek solders dan Decimal tronpy dikonversi
+# dalam satu kali jalan tanpa jsonable_encoder.
+
+
+def json_default(value):
+    # HexBytes (hash, topic, data log) → "0x…" seperti Web3.to_json
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    # AttributeDict web3 (receipt, log, tx)
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # amount tronpy / from_wei
+    if isinstance(value, Decimal):
+        return float(value)
+    # solders: Pubkey / Signature / Hash (punya from_string) → base58,
+    # struct lain (error tx, meta) lewat to_json()
+    if type(value).__module__.startswith("solders"):
+        to_json = getattr(value, "to_json", None)
+        if hasattr(type(value), "from_string") or to_json is None:
+            return str(value)
+        return json.loads(to_json())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content) -> bytes:
+    try:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # int > 64-bit (wei, uint256) tidak didukung orjson → jalur stdlib
+        return json.dumps(
+            content,
+            default=json_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+# ====================== RESPONSE ======================
+class OrjsonResponse(JSONResponse):
+    """Default response class app: JSONResponse dengan encoder orjson + json_default"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
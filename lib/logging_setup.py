@@ -0,0 +1,223 @@
+# 📍 lib/logging_setup.py
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# ====================== KONFIGURASI ======================
+# LOG_LEVEL   : level root logger (default INFO)
+# LOG_FORMAT  : "json" (default) atau "text"
+# LOG_SAMPLE  : sampling per logger untuk log INFO/DEBUG yang ramai, contoh
+#               "routers.crypto.price=0.1,lib.balance_checker=0.05"
+#               (WARNING ke atas selalu lolos)
+# LOG_QUEUE_SIZE : batas antrian; kalau penuh, log INFO dibuang dan WARNING ke atas
+#                  menggeser record tertua (tidak pernah nge-block loop), jumlah
+#                  yang dibuang ada di /diagnostics/upstreams (logging)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# 🔹 Default sampling untuk log per-request yang paling ramai
+DEFAULT_SAMPLE_RATES = {
+    "routers.crypto.ping": 0.01,
+    "routers.crypto.price": 0.1,
+    "routers.crypto.balance": 0.1,
+    "lib.balance_checker": 0.1,
+    "lib.coingecko": 0.1,
+}
+# 🔹 Logger library pihak ketiga yang log INFO tiap request
+QUIET_LOGGERS = {"httpx": logging.WARNING, "httpcore": logging.WARNING}
+
+_listener: QueueListener | None = None
+_lock = threading.Lock()
+
+
+def _parse_sample_rates(raw: str) -> dict[str, float]:
+    rates = dict(DEFAULT_SAMPLE_RATES)
+    for item in raw.split(","):
+        name, _, rate = item.partition("=")
+        if name.strip() and rate.strip():
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+# ====================== FORMATTER ======================
+class JSONFormatter(logging.Formatter):
+    """Satu record = satu baris JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+# ====================== SAMPLING ======================
+class SamplingFilter(logging.Filter):
+    """
+    Loloskan 1 dari N record INFO/DEBUG per logger (N = 1/rate).
+    Deterministik (counter), jadi log yang lolos tersebar rata.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name: str) -> float:
+        # cocokkan nama logger atau parent-nya (lib.helpers.usdt → lib.helpers)
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        every = round(1 / rate)
+        with self._lock:
+            count = self._counters.get(record.name, 0)
+            self._counters[record.name] = count + 1
+        return count % every == 0
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler yang tidak pernah nge-block: antrian penuh → log INFO dibuang,
+    WARNING ke atas membuang record tertua supaya tetap masuk
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # render message + traceback di sini (args bisa objek yang berubah nanti),
+        # format akhir (JSON / text) dikerjakan thread listener
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        # tetap put_nowait: sink lambat tidak boleh menahan event loop
+        self.dropped += 1
+        if record.levelno < logging.WARNING:
+            return
+        try:
+            self.queue.get_nowait()
+            self.queue.put_nowait(record)
+        except (queue.Empty, queue.Full):
+            pass
+
+
+# ====================== SETUP ======================
+def setup_logging():
+    """
+    Pasang logging terpusat (idempotent): semua logger → QueueHandler,
+    tulis ke stderr dilakukan thread QueueListener, bukan event loop.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return
+
+        stream_handler = logging.StreamHandler(sys.stderr)
+        if LOG_FORMAT == "json":
+            stream_handler.setFormatter(JSONFormatter())
+        else:
+            stream_handler.setFormatter(
+                logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+            )
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        queue_handler = _DroppingQueueHandler(log_queue)
+        # sampling dicek sebelum record di-format & masuk antrian
+        queue_handler.addFilter(
+            SamplingFilter(_parse_sample_rates(os.getenv("LOG_SAMPLE", "")))
+        )
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(LOG_LEVEL)
+        for name, level in QUIET_LOGGERS.items():
+            logging.getLogger(name).setLevel(level)
+
+        # uvicorn/gunicorn punya handler sendiri → arahkan ke root juga
+        for name in ("uvicorn", "uvicorn.error", "uvicorn.access", "gunicorn.error"):
+            uv_logger = logging.getLogger(name)
+            uv_logger.handlers = []
+            uv_logger.propagate = True
+
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def restart_after_fork():
+    """
+    Thread listener tidak ikut ter-fork: worker dari master yang sudah preload
+    butuh antrian + listener sendiri (antrian lama bisa saja terkunci saat fork).
+    """
+    global _listener, _lock
+    _lock = threading.Lock()
+    if _listener is None:
+        return
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, QueueHandler):
+            handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def logging_snapshot() -> dict:
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _DroppingQueueHandler):
+            return {
+                "queued": handler.queue.qsize(),
+                "max_queue": handler.queue.maxsize,
+                "dropped": handler.dropped,
+            }
+    return {}
+
+
+def shutdown_logging():
+    """Flush sisa antrian log (dipanggil saat proses berhenti)"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
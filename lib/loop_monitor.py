@@ -0,0 +1,119 @@
+# 📍 lib/loop_monitor.py
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import deque
+from lib.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# LOOP_MONITOR_INTERVAL    : jeda antar pengukuran lag (detik), selalu aktif
+# LOOP_WATCHDOG            : "1" → thread watchdog ambil stack event loop saat
+#                            ada callback yang menahan loop > LOOP_BLOCK_THRESHOLD_MS
+#                            (untuk debug & benchmark, bukan default produksi)
+# LOOP_BLOCK_THRESHOLD_MS  : batas "loop blocked" (default 100ms)
+MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.5"))
+WATCHDOG_ENABLED = os.getenv("LOOP_WATCHDOG", "0") == "1"
+BLOCK_THRESHOLD = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100")) / 1000
+HEARTBEAT_SECONDS = min(0.02, BLOCK_THRESHOLD / 4)
+
+# 🔹 blocking terakhir yang tertangkap watchdog (untuk /diagnostics)
+_recent_blocks: deque = deque(maxlen=20)
+_state = {"last_beat": 0.0, "pending": None, "max_lag": 0.0, "blocks": 0}
+_lock = threading.Lock()
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ====================== LAG ======================
+async def loop_lag_loop():
+    """Ukur selisih jadwal timer vs kenyataan → histogram crypto_api_event_loop_lag_seconds"""
+    if WATCHDOG_ENABLED:
+        _start_watchdog(asyncio.get_running_loop())
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(MONITOR_INTERVAL)
+        lag = max(0.0, time.perf_counter() - start - MONITOR_INTERVAL)
+        EVENT_LOOP_LAG.observe(lag)
+        _state["max_lag"] = max(_state["max_lag"], lag)
+
+
+# ====================== WATCHDOG ======================
+def _start_watchdog(loop: asyncio.AbstractEventLoop):
+    loop_thread = threading.get_ident()
+    _state["last_beat"] = time.monotonic()
+
+    def beat():
+        now = time.monotonic()
+        with _lock:
+            pending, _state["pending"] = _state["pending"], None
+            blocked_for = now - _state["last_beat"] - HEARTBEAT_SECONDS
+            _state["last_beat"] = now
+        if pending is not None:
+            _report_block(pending, blocked_for)
+        loop.call_later(HEARTBEAT_SECONDS, beat)
+
+    def watch():
+        while not loop.is_closed():
+            time.sleep(HEARTBEAT_SECONDS)
+            with _lock:
+                stalled = time.monotonic() - _state["last_beat"] - HEARTBEAT_SECONDS
+                if stalled < BLOCK_THRESHOLD or _state["pending"] is not None:
+                    continue
+                frame = sys._current_frames().get(loop_thread)
+                if frame is None:
+                    continue
+                # stack diambil saat loop masih tertahan → kelihatan siapa pelakunya
+                _state["pending"] = traceback.extract_stack(frame)
+
+    loop.call_soon(beat)
+    threading.Thread(target=watch, name="loop-watchdog", daemon=True).start()
+    logger.info(
+        "🐕 Loop watchdog aktif (threshold %.0fms)", BLOCK_THRESHOLD * 1000
+    )
+
+
+def _culprit(stack: traceback.StackSummary) -> str:
+    """Frame terdalam milik kode repo ini (bukan stdlib / site-packages), kalau ada"""
+    for frame in reversed(stack):
+        if frame.filename.startswith(ROOT) and "site-packages" not in frame.filename:
+            return f"{frame.name} ({os.path.relpath(frame.filename, ROOT)}:{frame.lineno})"
+    last = stack[-1]
+    return f"{last.name} ({os.path.basename(last.filename)}:{last.lineno})"
+
+
+def _report_block(stack: traceback.StackSummary, blocked_for: float):
+    EVENT_LOOP_BLOCKS.inc()
+    _state["blocks"] += 1
+    culprit = _culprit(stack)
+    _recent_blocks.append(
+        {
+            "at": time.time(),
+            "blocked_ms": round(blocked_for * 1000, 1),
+            "culprit": culprit,
+            "stack": [
+                f"{f.filename}:{f.lineno} {f.name}" for f in stack[-15:]
+            ],
+        }
+    )
+    logger.warning(
+        "🐢 Event loop tertahan %.0fms oleh %s\n%s",
+        blocked_for * 1000,
+        culprit,
+        "".join(traceback.format_list(stack[-15:])),
+    )
+
+
+def loop_monitor_snapshot() -> dict:
+    return {
+        "watchdog": WATCHDOG_ENABLED,
+        "threshold_ms": BLOCK_THRESHOLD * 1000,
+        "max_lag_ms": round(_state["max_lag"] * 1000, 1),
+        "blocks": _state["blocks"],
+        "recent_blocks": list(_recent_blocks),
+    }
@@ -0,0 +1,158 @@
+# 📍 lib/metrics.py
+import os
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from lib.request_accounting import record_call
+from lib.tracing import start_span
+
+# ====================== KONFIGURASI ======================
+# Di gunicorn (4 worker) PROMETHEUS_MULTIPROC_DIR diset oleh gunicorn.conf.py,
+# tiap worker tulis nilai ke file mmap dan /metrics menggabungkan semuanya.
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+# host RPC dari rpc_url user bisa apa saja → batasi jumlah label unik
+MAX_HOST_LABELS = int(os.getenv("METRICS_MAX_HOST_LABELS", "50"))
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# ====================== METRIK ======================
+HTTP_REQUEST_SECONDS = Histogram(
+    "crypto_api_request_duration_seconds",
+    "Latency request API per route",
+    ["route", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_IN_FLIGHT = Gauge(
+    "crypto_api_requests_in_flight",
+    "Request API yang sedang diproses",
+    multiprocess_mode="livesum",
+)
+UPSTREAM_SECONDS = Histogram(
+    "crypto_api_upstream_duration_seconds",
+    "Latency call keluar per upstream host & method RPC/API",
+    ["upstream", "method", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "crypto_api_upstream_in_flight",
+    "Call keluar yang sedang berjalan per upstream host",
+    ["upstream"],
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG = Histogram(
+    "crypto_api_event_loop_lag_seconds",
+    "Keterlambatan event loop (timer dijadwalkan vs benar-benar jalan)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "crypto_api_event_loop_blocked_total",
+    "Callback yang menahan event loop lebih lama dari LOOP_BLOCK_THRESHOLD_MS",
+)
+CACHE_REQUESTS = Counter(
+    "crypto_api_cache_requests_total",
+    "Lookup cache per hasil (hit / stale / miss / negative); hit ratio = hit / total",
+    ["cache", "result"],
+)
+
+_hosts: set[str] = set()
+_hosts_lock = threading.Lock()
+
+
+def host_label(url_or_host: str) -> str:
+    """Host upstream sebagai label, maksimal MAX_HOST_LABELS host unik per worker"""
+    host = urlparse(url_or_host).hostname or url_or_host
+    with _hosts_lock:
+        if host in _hosts:
+            return host
+        if len(_hosts) < MAX_HOST_LABELS:
+            _hosts.add(host)
+            return host
+    return "other"
+
+
+@contextmanager
+def track_upstream(upstream: str, method: str, chain: str | None = None):
+    """Catat durasi + hasil satu call keluar (sync maupun di dalam coroutine) + span client"""
+    in_flight = UPSTREAM_IN_FLIGHT.labels(upstream)
+    in_flight.inc()
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        with start_span(
+            f"{upstream} {method}",
+            kind="client",
+            chain=chain,
+            **{"net.peer.name": upstream, "rpc.method": method},
+        ):
+            yield
+    except BaseException as e:
+        # CancelledError = kalah hedging / request dibatalkan, bukan error upstream
+        outcome = "cancelled" if isinstance(e, asyncio.CancelledError) else "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        in_flight.dec()
+        UPSTREAM_SECONDS.labels(upstream, method, outcome).observe(elapsed)
+        # akumulator per request (Server-Timing)
+        record_call(upstream, method, elapsed, outcome)
+
+
+def record_cache(cache: str, result: str):
+    CACHE_REQUESTS.labels(cache, result).inc()
+
+
+# ====================== MIDDLEWARE ======================
+class MetricsMiddleware:
+    """Middleware ASGI: latency per route template (bukan path mentah) + in-flight"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                getattr(route, "path", "unmatched"), scope["method"], str(status)
+            ).observe(time.perf_counter() - start)
+
+
+# ====================== EXPORT ======================
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROC_DIR:
+        # gabungkan nilai semua worker gunicorn
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
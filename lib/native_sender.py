@@ -1,26 +1,14 @@
 # 📍 lib/native_sender.py
 import logging
 import inspect
-from lib.solana_helper import send_sol
-from lib.bnb_helper import send_bnb
-from lib.eth_helper import send_eth
-from lib.base_helper import send_base
-from lib.polygon_helper import send_polygon
-from lib.trx_helper import send_trx  # ✅ import TRX helper
+from lib.chains import chain_function
+from lib.rpc_pool import resolve_rpc_url
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
-# Mapping helper hanya untuk native token
-TOKEN_HELPERS = {
-    "sol": send_sol,
-    "bnb": send_bnb,
-    "eth": send_eth,
-    "base": send_base,
-    "polygon": send_polygon,
-    "trx": send_trx,  # ✅ tambah TRX
-}
-
 
+@traced("send_token")
 async def send_token(
     token: str,
     destination_wallet: str,
@@ -31,9 +19,12 @@ async def send_token(
     """
     Kirim native token ke wallet tujuan.
     Semua native token pakai rpc_url & private_key dari endpoint
+    (private_key: string mentah atau Signer resident dari key_alias)
     """
     token_lower = token.lower()
-    send_func = TOKEN_HELPERS.get(token_lower)
+    # helper native per chain (lib/chains.py REGISTRY["send_native"]), import lazy
+    send_func = chain_function("send_native", token_lower)
+    rpc_url = resolve_rpc_url(token_lower, rpc_url)
 
     if not send_func:
         logger.error(f"❌ Token {token} belum didukung!")
@@ -0,0 +1,109 @@
+# 📍 lib/openapi_static.py
+import os
+import gzip
+import json
+import hashlib
+import logging
+
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+
+from lib.http_cache import etag_matches
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Skema OpenAPI dibuat saat build (python scripts/build_openapi.py → openapi.json),
+# dimuat sekali per proses sebagai bytes jadi + versi gzip, lalu /openapi.json,
+# /docs dan /redoc disajikan dengan ETag + Cache-Control panjang (304 kalau
+# If-None-Match cocok). File hilang / versinya beda dengan app → skema dibuat
+# dari app saat start (dengan warning), bukan per request.
+OPENAPI_PATH = os.getenv(
+    "OPENAPI_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "openapi.json"),
+)
+OPENAPI_MAX_AGE = int(os.getenv("OPENAPI_MAX_AGE", "86400"))
+
+
+def serialize_schema(schema: dict) -> bytes:
+    """Format bytes openapi.json (dipakai build script & fallback, harus identik)"""
+    return json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# ====================== ASET STATIS ======================
+class StaticAsset:
+    """Body yang sudah jadi: bytes asli + gzip + ETag per representasi"""
+
+    def __init__(self, body: bytes, media_type: str):
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        self.media_type = media_type
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+    def response(self, request: Request) -> Response:
+        use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+        etag = self.gzip_etag if use_gzip else self.etag
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={OPENAPI_MAX_AGE}",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_body, media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
+
+
+# ====================== LOAD ======================
+def load_schema_bytes(app: FastAPI) -> bytes:
+    try:
+        with open(OPENAPI_PATH, "rb") as f:
+            body = f.read()
+        info = json.loads(body).get("info", {})
+        if info.get("title") == app.title and info.get("version") == app.version:
+            return body
+        logger.warning(
+            "⚠️ %s basi (%s %s, app %s %s), jalankan scripts/build_openapi.py",
+            OPENAPI_PATH, info.get("title"), info.get("version"), app.title, app.version,
+        )
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️ Gagal baca %s (%s), jalankan scripts/build_openapi.py", OPENAPI_PATH, e)
+    return serialize_schema(app.openapi())
+
+
+def install(app: FastAPI):
+    """
+    Ganti /openapi.json, /docs, /redoc bawaan FastAPI dengan aset statis.
+    App harus dibuat dengan openapi_url/docs_url/redoc_url=None, dipanggil
+    setelah semua router terdaftar.
+    """
+    schema = StaticAsset(load_schema_bytes(app), "application/json")
+    swagger = StaticAsset(
+        get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI").body,
+        "text/html",
+    )
+    redoc = StaticAsset(
+        get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc").body,
+        "text/html",
+    )
+
+    @app.get("/openapi.json", include_in_schema=False)
+    async def openapi_json(request: Request):
+        return schema.response(request)
+
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_docs(request: Request):
+        return swagger.response(request)
+
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc_docs(request: Request):
+        return redoc.response(request)
+
+    logger.info(
+        "📄 OpenAPI statis: %d byte (gzip %d), ETag %s",
+        len(schema.body), len(schema.gzip_body), schema.etag,
+    )
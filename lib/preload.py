@@ -0,0 +1,174 @@
+# 📍 lib/preload.py
+import gc
+import os
+import time
+import asyncio
+import logging
+
+from lib.chains import chain_enabled, loaded_families, preload_families
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# PRELOAD_APP=1 (gunicorn.conf.py) → master import main + warm_master() sebelum
+# fork, worker berbagi SDK / ABI codec / registry token / signer hot wallet /
+# aset OpenAPI lewat copy-on-write. gc.freeze() memindahkan semua objek master ke generasi permanen
+# supaya GC worker tidak menyentuh (dan menyalin) halaman memori itu.
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+ZERO_EVM = "0x0000000000000000000000000000000000000000"
+ZERO_TRX = "T9yD14Nj9j7xAB4dbGeiX9h8unkKHxuWwb"
+
+_state = {"preloaded": False, "warm_seconds": None, "boot_seconds": None}
+
+
+# ====================== WARM-UP MASTER ======================
+def _warm_abi_codecs():
+    """Encoder/decoder eth_abi & kelas kontrak ERC20/TRC20 dibangun sekali di master"""
+    if chain_enabled("eth"):
+        from web3 import Web3
+        from lib.helpers.usdt.eth import ERC20_ABI
+
+        contract = Web3().eth.contract(address=ZERO_EVM, abi=ERC20_ABI)
+        contract.encode_abi("transfer", args=[ZERO_EVM, 1])
+        contract.encode_abi("balanceOf", args=[ZERO_EVM])
+        Web3().codec.decode(["uint256"], b"\0" * 32)
+    if chain_enabled("trx"):
+        from tronpy.abi import trx_abi
+
+        trx_abi.encode(["address", "uint256"], [ZERO_TRX, 1])
+        trx_abi.decode(["uint256"], b"\0" * 32)
+
+
+def warm_chains():
+    """SDK + helper keluarga chain yang aktif, lalu ABI codec (dipakai juga lib/warmup)"""
+    preload_families()
+    _warm_abi_codecs()
+
+
+def _warm_registries():
+    """Snapshot coin index & metadata token (kalau ada di disk) dimuat sekali untuk semua worker"""
+    from lib import coin_index, token_metadata
+
+    coin_index.load_snapshot()
+    token_metadata.load_snapshot()
+
+
+def _warm_upstream_caches():
+    """
+    Harga & metadata token diambil sekali di master (maks WARMUP_TIMEOUT): worker
+    mewarisi cache yang masih segar, langkah warm-up-nya tidak menembak CoinGecko
+    lagi (kuota tidak dikali jumlah worker)
+    """
+    from lib.warmup import WARMUP_TIMEOUT
+    from lib.price_store import warm_prices
+    from lib.token_metadata import warm_token_metadata, save_snapshot
+
+    async def warm():
+        await asyncio.wait_for(
+            asyncio.gather(warm_prices(), warm_token_metadata()), WARMUP_TIMEOUT
+        )
+
+    try:
+        asyncio.run(warm())
+    except Exception as e:
+        # worker tetap warm-up sendiri untuk yang belum segar
+        logger.warning("⚠️ Warm-up harga/metadata di master gagal: %s", e)
+    # snapshot tertunda (debounce) ikut hilang bersama loop → tulis sekarang
+    save_snapshot()
+
+
+def warm_master():
+    """
+    Dipanggil di master gunicorn (when_ready) sebelum worker di-fork:
+    SDK chain aktif, ABI codec, registry token, harga & metadata token,
+    signer (dekripsi keystore sekali untuk semua worker), lalu gc.freeze().
+    Aset OpenAPI statis sudah dimuat saat import main.
+    """
+    from lib.signer_registry import load_signers
+
+    start = time.perf_counter()
+    warm_chains()
+    _warm_registries()
+    _warm_upstream_caches()
+    load_signers()
+    gc.collect()
+    gc.freeze()
+    _state["preloaded"] = True
+    _state["warm_seconds"] = time.perf_counter() - start
+    logger.info(
+        "🔥 Preload master: %.0fms, keluarga chain %s, %d objek dibekukan",
+        _state["warm_seconds"] * 1000,
+        ",".join(loaded_families()) or "-",
+        gc.get_freeze_count(),
+    )
+
+
+# ====================== SETELAH FORK ======================
+def after_fork():
+    """
+    post_fork gunicorn: thread (listener log, exporter span) tidak ikut ter-fork,
+    dan client HTTP tidak boleh berbagi socket dengan master → dibuat ulang.
+    Sisanya (modul, ABI, registry) tetap dipakai bersama.
+    """
+    from lib import logging_setup, tracing, rpc_pool
+
+    logging_setup.restart_after_fork()
+    tracing.restart_after_fork()
+    rpc_pool.reset_clients()
+
+
+# ====================== LAPORAN ======================
+def _process_age() -> float | None:
+    """Detik sejak proses ini dibuat (fork / exec), dari /proc"""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rpartition(")")[2].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime - start_ticks / CLOCK_TICKS
+
+
+def mark_ready():
+    """Dipanggil lifespan saat worker siap melayani → boot time worker"""
+    _state["boot_seconds"] = _process_age()
+
+
+def _memory_kb() -> dict:
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty", "Shared_Clean", "Shared_Dirty"):
+                    fields[name] = int(value.split()[0])
+    except OSError:
+        pass
+    return fields
+
+
+def preload_snapshot() -> dict:
+    memory = _memory_kb()
+    return {
+        "pid": os.getpid(),
+        "preloaded": _state["preloaded"],
+        "master_warm_ms": (
+            round(_state["warm_seconds"] * 1000)
+            if _state["warm_seconds"] is not None
+            else None
+        ),
+        "boot_ms": (
+            round(_state["boot_seconds"] * 1000)
+            if _state["boot_seconds"] is not None
+            else None
+        ),
+        "gc_frozen_objects": gc.get_freeze_count(),
+        "rss_mb": round(memory["Rss"] / 1024, 1) if "Rss" in memory else None,
+        "pss_mb": round(memory["Pss"] / 1024, 1) if "Pss" in memory else None,
+        "private_mb": (
+            round((memory["Private_Clean"] + memory["Private_Dirty"]) / 1024, 1)
+            if "Private_Dirty" in memory
+            else None
+        ),
+    }
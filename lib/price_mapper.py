@@ -1,6 +1,6 @@
 # 📍 lib/price_mapper.py
 import logging
-import httpx
+from lib.price_store import get_price_quote
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +23,16 @@ async def get_token_amount(chain: str, nominal_idr: int) -> float:
         logger.error(f"❌ Chain/token {chain} tidak dikenali")
         return 0
 
-    url = f"https://api.coingecko.com/api/v3/simple/price?ids={token_id}&vs_currencies=idr"
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
-            price_idr = data.get(token_id, {}).get("idr")
-            if not price_idr:
-                logger.error(f"❌ Gagal ambil harga {chain.upper()} dari API CoinGecko")
-                return 0
-            amount = nominal_idr / price_idr
-            amount = round(amount, 6)
-            logger.info(f"💰 Nominal {nominal_idr} IDR = {amount} {chain.upper()} (harga {price_idr} IDR/{chain.upper()})")
-            return amount
+        quote = await get_price_quote(token_id)
+        price_idr = quote["idr"] if quote else None
+        if not price_idr:
+            logger.error(f"❌ Gagal ambil harga {chain.upper()} dari API CoinGecko")
+            return 0
+        amount = nominal_idr / price_idr
+        amount = round(amount, 6)
+        logger.info("💰 Nominal %s IDR = %s %s (harga %s IDR/%s)", nominal_idr, amount, chain.upper(), price_idr, chain.upper())
+        return amount
     except Exception as e:
         logger.exception(f"❌ Error ambil harga {chain.upper()} realtime: {e}")
         return 0
@@ -51,5 +47,5 @@ async def get_locked_token_amount(chain: str, nominal_idr: int) -> float:
     base_amount = await get_token_amount(chain, nominal_idr)
     locked_amount = base_amount * 0.99  # contoh fee 1% untuk locked
     locked_amount = round(locked_amount, 6)
-    logger.info(f"🔒 Locked token {chain.upper()}: {locked_amount} dari nominal {base_amount}")
+    logger.info("🔒 Locked token %s: %s dari nominal %s", chain.upper(), locked_amount, base_amount)
     return locked_amount
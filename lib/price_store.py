@@ -0,0 +1,223 @@
+# 📍 lib/price_store.py
+import os
+import json
+import time
+import random
+import tempfile
+import asyncio
+import logging
+from lib.coingecko import coingecko_get, CoinGeckoError, TOKEN_MAP
+from lib.upstream_guard import UpstreamUnavailable
+from lib.metrics import record_cache
+from lib.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Last-known-good price store (stale-while-revalidate):
+# - harga masih segar (< PRICE_FRESH_SECONDS) → langsung dari memori
+# - harga basi (< PRICE_MAX_STALE_SECONDS) → disajikan dulu + refresh di background
+# - belum ada / terlalu basi → tunggu refresh (single-flight, 1 request untuk semua caller)
+# - coin yang tidak dapat quote di refresh terakhir → cache negatif PRICE_NEGATIVE_SECONDS,
+#   request berikutnya tidak memicu refresh lagi sampai TTL-nya lewat
+# Opsional disimpan ke disk (PRICE_STORE_PATH) supaya restart tidak mulai dari kosong.
+FRESH_SECONDS = float(os.getenv("PRICE_FRESH_SECONDS", "60"))
+MAX_STALE_SECONDS = float(os.getenv("PRICE_MAX_STALE_SECONDS", "86400"))
+NEGATIVE_SECONDS = float(os.getenv("PRICE_NEGATIVE_SECONDS", "300"))
+STORE_PATH = os.getenv("PRICE_STORE_PATH")
+REFRESH_RETRIES = int(os.getenv("PRICE_REFRESH_RETRIES", "3"))
+VS_CURRENCIES = ("idr", "usd")
+
+# 🔹 {coin_id: {"idr": float, "usd": float, "fetched_at": epoch}}
+_prices: dict[str, dict] = {}
+# 🔹 coin_id yang ikut di-refresh (1 request /simple/price untuk semuanya)
+_tracked_ids: set[str] = set(TOKEN_MAP.values())
+# 🔹 {coin_id: epoch} → coin yang di-track tapi tidak ada quote-nya di refresh terakhir
+_missing: dict[str, float] = {}
+_refresh_task: asyncio.Task | None = None
+
+
+# ====================== PERSISTENSI ======================
+def _load_store():
+    if not STORE_PATH or not os.path.exists(STORE_PATH):
+        return
+    try:
+        with open(STORE_PATH) as f:
+            data = json.load(f)
+        # harga di memori yang lebih baru tidak ditimpa
+        _prices.update(
+            (coin_id, price)
+            for coin_id, price in data.items()
+            if coin_id not in _prices
+            or price["fetched_at"] > _prices[coin_id]["fetched_at"]
+        )
+        _tracked_ids.update(data)
+        logger.info(f"💾 {len(data)} harga terakhir dimuat dari {STORE_PATH}")
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal load price store {STORE_PATH}: {e}")
+
+
+def _save_store(prices: dict):
+    """Ditulis ke file temp unik per call: worker lain bisa menyimpan bersamaan"""
+    if not STORE_PATH:
+        return
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(STORE_PATH) or ".",
+            prefix=f"{os.path.basename(STORE_PATH)}.",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(prices, f)
+        os.replace(tmp_path, STORE_PATH)
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal simpan price store {STORE_PATH}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+_load_store()
+
+
+# ====================== REFRESH ======================
+async def _refresh():
+    """Ambil harga semua coin yang di-track dalam satu request, retry dengan backoff"""
+    coin_ids = sorted(_tracked_ids)
+    params = {
+        "ids": ",".join(coin_ids),
+        "vs_currencies": ",".join(VS_CURRENCIES),
+    }
+    for attempt in range(1, REFRESH_RETRIES + 1):
+        try:
+            with start_span("price refresh", attempt=attempt, coins=len(_tracked_ids)):
+                data = await coingecko_get("/simple/price", params=params, timeout=5)
+            break
+        except UpstreamUnavailable as e:
+            # breaker open / limiter penuh → jangan retry, pakai harga lama
+            logger.warning(f"⚠️ {e}, refresh harga dilewati")
+            return
+        except Exception as e:
+            if attempt == REFRESH_RETRIES:
+                logger.error(f"❌ Refresh harga gagal setelah {attempt} attempt: {e}")
+                return
+            if isinstance(e, CoinGeckoError) and e.status < 500 and e.status != 429:
+                logger.error(f"❌ Refresh harga ditolak CoinGecko: {e}")
+                return
+            backoff = (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+            logger.warning(
+                f"⚠️ Refresh harga attempt {attempt} gagal ({e}), retry in {backoff:.2f}s"
+            )
+            await asyncio.sleep(backoff)
+
+    now = time.time()
+    for coin_id in coin_ids:
+        info = data.get(coin_id) or {}
+        quote = {c: info[c] for c in VS_CURRENCIES if info.get(c)}
+        if quote:
+            _prices[coin_id] = {**quote, "fetched_at": now}
+            _missing.pop(coin_id, None)
+        else:
+            _missing[coin_id] = now
+    # json.dump + tulis disk di thread, event loop tetap jalan
+    await asyncio.to_thread(_save_store, dict(_prices))
+
+
+def _negative(coin_id: str, now: float) -> bool:
+    missing_at = _missing.get(coin_id)
+    return missing_at is not None and now - missing_at < NEGATIVE_SECONDS
+
+
+def _ensure_refresh() -> asyncio.Task:
+    """Single-flight: semua caller nunggu task refresh yang sama"""
+    global _refresh_task
+    loop = asyncio.get_running_loop()
+    if (
+        _refresh_task is None
+        or _refresh_task.done()
+        or _refresh_task.get_loop() is not loop
+    ):
+        _refresh_task = loop.create_task(_refresh())
+    return _refresh_task
+
+
+def _quote(coin_id: str, now: float) -> dict | None:
+    price = _prices.get(coin_id)
+    if not price:
+        return None
+    age = now - price["fetched_at"]
+    if age > MAX_STALE_SECONDS:
+        return None
+    return {
+        "coin_id": coin_id,
+        "idr": price.get("idr"),
+        "usd": price.get("usd"),
+        "age_seconds": round(age, 1),
+        "fetched_at": price["fetched_at"],
+        "stale": age > FRESH_SECONDS,
+    }
+
+
+# ====================== API ======================
+async def get_price_quote(coin_id: str) -> dict | None:
+    """
+    Harga coin_id (IDR & USD) + umur datanya.
+    Return None kalau belum pernah dapat harga dan upstream sedang gagal.
+    """
+    newly_tracked = coin_id not in _tracked_ids
+    _tracked_ids.add(coin_id)
+
+    now = time.time()
+    quote = _quote(coin_id, now)
+    if quote and not quote["stale"]:
+        record_cache("price", "hit")
+        return quote
+    negative = _negative(coin_id, now)
+    if quote:
+        # stale-while-revalidate → sajikan harga lama, refresh jalan di background
+        record_cache("price", "stale")
+        if not negative:
+            _ensure_refresh()
+        return quote
+    if negative:
+        record_cache("price", "negative")
+        return None
+
+    record_cache("price", "miss")
+    # shield: caller yang di-cancel tidak ikut membatalkan refresh bersama
+    await asyncio.shield(_ensure_refresh())
+    quote = _quote(coin_id, time.time())
+    if quote is None and newly_tracked and coin_id not in _missing:
+        # refresh yang sedang jalan dimulai sebelum coin ini di-track → ulang sekali
+        await asyncio.shield(_ensure_refresh())
+        quote = _quote(coin_id, time.time())
+    return quote
+
+
+def _all_fresh() -> bool:
+    now = time.time()
+    quotes = [
+        _quote(coin_id, now) for coin_id in _tracked_ids if not _negative(coin_id, now)
+    ]
+    return all(quote and not quote["stale"] for quote in quotes)
+
+
+async def warm_prices():
+    """
+    Startup: harga semua coin yang di-track diisi sebelum worker dinyatakan siap.
+    Masih segar (warisan master / store yang baru ditulis worker lain) → tanpa fetch.
+    """
+    if _all_fresh():
+        return
+    await asyncio.to_thread(_load_store)
+    if _all_fresh():
+        return
+    await asyncio.shield(_ensure_refresh())
+
+
+def price_store_snapshot() -> dict:
+    now = time.time()
+    return {
+        coin_id: round(now - price["fetched_at"], 1)
+        for coin_id, price in _prices.items()
+    }
@@ -0,0 +1,191 @@
+# 📍 lib/profiler.py
+import os
+import sys
+import time
+import asyncio
+import sysconfig
+import threading
+from collections import Counter
+
+# ====================== KONFIGURASI ======================
+# Sampling profiler on-demand untuk worker yang melayani request:
+# - thread sampler: baca stack semua thread (sys._current_frames) tiap interval,
+#   termasuk thread to_thread yang sedang blocking di SDK (web3 / solana / tronpy)
+# - task sampler: jalan di event loop, baca rantai await semua asyncio task
+#   (coroutine yang sedang suspend tidak kelihatan di stack thread)
+# Tidak ada hook sys.setprofile → overhead hanya selama profiling berjalan.
+# Default mati; kalau dinyalakan tetap wajib header X-Admin-Token (lib/admin_auth.py).
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "0") == "1"
+MAX_SECONDS = float(os.getenv("PROFILER_MAX_SECONDS", "30"))
+THREAD_INTERVAL = float(os.getenv("PROFILER_INTERVAL_SECONDS", "0.005"))
+TASK_INTERVAL = float(os.getenv("PROFILER_TASK_INTERVAL_SECONDS", "0.05"))
+
+# 🔹 satu profiling per worker dalam satu waktu
+_busy = threading.Lock()
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+def _frame_label(code) -> tuple[str, str, int]:
+    filename = code.co_filename
+    if filename.startswith(ROOT):
+        filename = os.path.relpath(filename, ROOT)
+    elif filename.startswith(STDLIB) and "site-packages" not in filename:
+        filename = os.path.relpath(filename, STDLIB)
+    else:
+        # site-packages/web3/... → web3/...
+        filename = filename.rpartition("site-packages/")[2]
+    return (code.co_qualname, filename, code.co_firstlineno)
+
+
+def _thread_stack(frame) -> tuple:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _task_stack(task: asyncio.Task) -> tuple:
+    """Rantai await task (luar → dalam): handler → helper → ... → titik suspend"""
+    stack = []
+    coro = task.get_coro()
+    while coro is not None:
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        if code is None:
+            break
+        stack.append(_frame_label(code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return tuple(stack)
+
+
+# ====================== SAMPLER ======================
+def _sample_threads(seconds: float, interval: float, counts: Counter, loop_thread: int):
+    me = threading.get_ident()
+    names = {t.ident: t.name for t in threading.enumerate()}
+    deadline = time.monotonic() + seconds
+    samples = 0
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            if ident not in names:
+                names = {t.ident: t.name for t in threading.enumerate()}
+            name = names.get(ident, f"thread-{ident}")
+            if ident == loop_thread:
+                name = f"{name} (event loop)"
+            counts[(name, _thread_stack(frame))] += 1
+        samples += 1
+        time.sleep(interval)
+    return samples
+
+
+async def profile(seconds: float) -> dict:
+    """
+    Profiling worker ini selama `seconds`. Hasil: hitungan stack per thread
+    dan per rantai await asyncio task, plus metadata sampling.
+    """
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusy("Profiling lain sedang berjalan di worker ini")
+    try:
+        seconds = max(0.1, min(seconds, MAX_SECONDS))
+        thread_counts: Counter = Counter()
+        task_counts: Counter = Counter()
+        started = time.time()
+        current = asyncio.current_task()
+
+        thread_job = asyncio.create_task(
+            asyncio.to_thread(
+                _sample_threads,
+                seconds,
+                THREAD_INTERVAL,
+                thread_counts,
+                threading.get_ident(),
+            )
+        )
+        task_samples = 0
+        while not thread_job.done():
+            for task in asyncio.all_tasks():
+                if task is current or task is thread_job:
+                    continue
+                stack = _task_stack(task)
+                if stack:
+                    task_counts[("asyncio tasks", stack)] += 1
+            task_samples += 1
+            await asyncio.sleep(TASK_INTERVAL)
+        thread_samples = await thread_job
+
+        return {
+            "pid": os.getpid(),
+            "started_at": started,
+            "seconds": seconds,
+            "thread_interval": THREAD_INTERVAL,
+            "task_interval": TASK_INTERVAL,
+            "thread_samples": thread_samples,
+            "task_samples": task_samples,
+            "threads": thread_counts,
+            "tasks": task_counts,
+        }
+    finally:
+        _busy.release()
+
+
+# ====================== FORMAT OUTPUT ======================
+def to_collapsed(result: dict) -> str:
+    """Format collapsed stack (flamegraph.pl / speedscope / inferno)"""
+    lines = []
+    for counts in (result["threads"], result["tasks"]):
+        for (group, stack), count in counts.most_common():
+            frames = ";".join(f"{name} ({path}:{line})" for name, path, line in stack)
+            lines.append(f"{group};{frames} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def to_speedscope(result: dict) -> dict:
+    """File format speedscope: satu profile 'sampled' per thread + satu untuk asyncio task"""
+    frames: list[dict] = []
+    frame_index: dict[tuple, int] = {}
+    profiles: dict[str, dict] = {}
+
+    for counts, interval in (
+        (result["threads"], result["thread_interval"]),
+        (result["tasks"], result["task_interval"]),
+    ):
+        for (group, stack), count in counts.items():
+            profile_entry = profiles.setdefault(
+                group,
+                {
+                    "type": "sampled",
+                    "name": group,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            indexes = []
+            for label in stack:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append({"name": label[0], "file": label[1], "line": label[2]})
+                indexes.append(frame_index[label])
+            weight = count * interval
+            profile_entry["samples"].append(indexes)
+            profile_entry["weights"].append(weight)
+            profile_entry["endValue"] += weight
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": f"crypto-api pid {result['pid']} ({result['seconds']}s)",
+        "exporter": "lib.profiler",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": list(profiles.values()),
+    }
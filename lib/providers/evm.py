@@ -0,0 +1,76 @@
+# 📍 lib/providers/evm.py
+import time
+import asyncio
+from web3 import Web3, AsyncHTTPProvider
+from lib.rpc_pool import REQUEST_TIMEOUT, EndpointStats
+from lib.metrics import host_label, track_upstream
+
+# Provider terlacak web3, di-import rpc_pool saat client EVM pertama dibuat
+
+
+def _chain_id_response(chain_id: int) -> dict:
+    return {"jsonrpc": "2.0", "id": 0, "result": hex(chain_id)}
+
+
+def _remember_chain_id(stats: EndpointStats, method, response: dict):
+    if method == "eth_chainId" and isinstance(response.get("result"), str):
+        stats.chain_id = int(response["result"], 16)
+
+
+class TrackedHTTPProvider(Web3.HTTPProvider):
+    """HTTPProvider web3 yang mencatat latency & error tiap round trip"""
+
+    def __init__(self, endpoint_uri: str, stats: EndpointStats):
+        super().__init__(endpoint_uri, request_kwargs={"timeout": REQUEST_TIMEOUT})
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+
+    def make_request(self, method, params):
+        # chain id tidak berubah per endpoint → cukup 1 round trip per URL
+        if method == "eth_chainId" and self._stats.chain_id is not None:
+            return _chain_id_response(self._stats.chain_id)
+        response = super().make_request(method, params)
+        _remember_chain_id(self._stats, method, response)
+        return response
+
+    def _make_request(self, method, request_data: bytes) -> bytes:
+        start = time.perf_counter()
+        try:
+            with track_upstream(self._upstream, str(method), self._stats.chain):
+                raw = super()._make_request(method, request_data)
+        except Exception:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        return raw
+
+
+class TrackedAsyncHTTPProvider(AsyncHTTPProvider):
+    """Versi async dari TrackedHTTPProvider (dipakai AsyncWeb3)"""
+
+    def __init__(self, endpoint_uri: str, stats: EndpointStats):
+        super().__init__(endpoint_uri, request_kwargs={"timeout": REQUEST_TIMEOUT})
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+
+    async def make_request(self, method, params):
+        if method == "eth_chainId" and self._stats.chain_id is not None:
+            return _chain_id_response(self._stats.chain_id)
+        response = await super().make_request(method, params)
+        _remember_chain_id(self._stats, method, response)
+        return response
+
+    async def _make_request(self, method, request_data: bytes) -> bytes:
+        start = time.perf_counter()
+        # CancelledError (kalah hedging) dicatat sebagai batas bawah latency
+        try:
+            with track_upstream(self._upstream, str(method), self._stats.chain):
+                raw = await super()._make_request(method, request_data)
+        except asyncio.CancelledError:
+            self._stats.record_cancelled(time.perf_counter() - start)
+            raise
+        except Exception:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        return raw
@@ -0,0 +1,52 @@
+# 📍 lib/providers/sol.py
+import time
+import asyncio
+from solana.rpc.providers.http import HTTPProvider as SolanaHTTPProvider
+from solana.rpc.providers.async_http import (
+    AsyncHTTPProvider as AsyncSolanaHTTPProvider,
+)
+from lib.rpc_pool import REQUEST_TIMEOUT, EndpointStats
+from lib.metrics import host_label, track_upstream
+
+# Provider terlacak solana.rpc, di-import rpc_pool saat client Solana pertama dibuat
+
+
+class TrackedSolanaProvider(SolanaHTTPProvider):
+    def __init__(self, endpoint: str, stats: EndpointStats):
+        super().__init__(endpoint, timeout=REQUEST_TIMEOUT)
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+
+    def make_request_unparsed(self, body) -> str:
+        start = time.perf_counter()
+        try:
+            with track_upstream(self._upstream, type(body).__name__, "sol"):
+                raw = super().make_request_unparsed(body)
+        except Exception:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        return raw
+
+
+
+class TrackedAsyncSolanaProvider(AsyncSolanaHTTPProvider):
+    def __init__(self, endpoint: str, stats: EndpointStats):
+        super().__init__(endpoint, timeout=REQUEST_TIMEOUT)
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+
+    async def make_request_unparsed(self, body) -> str:
+        start = time.perf_counter()
+        # CancelledError (kalah hedging) dicatat sebagai batas bawah latency
+        try:
+            with track_upstream(self._upstream, type(body).__name__, "sol"):
+                raw = await super().make_request_unparsed(body)
+        except asyncio.CancelledError:
+            self._stats.record_cancelled(time.perf_counter() - start)
+            raise
+        except Exception:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        return raw
@@ -0,0 +1,70 @@
+# 📍 lib/providers/trx.py
+import time
+import asyncio
+from tronpy.providers import HTTPProvider as TronHTTPProvider
+from tronpy.providers.async_http import AsyncHTTPProvider as AsyncTronHTTPProvider
+from lib.rpc_pool import REQUEST_TIMEOUT, EndpointStats
+from lib.upstream_guard import guard_for_url
+from lib.metrics import host_label, track_upstream
+
+# Provider terlacak tronpy, di-import rpc_pool saat client TRON pertama dibuat
+
+
+class TrackedTronProvider(TronHTTPProvider):
+    """Provider tronpy terlacak; node TronGrid lewat rate limiter + circuit breaker"""
+
+    def __init__(self, endpoint_uri: str, stats: EndpointStats):
+        super().__init__(endpoint_uri, timeout=REQUEST_TIMEOUT)
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+        self._guard = guard_for_url(endpoint_uri)
+
+    def make_request(self, method: str, params=None) -> dict:
+        if self._guard:
+            self._guard.acquire_sync()
+        start = time.perf_counter()
+        try:
+            with track_upstream(self._upstream, method, "trx"):
+                resp = super().make_request(method, params)
+        except Exception as e:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            if self._guard:
+                self._guard.record_failure(e)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        if self._guard:
+            self._guard.record_success()
+        return resp
+
+
+
+class TrackedAsyncTronProvider(AsyncTronHTTPProvider):
+    def __init__(self, endpoint_uri: str, stats: EndpointStats):
+        super().__init__(endpoint_uri, timeout=REQUEST_TIMEOUT)
+        self._stats = stats
+        self._upstream = host_label(stats.host)
+        self._guard = guard_for_url(endpoint_uri)
+
+    async def make_request(self, method: str, params=None) -> dict:
+        if self._guard:
+            await self._guard.acquire()
+        start = time.perf_counter()
+        # CancelledError (kalah hedging) dicatat sebagai batas bawah latency
+        try:
+            with track_upstream(self._upstream, method, "trx"):
+                resp = await super().make_request(method, params)
+        except asyncio.CancelledError:
+            self._stats.record_cancelled(time.perf_counter() - start)
+            # slot probe half-open TronGrid juga harus dilepas
+            if self._guard:
+                self._guard.release_probe()
+            raise
+        except Exception as e:
+            self._stats.record(time.perf_counter() - start, ok=False)
+            if self._guard:
+                self._guard.record_failure(e)
+            raise
+        self._stats.record(time.perf_counter() - start, ok=True)
+        if self._guard:
+            self._guard.record_success()
+        return resp
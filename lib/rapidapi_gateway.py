@@ -0,0 +1,66 @@
+# 📍 lib/rapidapi_gateway.py
+import hmac
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = b"x-rapidapi-proxy-secret"
+
+
+class RapidAPIGatewayMiddleware:
+    """
+    🔒 Middleware ASGI murni: blokir akses langsung ke domain asli,
+    hanya request lewat RapidAPI (header X-RapidAPI-Proxy-Secret) yang lolos.
+    Path publik (docs, ping, dll) selalu lolos.
+    """
+
+    def __init__(self, app, secret: str | None, public_paths):
+        self.app = app
+        self.secret = secret.encode() if secret else None
+        self.public_paths = frozenset(public_paths)
+
+    async def __call__(self, scope, receive, send):
+        # lifespan/websocket & path publik → langsung lolos
+        if scope["type"] != "http" or scope["path"] in self.public_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self.secret is None:
+            logger.error("❌ ENV 'RAPIDAPI_SECRET' belum diset!")
+            await self._reject(send, 500, "Server misconfigured")
+            return
+
+        proxy_secret = b""
+        for name, value in scope["headers"]:
+            if name == SECRET_HEADER:
+                proxy_secret = value
+                break
+
+        # compare_digest → waktu perbandingan tidak bocorkan isi secret
+        if not hmac.compare_digest(proxy_secret, self.secret):
+            client = scope.get("client")
+            logger.warning(
+                "❌ Blok akses ilegal dari %s ke %s",
+                client[0] if client else "-",
+                scope["path"],
+            )
+            await self._reject(send, 403, "Forbidden: Only RapidAPI gateway allowed")
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, status: int, detail: str):
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
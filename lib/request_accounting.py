@@ -0,0 +1,152 @@
+# 📍 lib/request_accounting.py
+import os
+import json
+import time
+from contextvars import ContextVar
+
+# ====================== KONFIGURASI ======================
+# Setiap request API punya akumulator sendiri (contextvar) yang diisi oleh
+# metrics.track_upstream → semua call keluar (Web3, solana-py, tronpy, CoinGecko)
+# ikut terhitung, termasuk yang jalan di asyncio.to_thread (context ikut disalin).
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "1") == "1"
+# header X-Debug-Upstream: 1 → rincian call ditempel di body JSON (field "_upstream")
+DEBUG_FIELD_ENABLED = os.getenv("UPSTREAM_DEBUG_ENABLED", "0") == "1"
+DEBUG_HEADER = b"x-debug-upstream"
+
+_current: ContextVar[dict | None] = ContextVar("upstream_accounting", default=None)
+
+
+def new_accounting() -> dict:
+    return {"calls": 0, "seconds": 0.0, "by_upstream": {}}
+
+
+def record_call(upstream: str, method: str, seconds: float, outcome: str):
+    accounting = _current.get()
+    if accounting is None:
+        return
+    accounting["calls"] += 1
+    accounting["seconds"] += seconds
+    key = f"{upstream} {method}"
+    entry = accounting["by_upstream"].setdefault(
+        key, {"calls": 0, "ms": 0.0, "errors": 0}
+    )
+    entry["calls"] += 1
+    entry["ms"] += seconds * 1000
+    if outcome == "error":
+        entry["errors"] += 1
+
+
+def current_accounting() -> dict | None:
+    return _current.get()
+
+
+def server_timing(accounting: dict, total_seconds: float) -> str:
+    """Header Server-Timing: total app, total upstream, lalu per host"""
+    per_host: dict[str, list] = {}
+    for key, entry in accounting["by_upstream"].items():
+        host = key.split(" ", 1)[0]
+        stats = per_host.setdefault(host, [0, 0.0])
+        stats[0] += entry["calls"]
+        stats[1] += entry["ms"]
+    parts = [
+        f"app;dur={total_seconds * 1000:.1f}",
+        f'upstream;dur={accounting["seconds"] * 1000:.1f};desc="{accounting["calls"]} calls"',
+    ]
+    parts += [
+        f'{host};dur={ms:.1f};desc="{calls} calls"'
+        for host, (calls, ms) in per_host.items()
+    ]
+    return ", ".join(parts)
+
+
+def debug_payload(accounting: dict) -> dict:
+    return {
+        "calls": accounting["calls"],
+        "total_ms": round(accounting["seconds"] * 1000, 1),
+        "by_upstream": {
+            key: {**entry, "ms": round(entry["ms"], 1)}
+            for key, entry in accounting["by_upstream"].items()
+        },
+    }
+
+
+# ====================== MIDDLEWARE ======================
+class UpstreamAccountingMiddleware:
+    """Middleware ASGI: buka akumulator per request, tulis hasilnya di Server-Timing"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        accounting = new_accounting()
+        token = _current.set(accounting)
+        start = time.perf_counter()
+        debug = DEBUG_FIELD_ENABLED and any(
+            name == DEBUG_HEADER and value == b"1" for name, value in scope["headers"]
+        )
+        pending_start = None
+
+        async def send_wrapper(message):
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                if debug and _is_json(message):
+                    # tahan header sampai body lengkap, body akan diubah
+                    pending_start = message
+                    return
+                message = _with_server_timing(message, accounting, start)
+            elif pending_start is not None and message["type"] == "http.response.body":
+                start_message, pending_start = pending_start, None
+                await _send_with_debug(send, start_message, message, accounting, start)
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+
+
+def _is_json(message) -> bool:
+    return any(
+        name == b"content-type" and value.startswith(b"application/json")
+        for name, value in message.get("headers", [])
+    )
+
+
+def _with_server_timing(message, accounting: dict, start: float) -> dict:
+    header = server_timing(accounting, time.perf_counter() - start)
+    return {
+        **message,
+        "headers": list(message.get("headers", [])) + [(b"server-timing", header.encode())],
+    }
+
+
+async def _send_with_debug(send, start_message, body_message, accounting, start):
+    # response JSON dari FastAPI dikirim dalam satu body message;
+    # kalau ternyata streaming, kirim apa adanya
+    body = body_message.get("body", b"")
+    if body_message.get("more_body"):
+        await send(_with_server_timing(start_message, accounting, start))
+        await send(body_message)
+        return
+    try:
+        data = json.loads(body)
+        if isinstance(data, dict):
+            data["_upstream"] = debug_payload(accounting)
+            body = json.dumps(data).encode()
+    except ValueError:
+        pass
+    start_message = _with_server_timing(start_message, accounting, start)
+    # body debug unik per request → jangan pernah di-cache (ETag / Last-Modified
+    # route sudah tidak cocok dengan body ini)
+    start_message["headers"] = [
+        (name, str(len(body)).encode() if name == b"content-length" else value)
+        for name, value in start_message["headers"]
+        if name not in (b"cache-control", b"etag", b"last-modified")
+    ] + [(b"cache-control", b"no-store")]
+    await send(start_message)
+    await send({**body_message, "body": body})
@@ -0,0 +1,377 @@
+# 📍 lib/rpc_pool.py
+import os
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING
+from lib.chains import chain_enabled, import_module, require_family
+from lib.metrics import record_cache
+
+if TYPE_CHECKING:
+    from web3 import Web3, AsyncWeb3
+    from solana.rpc.api import Client as SolanaClient
+    from solana.rpc.async_api import AsyncClient as AsyncSolanaClient
+    from tronpy import Tron
+    from tronpy.async_tron import AsyncTron
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Pool RPC server-side (opsional), diisi dari env, dipisah koma:
+#   RPC_POOL_ETH="https://eth-a.example,https://eth-b.example"
+#   RPC_POOL_BSC, RPC_POOL_POLYGON, RPC_POOL_BASE, RPC_POOL_SOL, RPC_POOL_TRX
+# Kalau user kirim rpc_url sendiri, URL itu yang dipakai (client tetap di-cache).
+POOL_CHAINS = ["eth", "bsc", "polygon", "base", "sol", "trx"]
+EVM_CHAINS = {"eth", "bsc", "polygon", "base"}
+CHAIN_ALIASES = {"bnb": "bsc", "matic": "polygon"}
+
+EWMA_ALPHA = float(os.getenv("RPC_POOL_EWMA_ALPHA", "0.2"))
+MAX_ERROR_RATE = float(os.getenv("RPC_POOL_MAX_ERROR_RATE", "0.5"))
+MAX_CONSECUTIVE_ERRORS = int(os.getenv("RPC_POOL_MAX_CONSECUTIVE_ERRORS", "3"))
+COOLDOWN_SECONDS = float(os.getenv("RPC_POOL_COOLDOWN", "30"))
+KEEPALIVE_INTERVAL = float(os.getenv("RPC_POOL_KEEPALIVE_INTERVAL", "20"))
+REQUEST_TIMEOUT = float(os.getenv("RPC_POOL_TIMEOUT", "10"))
+CLIENT_CACHE_SIZE = int(os.getenv("RPC_CLIENT_CACHE_SIZE", "64"))
+LATENCY_SAMPLES = int(os.getenv("RPC_POOL_LATENCY_SAMPLES", "200"))
+
+
+def normalize_chain(chain: str | None) -> str | None:
+    if not chain:
+        return None
+    chain = chain.lower()
+    return CHAIN_ALIASES.get(chain, chain)
+
+
+def _load_pools() -> dict[str, list[str]]:
+    pools = {}
+    for chain in POOL_CHAINS:
+        if not chain_enabled(chain):
+            continue
+        raw = os.getenv(f"RPC_POOL_{chain.upper()}", "")
+        urls = [u.strip() for u in raw.split(",") if u.strip()]
+        if urls:
+            pools[chain] = urls
+    return pools
+
+
+POOLS = _load_pools()
+
+
+# ====================== STATISTIK ENDPOINT ======================
+class EndpointStats:
+    """Statistik per endpoint dari traffic asli: EWMA latency & error rate"""
+
+    def __init__(self, url: str, chain: str | None = None):
+        self.url = url
+        self.chain = chain
+        self.host = urlparse(url).hostname or url
+        self.latency_ewma: float | None = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_error_at = 0.0
+        # chain id endpoint (eth_chainId) cukup di-resolve sekali per URL
+        self.chain_id: int | None = None
+        # sampel latency sukses terakhir, buat hitung persentil (delay hedging)
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool):
+        with self._lock:
+            self.requests += 1
+            if ok:
+                self.consecutive_errors = 0
+                self.samples.append(seconds)
+                if self.latency_ewma is None:
+                    self.latency_ewma = seconds
+                else:
+                    self.latency_ewma += EWMA_ALPHA * (seconds - self.latency_ewma)
+            else:
+                self.errors += 1
+                self.consecutive_errors += 1
+                self.last_error_at = time.monotonic()
+            self.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+
+    def record_cancelled(self, seconds: float):
+        """
+        Request yang di-cancel (kalah hedging): latency aslinya >= `seconds`.
+        Dipakai sebagai batas bawah supaya endpoint lambat tidak menyimpan EWMA
+        cepat yang lama; error rate & consecutive_errors tidak disentuh.
+        """
+        with self._lock:
+            self.requests += 1
+            if self.latency_ewma is not None and seconds <= self.latency_ewma:
+                # sampel terpotong di bawah rata-rata tidak memberi info baru
+                return
+            self.samples.append(seconds)
+            if self.latency_ewma is None:
+                self.latency_ewma = seconds
+            else:
+                self.latency_ewma += EWMA_ALPHA * (seconds - self.latency_ewma)
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    @property
+    def healthy(self) -> bool:
+        in_cooldown = time.monotonic() - self.last_error_at < COOLDOWN_SECONDS
+        if self.consecutive_errors >= MAX_CONSECUTIVE_ERRORS and in_cooldown:
+            return False
+        return not (self.error_rate > MAX_ERROR_RATE and in_cooldown)
+
+    def score(self) -> float:
+        """Makin kecil makin bagus. Endpoint baru (belum ada data) dicoba duluan."""
+        if self.latency_ewma is not None:
+            latency = self.latency_ewma
+        else:
+            # belum pernah sukses: anggap selambat timeout kalau sudah pernah gagal
+            latency = REQUEST_TIMEOUT if self.requests else 0.0
+        return latency * (1.0 + 4.0 * self.error_rate)
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "host": self.host,
+            "chain": self.chain,
+            "chain_id": self.chain_id,
+            "healthy": self.healthy,
+            "latency_ewma_ms": (
+                round(self.latency_ewma * 1000, 2)
+                if self.latency_ewma is not None
+                else None
+            ),
+            "p95_ms": (
+                round(self.percentile(0.95) * 1000, 2)
+                if self.samples
+                else None
+            ),
+            "error_rate": round(self.error_rate, 4),
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+class _LRU:
+    """Cache client per URL, dibatasi supaya rpc_url random dari user tidak bikin bocor memori"""
+
+    def __init__(self, maxsize: int, name: str | None = None):
+        self.maxsize = maxsize
+        self.name = name
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                if self.name:
+                    record_cache(self.name, "hit")
+                return self._data[key]
+            if self.name:
+                record_cache(self.name, "miss")
+            value = factory()
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# endpoint pool tidak pernah di-evict, URL dari user masuk LRU
+_pool_stats: dict[str, EndpointStats] = {
+    url: EndpointStats(url, chain) for chain, urls in POOLS.items() for url in urls
+}
+_adhoc_stats = _LRU(CLIENT_CACHE_SIZE)
+_web3_clients = _LRU(CLIENT_CACHE_SIZE, name="web3_client")
+_async_web3_clients = _LRU(CLIENT_CACHE_SIZE, name="async_web3_client")
+_solana_clients = _LRU(CLIENT_CACHE_SIZE, name="solana_client")
+_async_solana_clients = _LRU(CLIENT_CACHE_SIZE, name="async_solana_client")
+_tron_clients = _LRU(CLIENT_CACHE_SIZE, name="tron_client")
+_async_tron_clients = _LRU(CLIENT_CACHE_SIZE, name="async_tron_client")
+
+
+def get_stats(url: str, chain: str | None = None) -> EndpointStats:
+    stats = _pool_stats.get(url)
+    if stats is not None:
+        return stats
+    return _adhoc_stats.get_or_create(
+        url, lambda: EndpointStats(url, normalize_chain(chain))
+    )
+
+
+# ====================== ROUTING ======================
+def pool_urls(chain: str) -> list[str]:
+    return POOLS.get(normalize_chain(chain), [])
+
+
+def has_pool(chain: str) -> bool:
+    return bool(pool_urls(chain))
+
+
+def ranked_endpoints(chain: str) -> list[EndpointStats]:
+    """Endpoint pool urut dari yang paling sehat & cepat"""
+    stats = [_pool_stats[url] for url in pool_urls(chain)]
+    healthy = [s for s in stats if s.healthy]
+    # kalau semua lagi cooldown, tetap coba (urut skor) daripada gagal total
+    return sorted(healthy or stats, key=lambda s: s.score())
+
+
+def resolve_rpc_url(chain: str, rpc_url: str | None = None) -> str | None:
+    """rpc_url dari user diprioritaskan, kalau kosong ambil endpoint pool terbaik"""
+    if rpc_url:
+        return rpc_url
+    ranked = ranked_endpoints(chain)
+    return ranked[0].url if ranked else None
+
+
+# ====================== CLIENT CACHE ======================
+# SDK & provider terlacak per keluarga (lib/providers/*) baru di-import saat
+# client pertama keluarga itu dibuat → worker yang hanya melayani EVM tidak
+# pernah memuat solana / solders / tronpy.
+def get_web3(rpc_url: str, chain: str | None = None) -> "Web3":
+    """Web3 di-cache per URL supaya koneksi HTTP (keep-alive) tetap hangat"""
+
+    def factory():
+        require_family("evm")
+        web3 = import_module("web3")
+        providers = import_module("lib.providers.evm")
+        return web3.Web3(providers.TrackedHTTPProvider(rpc_url, get_stats(rpc_url, chain)))
+
+    return _web3_clients.get_or_create(rpc_url, factory)
+
+
+def _loop_key(rpc_url: str):
+    # client async terikat ke event loop, jadi cache-nya per (loop, url)
+    return (id(asyncio.get_running_loop()), rpc_url)
+
+
+def get_async_web3(rpc_url: str, chain: str | None = None) -> "AsyncWeb3":
+    def factory():
+        require_family("evm")
+        web3 = import_module("web3")
+        providers = import_module("lib.providers.evm")
+        return web3.AsyncWeb3(
+            providers.TrackedAsyncHTTPProvider(rpc_url, get_stats(rpc_url, chain))
+        )
+
+    return _async_web3_clients.get_or_create(_loop_key(rpc_url), factory)
+
+
+def get_solana_client(rpc_url: str) -> "SolanaClient":
+    def factory():
+        require_family("sol")
+        api = import_module("solana.rpc.api")
+        providers = import_module("lib.providers.sol")
+        client = api.Client(rpc_url, timeout=REQUEST_TIMEOUT)
+        client._provider = providers.TrackedSolanaProvider(
+            rpc_url, get_stats(rpc_url, "sol")
+        )
+        return client
+
+    return _solana_clients.get_or_create(rpc_url, factory)
+
+
+def get_async_solana_client(rpc_url: str) -> "AsyncSolanaClient":
+    def factory():
+        require_family("sol")
+        async_api = import_module("solana.rpc.async_api")
+        providers = import_module("lib.providers.sol")
+        client = async_api.AsyncClient(rpc_url, timeout=REQUEST_TIMEOUT)
+        client._provider = providers.TrackedAsyncSolanaProvider(
+            rpc_url, get_stats(rpc_url, "sol")
+        )
+        return client
+
+    return _async_solana_clients.get_or_create(_loop_key(rpc_url), factory)
+
+
+def get_tron_client(rpc_url: str) -> "Tron":
+    def factory():
+        require_family("trx")
+        tronpy = import_module("tronpy")
+        providers = import_module("lib.providers.trx")
+        return tronpy.Tron(
+            provider=providers.TrackedTronProvider(rpc_url, get_stats(rpc_url, "trx"))
+        )
+
+    return _tron_clients.get_or_create(rpc_url, factory)
+
+
+def get_async_tron_client(rpc_url: str) -> "AsyncTron":
+    def factory():
+        require_family("trx")
+        async_tron = import_module("tronpy.async_tron")
+        providers = import_module("lib.providers.trx")
+        return async_tron.AsyncTron(
+            providers.TrackedAsyncTronProvider(rpc_url, get_stats(rpc_url, "trx"))
+        )
+
+    return _async_tron_clients.get_or_create(_loop_key(rpc_url), factory)
+
+
+def reset_clients():
+    """Setelah fork: client (socket keep-alive, session, loop) tidak dibagi dengan master"""
+    for cache in (
+        _web3_clients,
+        _async_web3_clients,
+        _solana_clients,
+        _async_solana_clients,
+        _tron_clients,
+        _async_tron_clients,
+    ):
+        cache.clear()
+
+
+def pool_snapshot() -> dict:
+    return {
+        chain: [_pool_stats[url].snapshot() for url in urls]
+        for chain, urls in POOLS.items()
+    }
+
+
+# ====================== KEEP-ALIVE ======================
+def _ping_endpoint(chain: str, url: str):
+    """Request ringan untuk jaga koneksi & update health endpoint pool"""
+    try:
+        if chain in EVM_CHAINS:
+            w3 = get_web3(url, chain)
+            # ping pertama sekalian resolve chain id (di-cache provider per endpoint)
+            if _pool_stats[url].chain_id is None:
+                w3.eth.chain_id
+            else:
+                w3.eth.block_number
+        elif chain == "sol":
+            get_solana_client(url).get_slot()
+        elif chain == "trx":
+            get_tron_client(url).get_latest_block_number()
+    except Exception as e:
+        logger.warning("⚠️ Keep-alive RPC %s gagal: %s", url, e)
+
+
+async def warm_pools():
+    """Buka koneksi ke semua endpoint pool secara paralel"""
+    jobs = [
+        asyncio.to_thread(_ping_endpoint, chain, url)
+        for chain, urls in POOLS.items()
+        for url in urls
+    ]
+    if jobs:
+        await asyncio.gather(*jobs)
+
+
+async def keepalive_loop():
+    # warm pertama dikerjakan lib/warmup saat startup
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        await warm_pools()
@@ -0,0 +1,217 @@
+# 📍 lib/signer_registry.py
+import os
+import json
+import time
+import logging
+
+import base58
+
+from lib.chains import DISABLED_FAMILIES, family_of
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Key hot wallet dimuat sekali per proses (startup, atau master kalau preload),
+# objek signer SDK + alamatnya di-derive sekali dan tetap di memori. Request
+# cukup menyebut key_alias, tidak ada derivasi key per request.
+#   SIGNER_KEY_<ALIAS>=<keluarga>:<private key>   keluarga: evm | sol | trx
+#       evm / trx : hex 32 byte (0x opsional)
+#       sol       : base58 seed 32 byte / secret key 64 byte
+#   SIGNER_KEYSTORE_PATH + SIGNER_KEYSTORE_PASSWORD
+#       JSON {alias: {"family": ..., <keyfile Web3 Secret Storage v3>}},
+#       dibuat dengan scripts/keystore.py
+# private_key mentah dari request tetap didukung (di-derive per request, tidak disimpan).
+SIGNER_ENV_PREFIX = "SIGNER_KEY_"
+SIGNER_KEYSTORE_PATH = os.getenv("SIGNER_KEYSTORE_PATH")
+SIGNER_KEYSTORE_PASSWORD = os.getenv("SIGNER_KEYSTORE_PASSWORD")
+SIGNER_FAMILIES = ("evm", "sol", "trx")
+
+_signers: dict[str, "Signer"] = {}
+_state = {"loaded": False, "load_seconds": None, "errors": {}}
+
+
+class SignerError(ValueError):
+    pass
+
+
+class Signer:
+    """Key yang sudah di-derive: objek signer SDK (LocalAccount / Keypair / PrivateKey) + alamat"""
+
+    __slots__ = ("alias", "family", "account", "address")
+
+    def __init__(self, alias: str | None, family: str, account, address: str):
+        self.alias = alias
+        self.family = family
+        self.account = account
+        self.address = address
+
+    def __repr__(self):
+        # jangan pernah ikut mencetak key
+        return f"Signer({self.alias or '-'}, {self.family}, {self.address})"
+
+
+# ====================== DERIVASI ======================
+def _derive_evm(key: bytes):
+    from eth_account import Account
+
+    account = Account.from_key(key)
+    return account, account.address
+
+
+def _derive_sol(key: bytes):
+    from solders.keypair import Keypair  # SDK Solana di-import saat dipakai
+
+    if len(key) == 32:
+        keypair = Keypair.from_seed(key)
+    elif len(key) == 64:
+        keypair = Keypair.from_bytes(key)
+    else:
+        raise SignerError(f"❌ Private key salah, panjang {len(key)} bukan 32/64 bytes")
+    return keypair, str(keypair.pubkey())
+
+
+def _derive_trx(key: bytes):
+    from tronpy.keys import PrivateKey
+
+    private_key = PrivateKey(key)
+    return private_key, private_key.public_key.to_base58check_address()
+
+
+_DERIVE = {"evm": _derive_evm, "sol": _derive_sol, "trx": _derive_trx}
+
+
+def decode_key(family: str, raw: str) -> bytes:
+    """String private key (hex untuk evm / trx, base58 untuk sol) → bytes"""
+    raw = raw.strip()
+    try:
+        if family == "sol":
+            return base58.b58decode(raw)
+        return bytes.fromhex(raw.removeprefix("0x"))
+    except ValueError:
+        raise SignerError(f"❌ Format private key {family} tidak valid")
+
+
+def derive_signer(family: str, key: str | bytes, alias: str | None = None) -> Signer:
+    if family not in _DERIVE:
+        raise SignerError(f"Keluarga signer {family} tidak dikenal ({', '.join(SIGNER_FAMILIES)})")
+    if isinstance(key, str):
+        key = decode_key(family, key)
+    account, address = _DERIVE[family](key)
+    return Signer(alias, family, account, address)
+
+
+def as_signer(family: str, key) -> Signer:
+    """
+    Dipakai helper kirim: Signer resident (dari key_alias) dipakai apa adanya,
+    private_key mentah dari request di-derive di sini.
+    """
+    if isinstance(key, Signer):
+        if key.family != family:
+            raise SignerError(f"Signer {key.alias} untuk keluarga {key.family}, bukan {family}")
+        return key
+    if not key:
+        raise ValueError("❌ Private key harus diberikan!")
+    return derive_signer(family, key)
+
+
+# ====================== LOAD ======================
+def _env_entries() -> dict[str, tuple[str, str]]:
+    entries = {}
+    for name, value in os.environ.items():
+        if not name.startswith(SIGNER_ENV_PREFIX) or not value:
+            continue
+        alias = name[len(SIGNER_ENV_PREFIX):].lower()
+        family, sep, key = value.partition(":")
+        if not sep:
+            _state["errors"][alias] = f"format {name} harus <keluarga>:<private key>"
+            continue
+        entries[alias] = (family.strip().lower(), key)
+    return entries
+
+
+def _keystore_entries() -> dict[str, tuple[str, bytes]]:
+    if not SIGNER_KEYSTORE_PATH:
+        return {}
+    if not SIGNER_KEYSTORE_PASSWORD:
+        _state["errors"]["keystore"] = "SIGNER_KEYSTORE_PASSWORD belum diset"
+        return {}
+    from eth_keyfile import decode_keyfile_json
+
+    with open(SIGNER_KEYSTORE_PATH) as f:
+        keystore = json.load(f)
+    entries = {}
+    for alias, keyfile in keystore.items():
+        try:
+            key = decode_keyfile_json(keyfile, SIGNER_KEYSTORE_PASSWORD.encode("utf-8"))
+        except ValueError as e:
+            _state["errors"][alias.lower()] = f"gagal dekripsi keystore: {e}"
+            continue
+        entries[alias.lower()] = (keyfile.get("family", "evm"), key)
+    return entries
+
+
+def load_signers():
+    """
+    Startup (lifespan / warm_master): derive semua key sekali. No-op kalau sudah
+    dimuat (worker hasil fork master preload). Key yang gagal dicatat di log
+    (diagnostics hanya jumlahnya) tanpa menjatuhkan worker.
+    """
+    if _state["loaded"]:
+        return
+    start = time.perf_counter()
+    try:
+        entries = {**_keystore_entries(), **_env_entries()}
+    except (OSError, ValueError) as e:
+        _state["errors"]["keystore"] = f"gagal baca {SIGNER_KEYSTORE_PATH}: {e}"
+        entries = _env_entries()
+    for alias, (family, key) in entries.items():
+        if family in DISABLED_FAMILIES:
+            # SDK keluarga yang dimatikan tidak boleh ter-import hanya demi signer
+            _state["errors"][alias] = f"keluarga {family} dinonaktifkan (CHAIN_FAMILIES_DISABLED)"
+            continue
+        try:
+            _signers[alias] = derive_signer(family, key, alias=alias)
+        except Exception as e:
+            _state["errors"][alias] = f"{family}: {e}"
+    _state["loaded"] = True
+    _state["load_seconds"] = time.perf_counter() - start
+    if _signers:
+        logger.info(
+            "🔑 %d signer dimuat dalam %.0fms: %s",
+            len(_signers),
+            _state["load_seconds"] * 1000,
+            ", ".join(f"{s.alias}({s.family})" for s in _signers.values()),
+        )
+    for alias, error in _state["errors"].items():
+        logger.error("❌ Signer %s tidak dimuat: %s", alias, error)
+
+
+# ====================== API ======================
+def get_signer(alias: str, chain: str) -> Signer:
+    """Signer resident untuk key_alias, keluarganya harus cocok dengan chain"""
+    signer = _signers.get(alias.strip().lower())
+    if signer is None:
+        raise SignerError(f"key_alias {alias} tidak terdaftar di server ini")
+    family = family_of(chain)
+    if family != signer.family:
+        raise SignerError(
+            f"key_alias {alias} untuk keluarga {signer.family}, tidak bisa dipakai di {chain}"
+        )
+    return signer
+
+
+def signers_snapshot() -> dict:
+    """Untuk /diagnostics (terlihat subscriber): jumlah saja, alias / alamat / error ada di log"""
+    by_family: dict[str, int] = {}
+    for signer in _signers.values():
+        by_family[signer.family] = by_family.get(signer.family, 0) + 1
+    return {
+        "loaded": _state["loaded"],
+        "load_ms": (
+            round(_state["load_seconds"] * 1000)
+            if _state["load_seconds"] is not None
+            else None
+        ),
+        "signers": by_family,
+        "errors": len(_state["errors"]),
+    }
@@ -1,32 +1,23 @@
 # 📍 lib/solana_helper.py
 import logging
-import base58
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from solders.transaction import Transaction
 from solders.system_program import transfer, TransferParams
-from solana.rpc.api import Client
 from solana.rpc.types import TxOpts  # ✅ perbaikan
+from lib.rpc_pool import get_solana_client
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
-def create_admin_keypair(private_key: str):
-    """Buat Keypair dari private key base58/bytes dari endpoint"""
-    if not private_key:
-        raise ValueError("❌ Private key harus diberikan!")
-
-    key_bytes = base58.b58decode(private_key)
-    if len(key_bytes) == 32:
-        return Keypair.from_secret_key(key_bytes)
-    elif len(key_bytes) == 64:
-        return Keypair.from_bytes(key_bytes)
-    else:
-        raise ValueError(
-            f"❌ Private key salah, panjang {len(key_bytes)} bukan 32/64 bytes"
-        )
+def create_admin_keypair(private_key) -> Keypair:
+    """Keypair dari private key base58 dari endpoint, atau Keypair resident dari Signer (key_alias)"""
+    return as_signer("sol", private_key).account
 
 
+@traced("send sol", chain="sol")
 def send_sol(
     destination_wallet: str, amount: float, rpc_url: str, private_key: str
 ):
@@ -37,7 +28,7 @@ def send_sol(
         if not private_key:
             raise ValueError("❌ Private key harus diberikan!")
 
-        client = Client(rpc_url)
+        client = get_solana_client(rpc_url)
         admin_keypair = create_admin_keypair(private_key)
 
         if destination_wallet == str(admin_keypair.pubkey()):
@@ -92,7 +83,7 @@ def get_balance(address: str, rpc_url: str):
         if not address:
             raise ValueError("❌ Address harus diberikan!")
 
-        client = Client(rpc_url)
+        client = get_solana_client(rpc_url)
         resp = client.get_balance(Pubkey.from_string(address))
         lamports = (
             getattr(resp.value, "value", None)
@@ -100,7 +91,7 @@ def get_balance(address: str, rpc_url: str):
             else getattr(resp, "value", 0)
         )
         sol_balance = lamports / 1_000_000_000
-        logger.info(f"💰 Saldo {address}: {sol_balance} SOL")
+        logger.debug("💰 Saldo %s: %s SOL", address, sol_balance)
         return sol_balance
 
     except Exception as e:
@@ -2,11 +2,14 @@
 import logging
 from lib.usdt_helper import send_usdt
 from lib.usdc_helper import send_usdc
+from lib.rpc_pool import resolve_rpc_url
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 # -------------------- Fungsi kirim USDT --------------------
+@traced("send_usdt_token")
 async def send_usdt_token(
     destination_wallet: str,
     amount: float,
@@ -17,13 +20,14 @@ async def send_usdt_token(
 ):
     """
     Kirim USDT ke wallet tujuan sesuai chain
+    (private_key: string mentah atau Signer resident dari key_alias)
     """
     try:
         tx_hash = await send_usdt(
             destination_wallet,
             amount,
             chain.lower(),
-            rpc_url=rpc_url,
+            rpc_url=resolve_rpc_url(chain, rpc_url),
             private_key=private_key,
             token_address=token_address,  # diteruskan ke helper
         )
@@ -37,6 +41,7 @@ async def send_usdt_token(
 
 
 # -------------------- Fungsi kirim USDC --------------------
+@traced("send_usdc_token")
 async def send_usdc_token(
     destination_wallet: str,
     amount: float,
@@ -47,6 +52,7 @@ async def send_usdc_token(
 ):
     """
     Kirim USDC ke wallet tujuan sesuai chain
+    (private_key: string mentah atau Signer resident dari key_alias)
     """
     if not token_address:
         raise ValueError("USDC token_address wajib diisi")
@@ -56,7 +62,7 @@ async def send_usdc_token(
             destination_wallet,
             amount,
             chain.lower(),
-            rpc_url=rpc_url,
+            rpc_url=resolve_rpc_url(chain, rpc_url),
             private_key=private_key,
             token_address=token_address,  # diteruskan ke helper
         )
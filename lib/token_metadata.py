@@ -0,0 +1,286 @@
+# 📍 lib/token_metadata.py
+import os
+import json
+import time
+import asyncio
+import tempfile
+import logging
+from collections import OrderedDict
+from lib.coingecko import coingecko_get_fields, CoinGeckoError, COIN_DOC_LEAN_PARAMS
+from lib.upstream_guard import get_guard, UpstreamUnavailable
+from lib.metrics import record_cache
+from lib.coin_index import (
+    index_ready,
+    has_coin,
+    lookup_contract,
+    lookup_symbol,
+)
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Metadata token (nama, symbol, decimals, kontrak) jarang berubah → cache TTL panjang.
+# Lewat TTL → data lama tetap disajikan, refresh jalan di background.
+# Token yang tidak ada di CoinGecko di-cache negatif supaya tidak terus ditembak.
+# Key-nya id dari request publik → dua-duanya LRU (TOKEN_METADATA_CACHE_SIZE /
+# TOKEN_METADATA_NEGATIVE_SIZE). Snapshot disk ditulis di thread, paling sering
+# sekali per TOKEN_METADATA_SNAPSHOT_DELAY detik (fetch beruntun digabung).
+METADATA_TTL = float(os.getenv("TOKEN_METADATA_TTL", "86400"))
+NEGATIVE_TTL = float(os.getenv("TOKEN_METADATA_NEGATIVE_TTL", "600"))
+CACHE_SIZE = int(os.getenv("TOKEN_METADATA_CACHE_SIZE", "10000"))
+NEGATIVE_SIZE = int(os.getenv("TOKEN_METADATA_NEGATIVE_SIZE", "10000"))
+SNAPSHOT_PATH = os.getenv("TOKEN_METADATA_SNAPSHOT_PATH")
+SNAPSHOT_DELAY = float(os.getenv("TOKEN_METADATA_SNAPSHOT_DELAY", "30"))
+# 🔹 Key dari dokumen /coins/{id} yang dipakai (urutannya di awal dokumen)
+COIN_DOC_FIELDS = ("id", "symbol", "name", "detail_platforms")
+
+# 🔹 Mapping popular token aliases to CoinGecko ID
+TOKEN_ALIAS = {
+    "eth": "ethereum",
+    "weth": "ethereum",
+    "sol": "solana",
+    "bnb": "binancecoin",
+    "busd": "binance-usd",
+    "usdt": "tether",
+    "usdc": "usd-coin",
+    "trx": "tron",
+    "ton": "the-open-network",
+    "ada": "cardano",
+    "dot": "polkadot",
+    "matic": "matic-network",
+    "avax": "avalanche-2",
+    "doge": "dogecoin",
+    "shib": "shiba-inu",
+    "ltc": "litecoin",
+    "btc": "bitcoin",
+    "atom": "cosmos",
+    "dai": "dai",
+    "ftm": "fantom",
+    "cake": "pancakeswap-token",
+}
+
+# 🔹 {coingecko_id: {"metadata": {...}, "detail_platforms": {...}, "fetched_at": epoch}}
+_cache: OrderedDict[str, dict] = OrderedDict()
+# 🔹 {coingecko_id: epoch} → id yang 404 di CoinGecko
+_missing: OrderedDict[str, float] = OrderedDict()
+_inflight: dict[str, asyncio.Task] = {}
+_snapshot_task: asyncio.Task | None = None
+
+
+def _remember(cache: OrderedDict, key: str, value, maxsize: int):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def resolve_token_id(token: str) -> str:
+    token = token.lower()
+    return TOKEN_ALIAS.get(token, token)
+
+
+def resolve_coin_id(token: str, platform: str | None = None) -> str | None:
+    """
+    Kontrak (di platform) / alias / coin id / symbol → coin id CoinGecko.
+    Return None kalau coin index sudah siap dan token tidak dikenal
+    (tidak perlu round trip 404 ke CoinGecko). Raise AmbiguousSymbol kalau
+    symbol dipakai beberapa coin.
+    """
+    if platform:
+        coin_id = lookup_contract(platform, token)
+        if coin_id:
+            return coin_id
+    token_id = resolve_token_id(token)
+    if not index_ready() or token.lower() in TOKEN_ALIAS or has_coin(token_id):
+        return token_id
+    return lookup_symbol(token_id, platform)
+
+
+def extract_metadata(data: dict) -> dict:
+    """Ambil field yang dipakai /token_info dari dokumen /coins/{id}"""
+    ethereum = (data.get("detail_platforms") or {}).get("ethereum") or {}
+    return {
+        "name": data.get("name"),
+        "symbol": data.get("symbol").upper() if data.get("symbol") else None,
+        "decimals": ethereum.get("decimal_place"),
+        "contract_address": ethereum.get("contract_address"),
+        "coingecko_id": data.get("id"),
+    }
+
+
+def platform_metadata(entry: dict, platform: str) -> dict:
+    """Metadata dengan decimals & kontrak dari platform tertentu (ethereum, solana, ...)"""
+    detail = entry["detail_platforms"].get(platform) or {}
+    return {
+        **entry["metadata"],
+        "decimals": detail.get("decimal_place"),
+        "contract_address": detail.get("contract_address"),
+    }
+
+
+# ====================== SNAPSHOT DISK ======================
+def load_snapshot():
+    if not SNAPSHOT_PATH or not os.path.exists(SNAPSHOT_PATH):
+        return
+    try:
+        with open(SNAPSHOT_PATH) as f:
+            data = json.load(f)
+        for token_id, entry in data.items():
+            _remember(_cache, token_id, entry, CACHE_SIZE)
+        logger.info(f"💾 {len(data)} metadata token dimuat dari {SNAPSHOT_PATH}")
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal load snapshot metadata {SNAPSHOT_PATH}: {e}")
+
+
+def save_snapshot(data: dict | None = None):
+    """Ditulis ke file temp unik per call: worker lain bisa menyimpan bersamaan"""
+    if not SNAPSHOT_PATH:
+        return
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(SNAPSHOT_PATH) or ".",
+            prefix=f"{os.path.basename(SNAPSHOT_PATH)}.",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(_cache if data is None else data, f)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except Exception as e:
+        logger.warning(f"⚠️ Gagal simpan snapshot metadata {SNAPSHOT_PATH}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+async def _save_snapshot_later():
+    global _snapshot_task
+    try:
+        await asyncio.sleep(SNAPSHOT_DELAY)
+    finally:
+        _snapshot_task = None
+    # salinan dangkal di loop, json.dump di thread (cache bisa berubah selama ditulis)
+    await asyncio.to_thread(save_snapshot, dict(_cache))
+
+
+def _schedule_snapshot():
+    """Debounce: fetch beruntun cukup memicu satu tulis snapshot"""
+    global _snapshot_task
+    if SNAPSHOT_PATH and _snapshot_task is None:
+        _snapshot_task = asyncio.get_running_loop().create_task(_save_snapshot_later())
+
+
+def flush_snapshot():
+    """Shutdown: tulis snapshot yang masih tertunda"""
+    global _snapshot_task
+    if _snapshot_task is not None:
+        _snapshot_task.cancel()
+        _snapshot_task = None
+        save_snapshot()
+
+
+# ====================== FETCH ======================
+async def _fetch(token_id: str) -> dict:
+    try:
+        data = await coingecko_get_fields(
+            f"/coins/{token_id}", COIN_DOC_FIELDS, params=COIN_DOC_LEAN_PARAMS
+        )
+    except CoinGeckoError as e:
+        if e.status == 404:
+            _remember(_missing, token_id, time.time(), NEGATIVE_SIZE)
+        raise
+    entry = {
+        "metadata": extract_metadata(data),
+        "detail_platforms": data.get("detail_platforms") or {},
+        "fetched_at": time.time(),
+    }
+    _remember(_cache, token_id, entry, CACHE_SIZE)
+    _missing.pop(token_id, None)
+    _schedule_snapshot()
+    return entry
+
+
+def _ensure_fetch(token_id: str) -> asyncio.Task:
+    """Single-flight per token: request paralel untuk id sama cukup 1 fetch"""
+    task = _inflight.get(token_id)
+    if task is None or task.done():
+        task = asyncio.get_running_loop().create_task(_fetch(token_id))
+        task.add_done_callback(lambda t: _log_background_error(token_id, t))
+        _inflight[token_id] = task
+    return task
+
+
+def _log_background_error(token_id: str, task: asyncio.Task):
+    if _inflight.get(token_id) is task:
+        _inflight.pop(token_id)
+    if not task.cancelled() and task.exception():
+        logger.warning(f"⚠️ Refresh metadata {token_id} gagal: {task.exception()}")
+
+
+async def get_token_entry(token_id: str) -> dict:
+    """
+    Entry cache untuk token_id (metadata + detail_platforms).
+    Raise CoinGeckoError kalau token tidak ada, UpstreamUnavailable kalau
+    CoinGecko tidak bisa diakses dan belum ada cache.
+    """
+    token_id = token_id.lower()
+    now = time.time()
+    entry = _cache.get(token_id)
+    if entry:
+        _cache.move_to_end(token_id)
+        if now - entry["fetched_at"] > METADATA_TTL:
+            record_cache("token_metadata", "stale")
+            _ensure_fetch(token_id)
+        else:
+            record_cache("token_metadata", "hit")
+        return entry
+
+    missing_at = _missing.get(token_id)
+    if missing_at and now - missing_at < NEGATIVE_TTL:
+        record_cache("token_metadata", "negative")
+        raise CoinGeckoError(404)
+
+    record_cache("token_metadata", "miss")
+    return await asyncio.shield(_ensure_fetch(token_id))
+
+
+async def get_token_metadata(token_id: str) -> dict:
+    return (await get_token_entry(token_id))["metadata"]
+
+
+# ====================== WARMING ======================
+async def warm_token_metadata():
+    """Load snapshot lalu isi cache untuk semua TOKEN_ALIAS yang belum ada / kadaluarsa"""
+    if not _cache:
+        load_snapshot()
+    guard = get_guard("coingecko")
+    now = time.time()
+    pending = [
+        token_id
+        for token_id in dict.fromkeys(TOKEN_ALIAS.values())
+        if (token_id not in _cache or now - _cache[token_id]["fetched_at"] > METADATA_TTL)
+        # 404 yang sudah di-cache negatif (mis. oleh warm-up master) tidak diulang
+        and not (token_id in _missing and now - _missing[token_id] < NEGATIVE_TTL)
+    ]
+    while pending:
+        token_id = pending[0]
+        try:
+            await _ensure_fetch(token_id)
+        except UpstreamUnavailable:
+            # limiter penuh / breaker open → tunggu, jangan habiskan kuota
+            await asyncio.sleep(max(2.0, guard.breaker.retry_in()))
+            continue
+        except Exception as e:
+            logger.warning(f"⚠️ Warm metadata {token_id} gagal: {e}")
+        pending.pop(0)
+    logger.info(f"🔥 Metadata token siap: {len(_cache)} token di cache")
+
+
+def token_metadata_snapshot() -> dict:
+    now = time.time()
+    return {
+        "cached": len(_cache),
+        "missing": len(_missing),
+        "oldest_age_seconds": round(
+            max((now - e["fetched_at"] for e in _cache.values()), default=0), 1
+        ),
+    }
@@ -0,0 +1,384 @@
+# 📍 lib/tracing.py
+import os
+import json
+import time
+import queue
+import re
+import random
+import atexit
+import asyncio
+import logging
+import functools
+import threading
+import urllib.request
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Tracing ala OpenTelemetry tanpa dependency tambahan:
+#   TRACING_EXPORTER      : "none" (default) | "file" | "otlp"
+#   TRACING_FILE_PATH     : file JSON lines (format OTLP/JSON resourceSpans)
+#   TRACING_OTLP_ENDPOINT : collector OTLP/HTTP JSON, mis. http://collector:4318/v1/traces
+#   TRACING_SAMPLE_RATIO  : peluang trace baru disampling (0..1), anak ikut keputusan root
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv(
+    "TRACING_OTLP_ENDPOINT", "http://127.0.0.1:4318/v1/traces"
+)
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "0.1"))
+SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "crypto-api")
+BATCH_SIZE = int(os.getenv("TRACING_BATCH_SIZE", "512"))
+FLUSH_SECONDS = float(os.getenv("TRACING_FLUSH_SECONDS", "2"))
+
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+# ====================== SPAN ======================
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, kind: str):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: dict = {}
+        self.error: str | None = None
+
+    def set_attribute(self, key: str, value):
+        if value is not None:
+            self.attributes[key] = value
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Dipakai kalau trace tidak disampling → overhead hampir nol"""
+
+    sampled = False
+
+    def set_attribute(self, key: str, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# ====================== EXPORTER ======================
+def _resource_spans(spans: list[Span]) -> dict:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", SERVICE_NAME)]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "lib.tracing"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileExporter:
+    """Satu baris JSON (OTLP resourceSpans) per batch, bisa dibaca collector/jq"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: list[Span]):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(_resource_spans(spans)) + "\n")
+
+
+class OTLPHttpExporter:
+    """POST OTLP/JSON ke collector (atau stand-in lokal)"""
+
+    def __init__(self, endpoint: str, timeout: float = 5):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, spans: list[Span]):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(_resource_spans(spans)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+            resp.read()
+
+
+class BatchProcessor:
+    """Kumpulkan span selesai, export batch dari thread terpisah (bukan event loop)"""
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+        self.queue: queue.Queue = queue.Queue(maxsize=BATCH_SIZE * 20)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span):
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self, first: Span | None) -> list[Span]:
+        batch = [first] if first else []
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _export(self, batch: list[Span]):
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning("⚠️ Export %s span gagal: %s", len(batch), e)
+
+    def _run(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=FLUSH_SECONDS)
+            except queue.Empty:
+                continue
+            self._export(self._drain(first))
+
+    def restart(self):
+        """Setelah fork: thread exporter master tidak ikut, buat antrian + thread baru"""
+        self.queue = queue.Queue(maxsize=BATCH_SIZE * 20)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def flush(self):
+        while not self.queue.empty():
+            self._export(self._drain(None))
+
+
+def _build_processor() -> BatchProcessor | None:
+    if TRACING_EXPORTER == "file":
+        return BatchProcessor(FileExporter(TRACING_FILE_PATH))
+    if TRACING_EXPORTER == "otlp":
+        return BatchProcessor(OTLPHttpExporter(TRACING_OTLP_ENDPOINT))
+    return None
+
+
+_processor = _build_processor()
+if _processor:
+    atexit.register(_processor.flush)
+
+
+def restart_after_fork():
+    if _processor is not None:
+        _processor.restart()
+
+
+def tracing_enabled() -> bool:
+    return _processor is not None
+
+
+# ====================== API ======================
+class start_span:
+    """
+    Context manager span (sync & async):
+        with start_span("rpc eth_call", kind="client", chain="eth") as span: ...
+    Tanpa parent → root baru (kena sampling). Parent tidak disampling → no-op.
+    """
+
+    __slots__ = ("name", "kind", "attributes", "parent", "span", "_token")
+
+    def __init__(self, name: str, kind: str = "internal", parent=None, **attributes):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.parent = parent
+        self.span = None
+        self._token = None
+
+    def __enter__(self):
+        if _processor is None:
+            return NOOP_SPAN
+        parent = self.parent or _current_span.get()
+        if parent is None:
+            if random.random() >= TRACING_SAMPLE_RATIO:
+                self._token = _current_span.set(NOOP_SPAN)
+                return NOOP_SPAN
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+        elif parent is NOOP_SPAN:
+            if self.parent is NOOP_SPAN:
+                # traceparent tidak disampling: span anak juga harus no-op, bukan root baru
+                self._token = _current_span.set(NOOP_SPAN)
+            return NOOP_SPAN
+        else:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        span = Span(self.name, trace_id, parent_id, self.kind)
+        for key, value in self.attributes.items():
+            span.set_attribute(key, value)
+        # call RPC ad-hoc (rpc_url user) tidak tahu chain-nya → warisi dari parent
+        if "chain" not in span.attributes and isinstance(parent, Span):
+            span.set_attribute("chain", parent.attributes.get("chain"))
+        self.span = span
+        self._token = _current_span.set(span)
+        return span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _current_span.reset(self._token)
+        if self.span is None:
+            return False
+        self.span.end_ns = time.time_ns()
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        elif isinstance(exc, asyncio.CancelledError):
+            self.span.set_attribute("cancelled", True)
+        _processor.on_end(self.span)
+        return False
+
+
+def current_span():
+    return _current_span.get() or NOOP_SPAN
+
+
+def traced(name: str, **attributes):
+    """Decorator span untuk fungsi sync maupun async"""
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(name, **attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ====================== W3C TRACEPARENT ======================
+class RemoteParent:
+    """Parent dari header traceparent request masuk"""
+
+    __slots__ = ("trace_id", "span_id")
+
+    def __init__(self, trace_id: str, span_id: str):
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+
+TRACEPARENT_PATTERN = re.compile(r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+_ZERO_TRACE_ID = "0" * 32
+_ZERO_SPAN_ID = "0" * 16
+
+
+def parse_traceparent(value: str):
+    """
+    '00-<trace_id>-<span_id>-<flags>' → RemoteParent / NOOP_SPAN / None.
+    Header rusak (bukan hex, id nol, version ff) → None, request jadi root biasa.
+    """
+    match = TRACEPARENT_PATTERN.fullmatch(value.strip())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags = match.groups()
+    if version == "ff" or trace_id == _ZERO_TRACE_ID or span_id == _ZERO_SPAN_ID:
+        return None
+    sampled = int(flags, 16) & 1
+    return RemoteParent(trace_id, span_id) if sampled else NOOP_SPAN
+
+
+class TracingMiddleware:
+    """Span server untuk tiap request masuk, lanjutkan trace dari header traceparent"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _processor is None:
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with start_span(
+            f"{scope['method']} {scope['path']}",
+            kind="server",
+            parent=parent,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.set_attribute("http.route", route.path)
+                    if isinstance(span, Span):
+                        span.name = f"{scope['method']} {route.path}"
+                span.set_attribute("http.status_code", status)
@@ -1,12 +1,13 @@
 # 📍 lib/trx_helper.py
 import logging
-from tronpy import Tron
-from tronpy.keys import PrivateKey
-from tronpy.providers import HTTPProvider
+from lib.rpc_pool import get_tron_client
+from lib.signer_registry import as_signer
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced("send trx", chain="trx")
 async def send_trx(
     destination_wallet: str,
     amount_trx: float,
@@ -23,11 +24,12 @@ async def send_trx(
         raise ValueError("❌ private key harus diberikan!")
 
     try:
-        client = Tron(HTTPProvider(rpc_url))
+        client = get_tron_client(rpc_url)
 
-        # Load admin key
-        admin_key = PrivateKey(bytes.fromhex(private_key.replace("0x", "")))
-        admin_address = admin_key.public_key.to_base58check_address()
+        # 🔑 Signer resident (key_alias) atau derive dari private_key mentah
+        signer = as_signer("trx", private_key)
+        admin_key = signer.account
+        admin_address = signer.address
         logger.info(f"🔑 Admin TRX wallet siap: {admin_address}")
 
         if destination_wallet == admin_address:
@@ -78,9 +80,9 @@ def get_balance(address: str, rpc_url: str) -> float:
     if not rpc_url:
         raise ValueError("❌ RPC URL harus diberikan!")
     try:
-        client = Tron(HTTPProvider(rpc_url))
+        client = get_tron_client(rpc_url)
         balance = client.get_account_balance(address)
-        logger.info(f"💰 Saldo {address}: {balance} TRX")
+        logger.debug("💰 Saldo %s: %s TRX", address, balance)
         return balance
     except Exception as e:
         logger.error(f"❌ Gagal cek saldo {address}: {e}", exc_info=True)
@@ -0,0 +1,269 @@
+# 📍 lib/upstream_guard.py
+import os
+import time
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# ====================== STATE CIRCUIT BREAKER ======================
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class UpstreamUnavailable(Exception):
+    """Circuit breaker open / rate limit habis → caller harus pakai data cache/stale"""
+
+    def __init__(self, upstream: str, reason: str):
+        super().__init__(f"Upstream {upstream} tidak tersedia: {reason}")
+        self.upstream = upstream
+        self.reason = reason
+
+
+def http_status_of(error: Exception) -> int | None:
+    """Ambil HTTP status dari exception requests/httpx/aiohttp (kalau ada)"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) or getattr(error, "status", None)
+
+
+# ====================== TOKEN BUCKET ADAPTIF ======================
+class TokenBucket:
+    """
+    Token bucket dengan rate adaptif (AIMD):
+    kena 429 → rate dipotong setengah, sukses → rate naik pelan sampai max.
+    """
+
+    def __init__(self, rate: float, burst: float, min_rate: float):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self) -> float:
+        """Ambil 1 token. Return 0 kalau dapat, atau detik yang perlu ditunggu."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def on_throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+# ====================== CIRCUIT BREAKER ======================
+class CircuitBreaker:
+    """closed → (N gagal beruntun) → open → (cooldown) → half_open → 1 probe"""
+
+    def __init__(self, failure_threshold: int, open_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    return False
+                self.state = HALF_OPEN
+                self.probe_in_flight = False
+            # half-open: cuma 1 request percobaan dalam satu waktu
+            if self.probe_in_flight:
+                return False
+            self.probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.times_opened += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """Probe batal tanpa hasil (di-cancel / tidak jadi jalan) → slot half-open dibuka lagi"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self.opened_at))
+
+
+# ====================== GUARD PER UPSTREAM ======================
+class UpstreamGuard:
+    """Limiter + breaker yang dipakai bareng oleh semua call ke satu upstream"""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: float,
+        failure_threshold: int,
+        open_seconds: float,
+        max_wait: float,
+    ):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst, min_rate=rate / 16)
+        self.breaker = CircuitBreaker(failure_threshold, open_seconds)
+        self.max_wait = max_wait
+        self.calls = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.failures = 0
+
+    def _check_breaker(self):
+        if not self.breaker.allow():
+            self.rejected += 1
+            raise UpstreamUnavailable(self.name, "circuit open")
+
+    def _wait_budget_exceeded(self, wait: float, waited: float) -> bool:
+        if waited + wait > self.max_wait:
+            self.rejected += 1
+            # token tidak jadi dipakai → lepas slot probe half-open
+            self.breaker.release_probe()
+            return True
+        return False
+
+    async def acquire(self):
+        """Tunggu token (maks max_wait detik), fail fast kalau breaker open"""
+        self._check_breaker()
+        waited = 0.0
+        while True:
+            wait = self.bucket.try_acquire()
+            if wait == 0:
+                self.calls += 1
+                return
+            if self._wait_budget_exceeded(wait, waited):
+                raise UpstreamUnavailable(self.name, "rate limited")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.breaker.release_probe()
+                raise
+            waited += wait
+
+    def acquire_sync(self):
+        """
+        Versi SDK sync (tronpy Tron): tidak pernah sleep, karena dipanggil juga
+        dari jalur async (thread event loop). Token habis → langsung fail fast.
+        """
+        self._check_breaker()
+        if self.bucket.try_acquire():
+            self.rejected += 1
+            self.breaker.release_probe()
+            raise UpstreamUnavailable(self.name, "rate limited")
+        self.calls += 1
+
+    def release_probe(self):
+        """Dipanggil caller kalau call-nya di-cancel sebelum ada hasil sukses / gagal"""
+        self.breaker.release_probe()
+
+    def record_success(self):
+        self.bucket.on_success()
+        self.breaker.record_success()
+
+    def record_failure(self, error: Exception | None = None):
+        status = http_status_of(error) if error is not None else None
+        if status == 429:
+            self.record_throttled()
+            return
+        if status is not None and status < 500:
+            # 4xx biasa (404 dll) → upstream sehat, request-nya saja yang ditolak
+            self.record_success()
+            return
+        self.failures += 1
+        self.breaker.record_failure()
+
+    def record_throttled(self):
+        self.throttled += 1
+        self.bucket.on_throttled()
+        self.breaker.record_failure()
+        logger.warning(
+            "⚠️ %s kena rate limit (429), rate diturunkan ke %.2f req/s",
+            self.name,
+            self.bucket.rate,
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "times_opened": self.breaker.times_opened,
+            "retry_in_seconds": round(self.breaker.retry_in(), 2),
+            "rate_per_second": round(self.bucket.rate, 3),
+            "max_rate_per_second": self.bucket.max_rate,
+            "tokens": round(self.bucket.tokens, 2),
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "failures": self.failures,
+        }
+
+
+def _guard_from_env(name: str, rate: float, burst: float) -> UpstreamGuard:
+    prefix = f"UPSTREAM_{name.upper()}"
+    return UpstreamGuard(
+        name,
+        rate=float(os.getenv(f"{prefix}_RATE", rate)),
+        burst=float(os.getenv(f"{prefix}_BURST", burst)),
+        failure_threshold=int(os.getenv(f"{prefix}_FAILURE_THRESHOLD", "5")),
+        open_seconds=float(os.getenv(f"{prefix}_OPEN_SECONDS", "30")),
+        max_wait=float(os.getenv(f"{prefix}_MAX_WAIT", "2")),
+    )
+
+
+# 🔹 Satu guard per upstream, dipakai bareng semua modul dalam satu worker
+GUARDS = {
+    "coingecko": _guard_from_env("coingecko", rate=0.5, burst=5),
+    "trongrid": _guard_from_env("trongrid", rate=10, burst=20),
+}
+
+
+def get_guard(name: str) -> UpstreamGuard:
+    return GUARDS[name]
+
+
+def guard_for_url(url: str) -> UpstreamGuard | None:
+    """Node TronGrid publik dibatasi guard 'trongrid', node lain bebas"""
+    if "trongrid" in url:
+        return GUARDS["trongrid"]
+    return None
+
+
+def guards_snapshot() -> dict:
+    return {name: guard.snapshot() for name, guard in GUARDS.items()}
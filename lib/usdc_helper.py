@@ -1,19 +1,13 @@
 # 📍 lib/usdc_helper.py
 import logging
 import asyncio
-from lib.helpers.usdc.eth import send_usdc_eth
-from lib.helpers.usdc.bsc import send_usdc_bsc
-from lib.helpers.usdc.trx import send_usdc_trx
-from lib.helpers.usdc.base import send_usdc_base
-from lib.helpers.usdc.sol import send_usdc_solana
-from lib.helpers.usdc.polygon import send_usdc_polygon  
+from lib.chains import chain_function
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 
 
+@traced("send usdc")
 async def send_usdc(
     destination_wallet: str,
     amount: float,
@@ -27,57 +21,25 @@ async def send_usdc(
     rpc_url, private_key, token_address bisa di-override dari endpoint.
     """
     chain = chain.lower()
+    # helper per chain di-import saat pertama dipakai (lib/chains.py)
+    send_func = chain_function("send_usdc", chain)
+    if send_func is None:
+        raise ValueError(f"Chain {chain} tidak didukung untuk USDC!")
 
-    if chain == "eth":
-        return await send_usdc_eth(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "bsc":
-        return await send_usdc_bsc(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "trx":
-        return await send_usdc_trx(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "base":
-        return await send_usdc_base(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "sol":
-        # pakai loop.run_in_executor biar synchronous jadi awaitable
-        return await asyncio.get_running_loop().run_in_executor(
-            None,
-            send_usdc_solana,
+    if chain == "sol":
+        # to_thread biar synchronous jadi awaitable (context request ikut disalin)
+        return await asyncio.to_thread(
+            send_func,
             destination_wallet,
             amount,
             rpc_url,
             private_key,
             token_address,
         )
-    elif chain == "polygon":  # ✅ support Polygon
-        return await send_usdc_polygon(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    else:
-        raise ValueError(f"Chain {chain} tidak didukung untuk USDC!")
+    return await send_func(
+        destination_wallet,
+        amount,
+        rpc_url=rpc_url,
+        private_key=private_key,
+        token_address=token_address,
+    )
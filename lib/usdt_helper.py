@@ -1,20 +1,13 @@
 # 📍 lib/usdt_helper.py
 import logging
-from lib.helpers.usdt.eth import send_usdt_eth
-from lib.helpers.usdt.bsc import send_usdt_bsc
-from lib.helpers.usdt.trx import send_usdt_trx
-from lib.helpers.usdt.base import send_usdt_base
-from lib.helpers.usdt.sol import send_usdt_solana
-from lib.helpers.usdt.polygon import send_usdt_polygon  # ✅ import Polygon
 import asyncio
+from lib.chains import chain_function
+from lib.tracing import traced
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
 
 
+@traced("send usdt")
 async def send_usdt(
     destination_wallet: str,
     amount: float,
@@ -28,57 +21,25 @@ async def send_usdt(
     rpc_url, private_key, token_address bisa di-override dari endpoint.
     """
     chain = chain.lower()
+    # helper per chain di-import saat pertama dipakai (lib/chains.py)
+    send_func = chain_function("send_usdt", chain)
+    if send_func is None:
+        raise ValueError(f"Chain {chain} tidak didukung untuk USDT!")
 
-    if chain == "eth":
-        return await send_usdt_eth(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "bsc":
-        return await send_usdt_bsc(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "trx":
-        return await send_usdt_trx(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "base":
-        return await send_usdt_base(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    elif chain == "sol":
-        # pakai loop.run_in_executor biar synchronous jadi awaitable
-        return await asyncio.get_running_loop().run_in_executor(
-            None,
-            send_usdt_solana,
+    if chain == "sol":
+        # to_thread biar synchronous jadi awaitable (context request ikut disalin)
+        return await asyncio.to_thread(
+            send_func,
             destination_wallet,
             amount,
             rpc_url,
             private_key,
             token_address,
         )
-    elif chain == "polygon":  # ✅ support Polygon
-        return await send_usdt_polygon(
-            destination_wallet,
-            amount,
-            rpc_url=rpc_url,
-            private_key=private_key,
-            token_address=token_address,
-        )
-    else:
-        raise ValueError(f"Chain {chain} tidak didukung untuk USDT!")
+    return await send_func(
+        destination_wallet,
+        amount,
+        rpc_url=rpc_url,
+        private_key=private_key,
+        token_address=token_address,
+    )
@@ -1,57 +1,168 @@
 # 📍 lib/wallet_validator.py
+import os
 import re
 import logging
+from functools import lru_cache
+
+import base58
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def validate_wallet(chain: str, wallet: str) -> tuple[bool, str|None]:
+# ====================== KONFIGURASI ======================
+# Validasi alamat tanpa web3 / tronpy (keccak pycryptodome & base58 saja):
+#   EVM : hex 40 + checksum EIP-55 kalau huruf campuran → dinormalisasi ke checksum
+#   SOL : public key 32 byte + titik ed25519 valid (alamat PDA / off-curve ditolak),
+#         lewat solders (Rust, di-import saat alamat SOL pertama dicek).
+#         allow_off_curve=True (tujuan kirim SOL native): PDA seperti vault multisig
+#         sah menerima SOL, jadi cukup cek 32 byte base58
+#   TRX : base58check, 21 byte diawali 0x41
+#   TON : cek bentuk saja
+# Hasil per (keluarga, alamat) di-memo di LRU (WALLET_CACHE_SIZE), jadi alamat
+# yang sama di batch / request berikutnya tidak di-decode ulang.
+WALLET_CACHE_SIZE = int(os.getenv("WALLET_CACHE_SIZE", "65536"))
+
+# 🔹 pola di-compile sekali saat import (ikut dibagi worker kalau master preload)
+EVM_PATTERN = re.compile(r"0x[a-fA-F0-9]{40}")
+SOL_PATTERN = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+TRX_PATTERN = re.compile(r"T[1-9A-HJ-NP-Za-km-z]{33}")
+TON_PATTERN = re.compile(r"U[0-9A-Za-z]{47,66}")
+
+# 🔹 chain (termasuk alias token) → keluarga validasi
+FAMILY_OF_CHAIN = {
+    **dict.fromkeys(("eth", "bsc", "bnb", "base", "polygon", "matic", "usdt", "usdc"), "evm"),
+    "sol": "sol",
+    "trx": "trx",
+    "ton": "ton",
+}
+
+TRON_PREFIX = 0x41
+# 🔹 nibble hash keccak >= 8 → huruf hex di posisi itu jadi kapital (EIP-55)
+_UPPER_NIBBLES = frozenset("89abcdef")
+
+
+# ====================== CEK PER KELUARGA ======================
+def evm_checksum(address: str) -> str:
+    """Alamat EIP-55 dari 0x + 40 hex (huruf apa pun)"""
+    from Crypto.Hash import keccak  # pycryptodome (~50ms import) saat alamat EVM pertama
+
+    lower = address[2:].lower()
+    digest = keccak.new(digest_bits=256, data=lower.encode("ascii")).digest().hex()
+    return "0x" + "".join(
+        c.upper() if h in _UPPER_NIBBLES else c for c, h in zip(lower, digest)
+    )
+
+
+def _check_evm(address: str) -> tuple[bool, str | None, str | None]:
+    if not address.startswith("0x"):
+        address = "0x" + address
+    if not EVM_PATTERN.fullmatch(address):
+        return False, None, "format EVM harus 0x + 40 karakter hex"
+    checksummed = evm_checksum(address)
+    body = address[2:]
+    # huruf seragam = tanpa checksum (sah), huruf campuran wajib cocok EIP-55
+    if body != body.lower() and body != body.upper() and address != checksummed:
+        return False, None, "checksum EIP-55 tidak cocok"
+    return True, checksummed, None
+
+
+def _sol_pubkey(address: str):
+    """(Pubkey, alasan_kalau_tidak_valid)"""
+    if not SOL_PATTERN.fullmatch(address):
+        return None, "format Solana harus base58 32-44 karakter"
+    from solders.pubkey import Pubkey  # SDK Solana di-import saat dipakai
+
+    try:
+        return Pubkey.from_string(address), None
+    except ValueError:
+        return None, "public key Solana harus 32 byte base58"
+
+
+def _check_sol(address: str) -> tuple[bool, str | None, str | None]:
+    pubkey, reason = _sol_pubkey(address)
+    if pubkey is None:
+        return False, None, reason
+    if not pubkey.is_on_curve():
+        return False, None, "bukan titik ed25519 (alamat PDA / program), tidak bisa jadi wallet"
+    return True, address, None
+
+
+def _check_sol_account(address: str) -> tuple[bool, str | None, str | None]:
+    pubkey, reason = _sol_pubkey(address)
+    if pubkey is None:
+        return False, None, reason
+    return True, address, None
+
+
+def _check_trx(address: str) -> tuple[bool, str | None, str | None]:
+    if not TRX_PATTERN.fullmatch(address):
+        return False, None, "format TRON harus T + 33 karakter base58"
+    try:
+        raw = base58.b58decode_check(address)
+    except ValueError:
+        return False, None, "checksum base58check TRON tidak cocok"
+    if len(raw) != 21 or raw[0] != TRON_PREFIX:
+        return False, None, "payload TRON harus 21 byte diawali 0x41"
+    return True, address, None
+
+
+def _check_ton(address: str) -> tuple[bool, str | None, str | None]:
+    if TON_PATTERN.fullmatch(address):
+        return True, address, None
+    return False, None, "format TON tidak dikenali"
+
+
+_CHECKS = {
+    "evm": _check_evm,
+    "sol": _check_sol,
+    "sol_account": _check_sol_account,
+    "trx": _check_trx,
+    "ton": _check_ton,
+}
+
+
+@lru_cache(maxsize=WALLET_CACHE_SIZE)
+def _check_cached(family: str, address: str) -> tuple[bool, str | None, str | None]:
+    return _CHECKS[family](address)
+
+
+# ====================== API ======================
+def check_address(
+    chain: str, address: str, allow_off_curve: bool = False
+) -> tuple[bool, str | None, str | None]:
+    """
+    Validasi alamat untuk chain.
+    allow_off_curve: SOL boleh alamat PDA (penerima SOL native, bukan owner token account).
+    Return (is_valid, alamat_normal_atau_none, alasan_kalau_tidak_valid).
+    """
+    family = FAMILY_OF_CHAIN.get(chain.lower())
+    if family is None:
+        return False, None, f"chain {chain} tidak didukung"
+    if allow_off_curve and family == "sol":
+        family = "sol_account"
+    return _check_cached(family, address.strip())
+
+
+def check_addresses(chain: str, addresses: list[str]) -> list[tuple[bool, str | None, str | None]]:
+    """Batch: keluarga chain di-resolve sekali, tiap alamat lewat LRU yang sama"""
+    family = FAMILY_OF_CHAIN.get(chain.lower())
+    if family is None:
+        reason = (False, None, f"chain {chain} tidak didukung")
+        return [reason] * len(addresses)
+    return [_check_cached(family, address.strip()) for address in addresses]
+
+
+def validate_wallet(chain: str, wallet: str) -> tuple[bool, str | None]:
     """
     Validasi wallet address berdasarkan chain.
     Return tuple: (is_valid, normalized_chain_or_none)
     """
-    wallet = wallet.strip()
     chain_lower = chain.lower()
-    logger.info("Validating wallet '%s' for chain '%s'", wallet, chain_lower)
-
-    # === EVM chains (ETH, BSC, Base, USDT, USDC) ===
-    evm_chains = ["eth", "bsc", "bnb", "base", "usdt", "usdc"]
-    if chain_lower in evm_chains:
-        if not wallet.startswith("0x"):
-            wallet = "0x" + wallet
-            logger.debug("Auto-prefixed 0x: %s", wallet)
-        if re.fullmatch(r"0x[a-fA-F0-9]{40}", wallet):
-            logger.info("Valid EVM wallet detected for chain %s", chain_lower)
-            # Normalize BNB -> bsc for consistent naming
-            normalized_chain = chain_lower
-            return True, normalized_chain
-        logger.warning("Invalid EVM wallet for chain %s: %s", chain_lower, wallet)
-        return False, chain_lower                                                       
-
-    # === SOLANA ===
-    if chain_lower == "sol":
-        if re.fullmatch(r"[1-9A-HJ-NP-Za-km-z]{32,44}", wallet):
-            logger.info("Valid SOL wallet detected")
-            return True, "sol"
-        logger.warning("Invalid SOL wallet: %s", wallet)
-        return False, "sol"
-
-    # === TRON ===
-    if chain_lower == "trx":
-        if re.fullmatch(r"T[a-zA-Z0-9]{33}", wallet):
-            logger.info("Valid TRX wallet detected")
-            return True, "trx"
-        logger.warning("Invalid TRX wallet: %s", wallet)
-        return False, "trx"
-
-    # === TON ===
-    if chain_lower == "ton":
-        if re.fullmatch(r"U[0-9A-Za-z]{47,66}", wallet):
-            logger.info("Valid TON wallet detected")
-            return True, "ton"
-        logger.warning("Invalid TON wallet: %s", wallet)
-        return False, "ton"
-
-    # fallback
-    logger.error("Unknown chain: %s", chain_lower)
-    return False, None
+    valid, _, reason = check_address(chain_lower, wallet)
+    if not valid:
+        logger.debug("Wallet tidak valid untuk %s: %s (%s)", chain_lower, wallet, reason)
+    return valid, chain_lower if chain_lower in FAMILY_OF_CHAIN else None
+
+
+def wallet_cache_snapshot() -> dict:
+    info = _check_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
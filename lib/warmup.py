@@ -0,0 +1,96 @@
+# 📍 lib/warmup.py
+import os
+import time
+import asyncio
+import logging
+
+from lib.rpc_pool import warm_pools
+from lib.price_store import warm_prices
+from lib.token_metadata import warm_token_metadata
+from lib.preload import warm_chains
+
+logger = logging.getLogger(__name__)
+
+# ====================== KONFIGURASI ======================
+# Warm-up saat startup worker (lifespan), semua langkah jalan paralel:
+#   chains   : SDK + ABI codec keluarga chain aktif (no-op kalau master sudah preload)
+#   prices   : harga CoinGecko semua token yang di-track
+#   metadata : metadata token populer (TOKEN_ALIAS)
+#   rpc_pool : koneksi + TLS ke semua endpoint RPC_POOL_*, sekalian resolve chain id EVM
+# /ready menjawab 503 sampai semua langkah selesai atau WARMUP_TIMEOUT lewat
+# (langkah yang belum selesai tetap jalan di background). /ping tidak terpengaruh.
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "15"))
+
+_state = {"ready": False, "timed_out": False, "started_at": None, "finished_at": None}
+_steps: dict[str, dict] = {}
+_tasks: list[asyncio.Task] = []
+
+
+def _steps_to_run() -> dict:
+    return {
+        "chains": lambda: asyncio.to_thread(warm_chains),
+        "prices": warm_prices,
+        "metadata": warm_token_metadata,
+        "rpc_pool": warm_pools,
+    }
+
+
+async def _run_step(name: str, step):
+    start = time.perf_counter()
+    _steps[name] = {"status": "running", "ms": None}
+    try:
+        await step()
+        _steps[name]["status"] = "done"
+    except asyncio.CancelledError:
+        _steps[name]["status"] = "cancelled"
+        raise
+    except Exception as e:
+        # langkah gagal tidak menahan readiness, request pertama yang bayar
+        logger.warning("⚠️ Warm-up %s gagal: %s", name, e)
+        _steps[name].update(status="failed", error=str(e))
+    finally:
+        _steps[name]["ms"] = round((time.perf_counter() - start) * 1000)
+
+
+# ====================== WARM-UP ======================
+async def run_warmup():
+    """Dipanggil lifespan: jalankan semua langkah paralel, tandai siap saat selesai / timeout"""
+    _state["started_at"] = time.time()
+    _tasks[:] = [
+        asyncio.create_task(_run_step(name, step), name=f"warmup-{name}")
+        for name, step in _steps_to_run().items()
+    ]
+    _, pending = await asyncio.wait(_tasks, timeout=WARMUP_TIMEOUT)
+    _state["timed_out"] = bool(pending)
+    _state["finished_at"] = time.time()
+    _state["ready"] = True
+    elapsed = _state["finished_at"] - _state["started_at"]
+    if pending:
+        logger.warning(
+            "⏱️ Warm-up timeout %.1fs, siap tanpa menunggu: %s",
+            elapsed,
+            ", ".join(name for name, step in _steps.items() if step["status"] == "running"),
+        )
+    else:
+        logger.info("🔥 Warm-up selesai %.0fms: %s", elapsed * 1000, _steps)
+
+
+def cancel_warmup():
+    for task in _tasks:
+        task.cancel()
+
+
+# ====================== STATUS ======================
+def is_ready() -> bool:
+    return _state["ready"]
+
+
+def warmup_snapshot() -> dict:
+    started = _state["started_at"]
+    end = _state["finished_at"] or time.time()
+    return {
+        "ready": _state["ready"],
+        "timed_out": _state["timed_out"],
+        "elapsed_seconds": round(end - started, 3) if started else None,
+        "steps": _steps,
+    }
@@ -1,8 +1,10 @@
 # 📍 main.py
 
 import os
+import asyncio
 import logging
-from fastapi import FastAPI, Request, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from dotenv import load_dotenv
@@ -10,8 +12,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # ====================== LOGGING ======================
+from lib.logging_setup import setup_logging
+
+setup_logging()
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+# ====================== CASSETTE ======================
+# 📼 record / replay call HTTP keluar (CASSETTE_MODE), dipasang sebelum client dibuat
+from lib.cassette import install as install_cassette
+
+install_cassette()
 
 # ====================== LOAD ENV ======================
 # 🔥 Ambil secret dari environment, bukan dari config
@@ -28,6 +38,51 @@ from routers.crypto.tokens import tokens_router
 from routers.crypto.swap import swap_router
 from routers.crypto.token_info import token_info_router
 from routers.crypto.tx_status import tx_status_router
+from routers.crypto.validate import validate_router
+from routers.crypto.diagnostics import diagnostics_router
+from routers.crypto.metrics import metrics_router
+from routers.crypto.debug import debug_router
+from lib.rpc_pool import POOLS, keepalive_loop
+from lib.coin_index import coin_index_loop
+from lib.token_metadata import flush_snapshot as flush_metadata_snapshot
+from lib.loop_monitor import loop_lag_loop
+from lib.preload import mark_ready
+from lib.signer_registry import load_signers
+from lib.warmup import cancel_warmup, run_warmup
+from lib.rapidapi_gateway import RapidAPIGatewayMiddleware
+from lib.metrics import MetricsMiddleware
+from lib.request_accounting import UpstreamAccountingMiddleware
+from lib.tracing import TracingMiddleware
+from lib.json_response import OrjsonResponse
+from lib.http_cache import HTTPCacheMiddleware
+from lib.openapi_static import install as install_openapi
+
+
+# ====================== LIFESPAN ======================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 🔑 Signer hot wallet (env / keystore) di-derive sekali, no-op kalau master sudah preload
+    load_signers()
+    # 🔥 Warm-up paralel (SDK chain, harga, metadata token, koneksi RPC pool),
+    # /ready baru 200 setelah selesai atau WARMUP_TIMEOUT
+    warmup_task = asyncio.create_task(run_warmup())
+    # 🔥 RPC pool: jaga koneksi tetap hangat selama worker hidup
+    keepalive_task = asyncio.create_task(keepalive_loop()) if POOLS else None
+    # 🗂️ Index kontrak → coin id, refresh berkala dari /coins/list
+    coin_index_task = asyncio.create_task(coin_index_loop())
+    # 🐢 lag event loop (+ watchdog stack kalau LOOP_WATCHDOG=1)
+    loop_monitor_task = asyncio.create_task(loop_lag_loop())
+    # ⏱️ boot time worker (fork / exec → siap melayani) untuk /diagnostics
+    mark_ready()
+    yield
+    warmup_task.cancel()
+    cancel_warmup()
+    if keepalive_task:
+        keepalive_task.cancel()
+    coin_index_task.cancel()
+    loop_monitor_task.cancel()
+    # 💾 snapshot metadata token yang masih tertunda (debounce) ditulis sebelum exit
+    flush_metadata_snapshot()
 
 
 # ====================== APP ======================
@@ -35,50 +90,41 @@ app = FastAPI(
     title="MultiChain Crypto API",
     description="API for sending, simulating swaps, and checking crypto tokens (ETH, USDT, BNB, SOL, etc.).",
     version="1.1.1",
+    lifespan=lifespan,
+    # ⚡ encoder orjson (+ konversi HexBytes / AttributeDict / solders) untuk semua route
+    default_response_class=OrjsonResponse,
+    # 📄 /openapi.json, /docs, /redoc disajikan statis (lib/openapi_static.py)
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 
-# ====================== MIDDLEWARE ANTI AKSES DOMAIN ASLI ======================
-@app.middleware("http")
-async def enforce_rapidapi_proxy(request: Request, call_next):
-    """
-    🔒 Middleware ini memblokir akses langsung ke domain asli,
-    tapi mengizinkan akses ke /docs, /redoc, /openapi.json, dan /ping.
-    """
+# ====================== HTTP CACHE ======================
+# 🗄️ paling dalam → ETag + 304 hanya untuk request yang sudah lolos gateway
+app.add_middleware(HTTPCacheMiddleware)
 
-    path = request.url.path
 
-    # 🔓 WHITELIST → boleh diakses tanpa RapidAPI
-    PUBLIC_PATHS = [
+# ====================== MIDDLEWARE ANTI AKSES DOMAIN ASLI ======================
+# 🔓 WHITELIST → boleh diakses tanpa RapidAPI
+PUBLIC_PATHS = frozenset(
+    [
         "/docs",
         "/redoc",
         "/openapi.json",
         "/api/v1/crypto/ping",
+        "/api/v1/crypto/ready",
         "/api/v1/crypto/tokens",
         "/api/v1/crypto/token_info",
     ]
+)
 
-    # kalau path ada di whitelist → langsung lolos
-    if path in PUBLIC_PATHS:
-        return await call_next(request)
-
-    # selain whitelist → wajib RapidAPI
-    proxy_secret = request.headers.get("X-RapidAPI-Proxy-Secret")
-
-    if RAPIDAPI_SECRET is None:
-        logger.error("❌ ENV 'RAPIDAPI_SECRET' belum diset!")
-        raise HTTPException(status_code=500, detail="Server misconfigured")
-
-    if proxy_secret != RAPIDAPI_SECRET:
-        logger.warning(
-            f"❌ Blok akses ilegal dari {request.client.host} ke {request.url.path}"
-        )
-        raise HTTPException(
-            status_code=403, detail="Forbidden: Only RapidAPI gateway allowed"
-        )
+if RAPIDAPI_SECRET is None:
+    logger.error("❌ ENV 'RAPIDAPI_SECRET' belum diset!")
 
-    logger.info(f"✅ Akses RapidAPI valid ke {path}")
-    return await call_next(request)
+app.add_middleware(
+    RapidAPIGatewayMiddleware, secret=RAPIDAPI_SECRET, public_paths=PUBLIC_PATHS
+)
 
 
 # ====================== CORS (RapidAPI Testing) ======================
@@ -97,6 +143,15 @@ app.add_middleware(
 )
 
 
+# ====================== METRICS ======================
+# ⏱️ hitung & timing semua call keluar per request → header Server-Timing
+app.add_middleware(UpstreamAccountingMiddleware)
+# 🧵 span server per request (traceparent W3C), induk semua span call keluar
+app.add_middleware(TracingMiddleware)
+# 📈 paling luar → latency yang terukur termasuk gateway & CORS
+app.add_middleware(MetricsMiddleware)
+
+
 # ====================== REGISTER CRYPTO ROUTERS ======================
 crypto_routers = [
     ping_router,
@@ -108,6 +163,10 @@ crypto_routers = [
     swap_router,
     token_info_router,
     tx_status_router,
+    validate_router,
+    diagnostics_router,
+    metrics_router,
+    debug_router,
 ]
 
 for r in crypto_routers:
@@ -135,3 +194,8 @@ def custom_openapi():
 
 
 app.openapi = custom_openapi
+
+
+# ====================== OPENAPI STATIS ======================
+# 📄 skema hasil build (openapi.json) dimuat sekali: bytes + gzip + ETag
+install_openapi(app)
@@ -2,7 +2,9 @@
 import logging
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from lib.balance_checker import check_balance
+from lib.balance_checker import BALANCE_FETCHERS, check_balance
+from lib.rpc_pool import has_pool
+from lib.chains import disabled_reason
 
 balance_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -60,6 +62,17 @@ class ErrorResponse(BaseModel):
                 }
             },
         },
+        400: {
+            "description": "Unsupported chain / no RPC URL and no server RPC pool",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "error",
+                        "detail": "RPC URL harus diberikan untuk ETH",
+                    }
+                }
+            },
+        },
         500: {
             "description": "Failed to check balance",
             "content": {
@@ -76,15 +89,29 @@ class ErrorResponse(BaseModel):
 async def get_wallet_balance(
     chain: str = Query(..., description="Blockchain chain: eth, bsc, bnb, sol, trx"),
     wallet: str = Query(..., description="Wallet address to check balance"),
-    rpc_url: str = Query(..., description="RPC URL for mainnet or testnet"),
+    rpc_url: str | None = Query(
+        None,
+        description="RPC URL for mainnet or testnet (optional if the server has an RPC pool for this chain)",
+    ),
 ):
     """
     Check wallet balance per blockchain chain.
-    User must provide the RPC URL (mainnet or testnet).
+    User must provide the RPC URL (mainnet or testnet), unless the server
+    has an RPC pool configured for the chain.
     """
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+    if chain.lower() not in BALANCE_FETCHERS:
+        raise HTTPException(status_code=400, detail=f"Chain {chain} is not supported")
+    if not rpc_url and not has_pool(chain):
+        raise HTTPException(
+            status_code=400, detail=f"RPC URL harus diberikan untuk {chain.upper()}"
+        )
+
     try:
         bal = await check_balance(chain, wallet, rpc_url)
-        logger.info(f"🔹 Balance checked: {wallet} on {chain.upper()} = {bal}")
+        logger.info("🔹 Balance checked: %s on %s = %s", wallet, chain.upper(), bal)
         return {
             "status": "success",
             "chain": chain.upper(),
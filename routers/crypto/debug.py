@@ -0,0 +1,45 @@
+# 📍 routers/crypto/debug.py
+import os
+import logging
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from lib.admin_auth import admin_enabled, is_admin
+from lib.profiler import (
+    MAX_SECONDS,
+    PROFILER_ENABLED,
+    ProfilerBusy,
+    profile,
+    to_collapsed,
+    to_speedscope,
+)
+
+debug_router = APIRouter()  # 🔹 router internal, tetap lewat gateway RapidAPI
+logger = logging.getLogger(__name__)
+
+
+@debug_router.get("/debug/profile", include_in_schema=False)
+async def debug_profile(
+    request: Request,
+    seconds: float = Query(5, gt=0, le=MAX_SECONDS),
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope)$"),
+):
+    """Sampling profiler di worker yang melayani request ini (thread + asyncio task)"""
+    if not PROFILER_ENABLED or not admin_enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+    # secret RapidAPI dipegang semua subscriber → profiler butuh token operator sendiri
+    if not is_admin(request.headers):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+    logger.warning("🔬 Profiling worker pid=%s selama %ss", os.getpid(), seconds)
+    try:
+        result = await profile(seconds)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    headers = {"X-Profile-Pid": str(result["pid"])}
+    if format == "speedscope":
+        headers["Content-Disposition"] = (
+            f'attachment; filename="profile-{result["pid"]}.speedscope.json"'
+        )
+        return JSONResponse(to_speedscope(result), headers=headers)
+    return PlainTextResponse(to_collapsed(result), headers=headers)
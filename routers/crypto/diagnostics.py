@@ -0,0 +1,42 @@
+# 📍 routers/crypto/diagnostics.py
+import logging
+from fastapi import APIRouter
+from lib.upstream_guard import guards_snapshot
+from lib.rpc_pool import pool_snapshot
+from lib.hedging import hedge_snapshot
+from lib.price_store import price_store_snapshot
+from lib.token_metadata import token_metadata_snapshot
+from lib.coin_index import coin_index_snapshot
+from lib.loop_monitor import loop_monitor_snapshot
+from lib.cassette import cassette_snapshot
+from lib.chains import chains_snapshot
+from lib.preload import preload_snapshot
+from lib.warmup import warmup_snapshot
+from lib.wallet_validator import wallet_cache_snapshot
+from lib.signer_registry import signers_snapshot
+from lib.logging_setup import logging_snapshot
+
+diagnostics_router = APIRouter()  # 🔹 router internal, tidak masuk docs publik
+logger = logging.getLogger(__name__)
+
+
+@diagnostics_router.get("/diagnostics/upstreams", include_in_schema=False)
+async def upstreams_diagnostics():
+    """Kondisi limiter/breaker upstream, kesehatan RPC pool, hedging & lag event loop"""
+    return {
+        "status": "success",
+        "upstreams": guards_snapshot(),
+        "rpc_pool": pool_snapshot(),
+        "hedging": hedge_snapshot(),
+        "price_age_seconds": price_store_snapshot(),
+        "token_metadata": token_metadata_snapshot(),
+        "coin_index": coin_index_snapshot(),
+        "event_loop": loop_monitor_snapshot(),
+        "cassette": cassette_snapshot(),
+        "chains": chains_snapshot(),
+        "process": preload_snapshot(),
+        "warmup": warmup_snapshot(),
+        "wallet_cache": wallet_cache_snapshot(),
+        "signers": signers_snapshot(),
+        "logging": logging_snapshot(),
+    }
@@ -2,8 +2,10 @@
 import logging
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from web3 import Web3
 import httpx  # untuk Solana/TRX RPC
+from lib.chains import disabled_reason
+from lib.rpc_pool import get_web3, resolve_rpc_url
+from lib.tracing import current_span, traced
 
 estimate_gas_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -29,10 +31,13 @@ class ErrorResponse(BaseModel):
 
 
 # ===== Helper Estimate Gas =====
+@traced("estimate_gas_fee")
 async def estimate_gas_fee(token: str, chain: str, amount: float, rpc_url: str):
     token_lower = token.lower()
     chain_lower = chain.lower()
+    current_span().set_attribute("chain", chain_lower)
 
+    rpc_url = resolve_rpc_url(chain_lower, rpc_url)
     if not rpc_url:
         raise ValueError("RPC URL harus dikirim user, tidak ada default")
 
@@ -42,12 +47,10 @@ async def estimate_gas_fee(token: str, chain: str, amount: float, rpc_url: str):
 
     if chain_lower in ["eth", "bnb", "polygon", "base"]:
         # Web3 compatible chains
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise ValueError(f"RPC {rpc_url} tidak bisa connect")
+        w3 = get_web3(rpc_url, chain_lower)
         gas_price = w3.eth.gas_price
         gas_limit = 21000
-        gas_fee = Web3.from_wei(gas_price * gas_limit, "ether")
+        gas_fee = w3.from_wei(gas_price * gas_limit, "ether")
         return float(gas_fee)
 
     elif chain_lower == "sol":
@@ -79,9 +82,16 @@ async def estimate_gas(
     chain: str = Query(..., description="Blockchain chain: eth, bsc, bnb, sol, trx"),
     token: str = Query(..., description="Token symbol to send, e.g., ETH, USDT, SOL"),
     amount: float = Query(..., description="Amount of token to send"),
-    rpc_url: str = Query(..., description="Custom RPC URL yang HARUS dikirim user"),
+    rpc_url: str = Query(
+        None,
+        description="Custom RPC URL (wajib kalau server tidak punya RPC pool untuk chain ini)",
+    ),
 ):
-    if not rpc_url:
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+
+    if not resolve_rpc_url(chain, rpc_url):
         logger.error("❌ RPC URL tidak dikirim user")
         raise HTTPException(status_code=400, detail="RPC URL harus dikirim dari user")
 
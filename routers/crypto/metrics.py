@@ -0,0 +1,12 @@
+# 📍 routers/crypto/metrics.py
+from fastapi import APIRouter, Response
+from lib.metrics import render_metrics
+
+metrics_router = APIRouter()  # 🔹 endpoint scrape Prometheus, tetap lewat gateway
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Metrik format Prometheus (gabungan semua worker gunicorn)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
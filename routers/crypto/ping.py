@@ -1,6 +1,8 @@
 # 📍 routers/crypto/ping.py
 import logging
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from lib.warmup import is_ready, warmup_snapshot
 from pydantic import BaseModel
 
 ping_router = APIRouter()
@@ -35,3 +37,12 @@ class PingResponse(BaseModel):
 async def ping():
     logger.info("🔹 Ping endpoint hit")
     return {"status": "ok", "message": "Crypto API is active"}
+
+
+# 🔹 Readiness untuk load balancer / orchestrator: 503 selama warm-up startup
+@ping_router.get("/ready", include_in_schema=False)
+async def ready():
+    snapshot = warmup_snapshot()
+    if not is_ready():
+        return JSONResponse({"status": "warming_up", **snapshot}, status_code=503)
+    return {"status": "ready", **snapshot}
@@ -1,8 +1,10 @@
 # 📍 routers/crypto/price.py
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
-from lib.coingecko import get_current_price  # ✅ import yang diperlukan
+from lib.coingecko import TOKEN_MAP
+from lib.price_store import FRESH_SECONDS, get_price_quote
+from lib.http_cache import cache_headers
 
 price_router = APIRouter()  # 🔹 router khusus untuk price
 logger = logging.getLogger(__name__)
@@ -13,10 +15,16 @@ class PriceResponse(BaseModel):
     status: str
     token: str
     price_idr: float
+    age_seconds: float
 
     class Config:
         schema_extra = {
-            "example": {"status": "success", "token": "BTC", "price_idr": 450000000}
+            "example": {
+                "status": "success",
+                "token": "BTC",
+                "price_idr": 450000000,
+                "age_seconds": 12.5,
+            }
         }
 
 
@@ -42,6 +50,7 @@ class ErrorResponse(BaseModel):
                         "status": "success",
                         "token": "BTC",
                         "price_idr": 450000000,
+                        "age_seconds": 12.5,
                     }
                 }
             },
@@ -87,24 +96,45 @@ class ErrorResponse(BaseModel):
     },
 )
 async def get_token_price(
+    response: Response,
     token: str = Query(
         ...,
         description="Token symbol to fetch the current price for, e.g., BTC, ETH, SOL",
-    )
+    ),
 ):
     """
     Fetch the current real-time price of a token in Indonesian Rupiah (IDR).
 
     - **token**: The token symbol to get the price for (e.g., BTC, ETH, SOL)
+
+    Kalau CoinGecko sedang gagal, harga terakhir yang valid tetap dikirim;
+    `age_seconds` menunjukkan umur harga tersebut. Cache-Control max-age =
+    sisa umur segar harga (0 kalau sudah stale).
     """
     try:
-        price = await get_current_price(token)
-        if price == 0:
+        coin_id = TOKEN_MAP.get(token.lower())
+        quote = await get_price_quote(coin_id) if coin_id else None
+        if not quote or not quote["idr"]:
             raise HTTPException(
                 status_code=404, detail=f"Price for {token.upper()} is not available"
             )
-        logger.info(f"🔹 Price fetched: {token.upper()} = {price} IDR")
-        return {"status": "success", "token": token.upper(), "price_idr": price}
+        logger.info(
+            "🔹 Price fetched: %s = %s IDR (umur %ss)",
+            token.upper(),
+            quote["idr"],
+            quote["age_seconds"],
+        )
+        # age_seconds di body berubah tiap request → ETag lemah per versi harga
+        cache_headers(
+            response.headers, FRESH_SECONDS - quote["age_seconds"], quote["fetched_at"]
+        )
+        response.headers["ETag"] = f'W/"{coin_id}-{quote["fetched_at"]:.0f}"'
+        return {
+            "status": "success",
+            "token": token.upper(),
+            "price_idr": quote["idr"],
+            "age_seconds": quote["age_seconds"],
+        }
     except HTTPException as he:
         raise he
     except Exception as e:
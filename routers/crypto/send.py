@@ -1,9 +1,13 @@
 # 📍 routers/crypto/send.py
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from lib.native_sender import send_token
 from lib.stable_sender import send_usdc_token, send_usdt_token
+from lib.chains import disabled_reason
+from lib.wallet_validator import check_address
+from lib.signer_registry import SignerError, get_signer
+from lib.admin_auth import is_admin
 
 send_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,6 +25,37 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+def _checked_destination(
+    chain: str, destination_wallet: str, allow_off_curve: bool = False
+) -> str:
+    """Tolak alamat tujuan yang tidak valid sebelum ada call RPC, return alamat normal"""
+    valid, normalized, reason = check_address(chain, destination_wallet, allow_off_curve)
+    if not valid:
+        raise HTTPException(
+            status_code=400, detail=f"destination_wallet tidak valid untuk {chain.upper()}: {reason}"
+        )
+    return normalized
+
+
+def _signing_key(
+    request: Request, chain: str, key_alias: str | None, private_key: str | None
+):
+    """private_key mentah, atau Signer resident dari key_alias (lib/signer_registry.py)"""
+    if not key_alias:
+        return private_key
+    if private_key:
+        raise HTTPException(status_code=400, detail="Pakai salah satu: private_key atau key_alias")
+    # secret RapidAPI dipegang semua subscriber → key_alias wajib token operator.
+    # Semua penolakan sama (403) supaya alias tidak bisa ditebak / dienumerasi
+    if not is_admin(request.headers):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    try:
+        return get_signer(key_alias, chain)
+    except SignerError as e:
+        logger.warning("🔑 key_alias ditolak: %s", e)
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
 # -------------------- NATIVE --------------------
 @send_router.post(
     "/send/native",
@@ -33,7 +68,7 @@ class ErrorResponse(BaseModel):
         "- TRON: trx\n"
         "- Polygon: polygon (MATIC)\n"
         "- Base: base\n\n"
-        "Pastikan RPC URL dan private key valid.\n"
+        "Pastikan RPC URL dan private key (atau key_alias + header X-Admin-Token) valid.\n"
         "Response mengandung status transaksi dan tx_hash.\n"
         "Gunakan token sesuai chain agar tidak gagal."
     ),
@@ -66,12 +101,21 @@ class ErrorResponse(BaseModel):
 )
 
 async def send_native_token(
+    request: Request,
     token: str,
     destination_wallet: str,
     amount: float,
     rpc_url: str = None,
     private_key: str = None,
+    key_alias: str = None,  # 🔑 alias hot wallet di server (pengganti private_key)
 ):
+    disabled = disabled_reason(token)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+    # SOL native boleh ke PDA (vault multisig dll), token SPL butuh owner on-curve
+    destination_wallet = _checked_destination(token, destination_wallet, allow_off_curve=True)
+    signing_key = _signing_key(request, token, key_alias, private_key)
+
     try:
         if amount <= 0:
             raise ValueError("Amount harus lebih dari 0")
@@ -81,7 +125,7 @@ async def send_native_token(
         )
 
         tx_hash = await send_token(
-            token, destination_wallet, amount, rpc_url=rpc_url, private_key=private_key
+            token, destination_wallet, amount, rpc_url=rpc_url, private_key=signing_key
         )
         if not tx_hash:
             raise HTTPException(status_code=400, detail="Transaksi gagal dijalankan")
@@ -113,7 +157,7 @@ async def send_native_token(
         "- Polygon: polygon (MATIC)\n"
         "- Base: base\n\n"
         "- Pastikan token_address sesuai chain.\n"
-        "- RPC URL dan private key valid.\n"
+        "- RPC URL dan private key (atau key_alias + header X-Admin-Token) valid.\n"
         "Response mengandung status transaksi dan tx_hash."
     ),
     response_model=SendResponse,
@@ -145,17 +189,24 @@ async def send_native_token(
 )
 
 async def send_usdc_endpoint(
+    request: Request,
     chain: str,
     destination_wallet: str,
     amount: float,
     token_address: str,
     rpc_url: str = None,
     private_key: str = None,
+    key_alias: str = None,  # 🔑 alias hot wallet di server (pengganti private_key)
 ):
     if amount <= 0:
         raise HTTPException(status_code=400, detail="Amount harus lebih dari 0")
     if not token_address:
         raise HTTPException(status_code=400, detail="USDC token address wajib diisi")
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+    destination_wallet = _checked_destination(chain, destination_wallet)
+    signing_key = _signing_key(request, chain, key_alias, private_key)
 
     try:
         logger.info(
@@ -166,7 +217,7 @@ async def send_usdc_endpoint(
             amount=amount,
             chain=chain,
             rpc_url=rpc_url,
-            private_key=private_key,
+            private_key=signing_key,
             token_address=token_address,
         )
         if not tx_hash:
@@ -195,7 +246,7 @@ async def send_usdc_endpoint(
         "- Polygon: polygon (MATIC)\n"
         "- Base: base\n\n"
         "- Pastikan token_address sesuai chain.\n"
-        "- RPC URL dan private key valid.\n"
+        "- RPC URL dan private key (atau key_alias + header X-Admin-Token) valid.\n"
         "Response mengandung status transaksi dan tx_hash."
     ),
     response_model=SendResponse,
@@ -227,17 +278,24 @@ async def send_usdc_endpoint(
 )
 
 async def send_usdt_endpoint(
+    request: Request,
     chain: str,
     destination_wallet: str,
     amount: float,
     token_address: str,
     rpc_url: str = None,
     private_key: str = None,
+    key_alias: str = None,  # 🔑 alias hot wallet di server (pengganti private_key)
 ):
     if amount <= 0:
         raise HTTPException(status_code=400, detail="Amount harus lebih dari 0")
     if not token_address:
         raise HTTPException(status_code=400, detail="USDT token address wajib diisi")
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+    destination_wallet = _checked_destination(chain, destination_wallet)
+    signing_key = _signing_key(request, chain, key_alias, private_key)
 
     try:
         logger.info(
@@ -248,7 +306,7 @@ async def send_usdt_endpoint(
             amount=amount,
             chain=chain,
             rpc_url=rpc_url,
-            private_key=private_key,
+            private_key=signing_key,
             token_address=token_address,
         )
         if not tx_hash:
@@ -1,8 +1,8 @@
 # 📍 routers/crypto/swap.py
 import logging
-import httpx
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
+from lib.price_store import get_price_quote
 
 swap_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -74,19 +74,16 @@ async def get_token_price_usd(token: str) -> float:
     if not token_id:
         raise HTTPException(status_code=400, detail=f"Token {token} is not supported")
 
-    url = f"https://api.coingecko.com/api/v3/simple/price?ids={token_id}&vs_currencies=usd"
+    quote = await get_price_quote(token_id)
+    price = quote["usd"] if quote else None
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, timeout=10)
-        data = resp.json()
-        price = data.get(token_id, {}).get("usd")
-
-        if price is None:
-            raise HTTPException(
-                status_code=500, detail=f"Failed to fetch price for {token}"
-            )
+    if price is None:
+        # upstream gagal & belum ada harga terakhir yang bisa dipakai
+        raise HTTPException(
+            status_code=503, detail=f"Failed to fetch price for {token}"
+        )
 
-        return price
+    return price
 
 
 @swap_router.post(
@@ -1,8 +1,12 @@
 # 📍 routers/crypto/token_info.py
 import logging
-import httpx
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
+from lib.coingecko import CoinGeckoError
+from lib.token_metadata import get_token_entry, platform_metadata, resolve_coin_id
+from lib.coin_index import AmbiguousSymbol, platform_for_chain
+from lib.upstream_guard import UpstreamUnavailable
+from lib.http_cache import CACHE_TOKEN_INFO_MAX_AGE, cache_headers
 
 token_info_router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -48,61 +52,23 @@ class ErrorResponse(BaseModel):
         }
 
 
-# 🔹 Mapping popular token aliases to CoinGecko ID
-TOKEN_ALIAS = {
-    "eth": "ethereum",
-    "weth": "ethereum",
-    "sol": "solana",
-    "bnb": "binancecoin",
-    "busd": "binance-usd",
-    "usdt": "tether",
-    "usdc": "usd-coin",
-    "trx": "tron",
-    "ton": "the-open-network",
-    "ada": "cardano",
-    "dot": "polkadot",
-    "matic": "matic-network",
-    "avax": "avalanche-2",
-    "doge": "dogecoin",
-    "shib": "shiba-inu",
-    "ltc": "litecoin",
-    "btc": "bitcoin",
-    "atom": "cosmos",
-    "dai": "dai",
-    "ftm": "fantom",
-    "cake": "pancakeswap-token",
-}
+DEFAULT_PLATFORM = "ethereum"
+# 🔹 kandidat coin id yang ditampilkan di 409 symbol ambigu
+AMBIGUOUS_CANDIDATES_MAX = 20
 
 
-async def fetch_token_metadata_coingecko(token_id: str) -> dict:
-    url = f"https://api.coingecko.com/api/v3/coins/{token_id.lower()}"
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url)
-        if resp.status_code != 200:
-            raise HTTPException(
-                status_code=404, detail=f"Token {token_id} not found on CoinGecko"
-            )
-        data = resp.json()
-        metadata = {
-            "name": data.get("name"),
-            "symbol": data.get("symbol").upper() if data.get("symbol") else None,
-            "decimals": (
-                data.get("detail_platforms", {})
-                .get("ethereum", {})
-                .get("decimal_place")
-                if "detail_platforms" in data
-                else None
-            ),
-            "contract_address": (
-                data.get("detail_platforms", {})
-                .get("ethereum", {})
-                .get("contract_address")
-                if "detail_platforms" in data
-                else None
-            ),
-            "coingecko_id": data.get("id"),
-        }
-        return metadata
+async def fetch_token_entry_coingecko(token_id: str) -> dict:
+    """Entry metadata dari cache (TTL panjang), fetch ke CoinGecko hanya kalau belum ada"""
+    try:
+        return await get_token_entry(token_id)
+    except CoinGeckoError as e:
+        if e.status != 404:
+            raise HTTPException(status_code=503, detail=str(e))
+        raise HTTPException(
+            status_code=404, detail=f"Token {token_id} not found on CoinGecko"
+        )
+    except UpstreamUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
 
 @token_info_router.get(
@@ -110,7 +76,10 @@ async def fetch_token_metadata_coingecko(token_id: str) -> dict:
     summary="Get Token Metadata",
     description=(
         "Fetch real-time metadata of a token from CoinGecko. "
-        "Popular aliases are supported, e.g., sol -> solana, eth -> ethereum, etc."
+        "Popular aliases are supported, e.g., sol -> solana, eth -> ethereum, etc. "
+        "Contract addresses can be looked up on any supported chain via `chain`. "
+        "A symbol shared by several coins (after narrowing to coins deployed on `chain`) "
+        "returns 409 with the candidate CoinGecko ids."
     ),
     response_model=TokenInfoResponse,
     responses={
@@ -132,6 +101,17 @@ async def fetch_token_metadata_coingecko(token_id: str) -> dict:
                 }
             },
         },
+        409: {
+            "description": "Symbol is shared by several coins",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "error",
+                        "detail": "Symbol uni is ambiguous, pass one of these CoinGecko ids: uniswap, unicorn-token",
+                    }
+                }
+            },
+        },
         404: {
             "description": "Token not found",
             "content": {
@@ -157,15 +137,40 @@ async def fetch_token_metadata_coingecko(token_id: str) -> dict:
     },
 )
 async def get_token_info(
-    token: str = Query(..., description="Token symbol or alias to fetch metadata for")
+    response: Response,
+    token: str = Query(
+        ...,
+        description="Token symbol, alias, CoinGecko id or contract address to fetch metadata for",
+    ),
+    chain: str | None = Query(
+        None,
+        description="Chain for contract lookup & decimals: eth, bsc, polygon, base, sol, trx (default: eth)",
+    ),
 ):
     try:
-        token_id = TOKEN_ALIAS.get(token.lower(), token.lower())
-        metadata = await fetch_token_metadata_coingecko(token_id)
-        logger.info(f"Token info fetched from CoinGecko: {token} -> {token_id}")
-        return {"status": "success", "token": token.lower(), "metadata": metadata}
+        platform = platform_for_chain(chain) or DEFAULT_PLATFORM
+        try:
+            token_id = resolve_coin_id(token, platform)
+        except AmbiguousSymbol as e:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Symbol {token} is ambiguous, pass one of these CoinGecko ids: "
+                + ", ".join(e.candidates[:AMBIGUOUS_CANDIDATES_MAX]),
+            )
+        if token_id is None:
+            raise HTTPException(
+                status_code=404, detail=f"Token {token} not found on CoinGecko"
+            )
+        entry = await fetch_token_entry_coingecko(token_id)
+        logger.info("Token info: %s -> %s", token, token_id)
+        cache_headers(response.headers, CACHE_TOKEN_INFO_MAX_AGE, entry["fetched_at"])
+        return {
+            "status": "success",
+            "token": token.lower(),
+            "metadata": platform_metadata(entry, platform),
+        }
     except HTTPException as he:
-        logger.warning(f"Token {token} not found: {he.detail}")
+        logger.warning("Token %s not found: %s", token, he.detail)
         raise he
     except Exception as e:
         logger.error(f"❌ Failed to fetch token info: {e}", exc_info=True)
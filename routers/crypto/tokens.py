@@ -1,11 +1,17 @@
 # 📍 routers/crypto/tokens.py
+import os
 import logging
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
+from lib.http_cache import CACHE_TOKENS_MAX_AGE, cache_headers
 
 tokens_router = APIRouter()
 logger = logging.getLogger(__name__)
 
+SUPPORTED_TOKENS = ["BASE", "SOL", "ETH", "BNB", "TRX", "POLYGON"]
+# 🔹 daftar hanya berubah saat deploy → Last-Modified = mtime file ini (sama di semua worker)
+TOKENS_UPDATED_AT = os.path.getmtime(__file__)
+
 
 # ===== Response Models =====
 class TokensResponse(BaseModel):
@@ -65,13 +71,13 @@ class ErrorResponse(BaseModel):
         },
     },
 )
-async def get_supported_tokens():
+async def get_supported_tokens(response: Response):
     """
     Return the list of tokens and blockchains supported by the API.
 
     This helps clients to determine which tokens can be used with
     various crypto functionalities such as swap, send native, and more.
     """
-    tokens = ["BASE", "SOL", "ETH", "BNB", "TRX", "POLYGON"]
     logger.info("📌 Request for supported tokens list")
-    return {"status": "success", "tokens": tokens}
+    cache_headers(response.headers, CACHE_TOKENS_MAX_AGE, TOKENS_UPDATED_AT)
+    return {"status": "success", "tokens": SUPPORTED_TOKENS}
@@ -1,66 +1,116 @@
 # 📍 routers/crypto/tx_status.py
 import logging
+from web3 import Web3
 from fastapi import APIRouter, HTTPException, Query
-from solana.rpc.async_api import AsyncClient as SolanaClient
-from solders.signature import Signature
-from web3 import AsyncWeb3, AsyncHTTPProvider
-from tronpy.async_tron import AsyncTron
+from lib.rpc_pool import (
+    get_async_web3,
+    get_async_solana_client,
+    get_async_tron_client,
+    has_pool,
+)
+from lib.chains import disabled_reason
+from lib.hedging import hedged_read
+from lib.upstream_guard import UpstreamUnavailable, guard_for_url, http_status_of
+from collections import OrderedDict
+import os
 import asyncio
+from lib.tracing import start_span, traced
+from lib.json_response import OrjsonResponse
+from lib.http_cache import CACHE_TX_FINAL_MAX_AGE, cache_headers, no_store
 
 tx_status_router = APIRouter()
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+TRONGRID_URL = os.getenv("TRONPY_HTTP_PROVIDER_URI", "https://api.trongrid.io/")
+
+# 🔹 Status TRX terakhir per tx_hash, disajikan saat TronGrid kena circuit breaker
+TRX_STATUS_CACHE_SIZE = 1024
+_trx_status_cache: OrderedDict[str, dict] = OrderedDict()
+
+
+def _is_final(result: dict) -> bool:
+    """
+    success / failed yang sudah finalized di chain (tidak bisa reorg lagi), dari
+    data lengkap (hasil provisional / stale selalu punya note)
+    """
+    return (
+        result.get("status") in ("success", "failed")
+        and result.get("finalized") is True
+        and "note" not in result
+        and not result.get("stale")
+    )
+
+
+def _remember_trx_status(tx_hash: str, result: dict):
+    _trx_status_cache[tx_hash] = result
+    _trx_status_cache.move_to_end(tx_hash)
+    while len(_trx_status_cache) > TRX_STATUS_CACHE_SIZE:
+        _trx_status_cache.popitem(last=False)
 
 
 # ----------------- SOLANA -----------------
+@traced("tx_status sol", chain="sol")
 async def get_solana_tx_status(
-    tx_hash: str, rpc_url: str, max_attempts: int = 15, delay: float = 2.0
+    tx_hash: str, rpc_url: str | None, max_attempts: int = 15, delay: float = 2.0
 ):
     """Cek status transaksi Solana sampai meta muncul atau max_attempts"""
+    from solders.signature import Signature  # SDK Solana di-import saat dipakai
+
     signature = Signature.from_string(tx_hash)
     attempt = 0
-    async with SolanaClient(rpc_url) as client:
-        while attempt < max_attempts:
-            attempt += 1
-            for commitment in ["confirmed", "finalized"]:
-                resp = await client.get_transaction(
-                    signature, encoding="json", commitment=commitment
+    while attempt < max_attempts:
+        attempt += 1
+        # finalized dulu: tx lama (yang paling sering dicek ulang) langsung final,
+        # tx baru jatuh ke confirmed
+        for commitment in ["finalized", "confirmed"]:
+            # tiap getTransaction di-hedge antar endpoint pool (kalau rpc_url kosong)
+            with start_span(
+                "sol getTransaction", chain="sol", attempt=attempt, commitment=commitment
+            ):
+                resp = await hedged_read(
+                    "sol",
+                    lambda url: get_async_solana_client(url).get_transaction(
+                        signature, encoding="json", commitment=commitment
+                    ),
+                    rpc_url,
                 )
-                tx_data = resp.value
-                if tx_data:
-                    # ambil meta via attribute
-                    meta = getattr(tx_data, "meta", None)
-
-                    # kalau meta ada → return detail lengkap
-                    if meta:
-                        success = getattr(meta, "err", None) is None
-                        return {
-                            "status": "success" if success else "failed",
-                            "tx_hash": tx_hash,
-                            "slot": getattr(tx_data, "slot", None),
-                            "fee": getattr(meta, "fee", None),
-                            "pre_balances": getattr(meta, "pre_balances", None),
-                            "post_balances": getattr(meta, "post_balances", None),
-                            "err": getattr(meta, "err", None),
-                        }
-
-                    # kalau meta None tapi tx ada → treat as success sementara
-                    elif hasattr(tx_data, "slot") and tx_data.slot:
-                        logger.info(
-                            f"Tx {tx_hash} ditemukan di slot {tx_data.slot}, meta belum tersedia, return provisional success"
-                        )
-                        return {
-                            "status": "success",
-                            "tx_hash": tx_hash,
-                            "slot": tx_data.slot,
-                            "note": "Tx sukses, meta belum tersedia, data lengkap menyusul",
-                        }
-
-            backoff = delay * (2 ** (attempt - 1))  # exponential backoff
-            logger.info(
-                f"Attempt {attempt}: tx {tx_hash} belum finalized, retry {backoff}s"
-            )
-            await asyncio.sleep(backoff)
+            tx_data = resp.value
+            if tx_data:
+                # ambil meta via attribute
+                meta = getattr(tx_data, "meta", None)
+
+                # kalau meta ada → return detail lengkap
+                if meta:
+                    success = getattr(meta, "err", None) is None
+                    return {
+                        "status": "success" if success else "failed",
+                        "tx_hash": tx_hash,
+                        "finalized": commitment == "finalized",
+                        "slot": getattr(tx_data, "slot", None),
+                        "fee": getattr(meta, "fee", None),
+                        "pre_balances": getattr(meta, "pre_balances", None),
+                        "post_balances": getattr(meta, "post_balances", None),
+                        "err": getattr(meta, "err", None),
+                    }
+
+                # kalau meta None tapi tx ada → treat as success sementara
+                elif hasattr(tx_data, "slot") and tx_data.slot:
+                    logger.info(
+                        f"Tx {tx_hash} ditemukan di slot {tx_data.slot}, meta belum tersedia, return provisional success"
+                    )
+                    return {
+                        "status": "success",
+                        "tx_hash": tx_hash,
+                        "finalized": commitment == "finalized",
+                        "slot": tx_data.slot,
+                        "note": "Tx sukses, meta belum tersedia, data lengkap menyusul",
+                    }
+
+        backoff = delay * (2 ** (attempt - 1))  # exponential backoff
+        logger.info(
+            f"Attempt {attempt}: tx {tx_hash} belum finalized, retry {backoff}s"
+        )
+        await asyncio.sleep(backoff)
 
     return {
         "status": "pending",
@@ -70,20 +120,49 @@ async def get_solana_tx_status(
 
 
 # ----------------- EVM (ETH/BSC/Polygon/Base) -----------------
-async def get_evm_tx_status(tx_hash: str, rpc_url: str):
-    """Cek status transaksi EVM chain via RPC"""
-    w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
-    receipt = await w3.eth.get_transaction_receipt(tx_hash)
+# Tiap RPC di-hedge sendiri: delay hedge = p95 satu request, bukan total
+# receipt + get_transaction + block finalized.
+async def _evm_finalized(chain: str, block_number: int, rpc_url: str | None) -> bool:
+    """Receipt sudah di bawah block tag "finalized" (tidak bisa reorg)"""
+    try:
+        finalized_block = await hedged_read(
+            chain,
+            lambda url: get_async_web3(url).eth.get_block("finalized"),
+            rpc_url,
+        )
+    except Exception as e:
+        # node tanpa tag "finalized" → anggap belum final (tidak di-cache)
+        logger.debug(f"Block finalized tidak tersedia: {e}")
+        return False
+    return block_number <= finalized_block["number"]
+
+
+@traced("tx_status evm")
+async def get_evm_tx_status(chain: str, tx_hash: str, rpc_url: str | None):
+    """Cek status transaksi EVM chain via RPC (pool hedged kalau rpc_url kosong)"""
+    receipt = await hedged_read(
+        chain,
+        lambda url: get_async_web3(url).eth.get_transaction_receipt(tx_hash),
+        rpc_url,
+    )
     if receipt is None:
         return {"status": "pending", "tx_hash": tx_hash}
 
-    tx = await w3.eth.get_transaction(tx_hash)
-    value_eth = w3.from_wei(tx.value, "ether")
-    gas_price = w3.from_wei(tx.gasPrice, "gwei") if tx.gasPrice else None
+    tx, finalized = await asyncio.gather(
+        hedged_read(
+            chain,
+            lambda url: get_async_web3(url).eth.get_transaction(tx_hash),
+            rpc_url,
+        ),
+        _evm_finalized(chain, receipt.blockNumber, rpc_url),
+    )
+    value_eth = Web3.from_wei(tx.value, "ether")
+    gas_price = Web3.from_wei(tx.gasPrice, "gwei") if tx.gasPrice else None
 
     return {
         "status": "success" if receipt.status == 1 else "failed",
         "tx_hash": tx_hash,
+        "finalized": finalized,
         "from": tx["from"],
         "to": tx["to"],
         "value": float(value_eth),
@@ -92,57 +171,93 @@ async def get_evm_tx_status(tx_hash: str, rpc_url: str):
         "cumulativeGasUsed": receipt.cumulativeGasUsed,
         "transactionIndex": receipt.transactionIndex,
         "blockNumber": receipt.blockNumber,
-        "logs": [dict(log) for log in receipt.logs],
+        # AttributeDict + HexBytes dikonversi langsung oleh encoder response
+        "logs": receipt.logs,
     }
 
 
 # ----------------- TRON -----------------
+async def _trx_solidified(block_number: int, node_url: str | None) -> bool:
+    """gettransactioninfobyid dari fullnode belum tentu solid → bandingkan dengan block solid terakhir"""
+    try:
+        solid_block = await hedged_read(
+            "trx",
+            lambda url: get_async_tron_client(url).get_latest_solid_block_number(),
+            node_url,
+        )
+    except Exception as e:
+        logger.debug(f"Block solid TRX tidak tersedia: {e}")
+        return False
+    return block_number <= solid_block
+
+
+@traced("tx_status trx", chain="trx")
 async def get_trx_tx_status(tx_hash: str, max_attempts: int = 5, delay: float = 2.0):
     """Cek status transaksi TRX via tronpy dengan retry jika rate-limit"""
-    async with AsyncTron() as client:
-        attempt = 0
-        while attempt < max_attempts:
-            attempt += 1
-            try:
-                tx_info = await client.get_transaction_info(tx_hash)
-                receipt = tx_info.get("receipt", {})
-                result = receipt.get("result") if receipt else None
-                if result == "SUCCESS":
-                    status = "success"
-                elif result == "FAILED":
-                    status = "failed"
-                else:
-                    status = "pending"
-
-                return {
-                    "status": status,
-                    "tx_hash": tx_hash,
-                    "fee": tx_info.get("fee"),
-                    "contractResult": tx_info.get("contractResult"),
-                    "logs": tx_info.get("log"),
-                    "blockNumber": tx_info.get("blockNumber"),
-                }
-
-            except Exception as e:
-                # kalau rate-limit, delay lebih lama
-                if (
-                    hasattr(e, "response")
-                    and e.response is not None
-                    and e.response.status_code == 429
-                ):
-                    logger.warning(
-                        f"TronGrid 429, retry {attempt}/{max_attempts} setelah delay {delay}s"
-                    )
-                    await asyncio.sleep(delay * attempt)  # backoff linear
-                else:
-                    logger.error(f"Gagal cek TRX tx {tx_hash}: {e}", exc_info=True)
-                    return {"status": "pending", "tx_hash": tx_hash, "note": str(e)}
+    # pakai node dari RPC pool (hedged) kalau ada, default TronGrid
+    node_url = None if has_pool("trx") else TRONGRID_URL
+    attempt = 0
+    while attempt < max_attempts:
+        attempt += 1
+        try:
+            with start_span("trx get_transaction_info", chain="trx", attempt=attempt):
+                tx_info = await hedged_read(
+                    "trx",
+                    lambda url: get_async_tron_client(url).get_transaction_info(
+                        tx_hash
+                    ),
+                    node_url,
+                )
+            receipt = tx_info.get("receipt", {})
+            result = receipt.get("result") if receipt else None
+            if result == "SUCCESS":
+                status = "success"
+            elif result == "FAILED":
+                status = "failed"
+            else:
+                status = "pending"
+
+            block_number = tx_info.get("blockNumber")
+            finalized = False
+            if status != "pending" and block_number is not None:
+                finalized = await _trx_solidified(block_number, node_url)
+
+            result = {
+                "status": status,
+                "tx_hash": tx_hash,
+                "finalized": finalized,
+                "fee": tx_info.get("fee"),
+                "contractResult": tx_info.get("contractResult"),
+                "logs": tx_info.get("log"),
+                "blockNumber": tx_info.get("blockNumber"),
+            }
+            _remember_trx_status(tx_hash, result)
+            return result
 
-        return {
-            "status": "pending",
-            "tx_hash": tx_hash,
-            "note": "Max retry reached, rate-limit?",
-        }
+        except UpstreamUnavailable as e:
+            # breaker open / limiter penuh → fail fast, sajikan hasil terakhir kalau ada
+            logger.warning(f"⚠️ {e}, tx {tx_hash} dijawab dari cache")
+            cached = _trx_status_cache.get(tx_hash)
+            if cached:
+                return {**cached, "stale": True, "note": str(e)}
+            return {"status": "pending", "tx_hash": tx_hash, "note": str(e)}
+
+        except Exception as e:
+            if http_status_of(e) == 429:
+                logger.warning(f"TronGrid 429, retry {attempt}/{max_attempts}")
+                # node TronGrid sudah diatur token bucket (rate turun otomatis);
+                # node lain tanpa guard tetap pakai backoff
+                if not (node_url and guard_for_url(node_url)):
+                    await asyncio.sleep(delay * attempt)
+            else:
+                logger.error(f"Gagal cek TRX tx {tx_hash}: {e}", exc_info=True)
+                return {"status": "pending", "tx_hash": tx_hash, "note": str(e)}
+
+    return {
+        "status": "pending",
+        "tx_hash": tx_hash,
+        "note": "Max retry reached, rate-limit?",
+    }
 
 
 # ----------------- API Endpoint -----------------
@@ -157,25 +272,29 @@ async def get_tx_status(
     ),
 ):
     chain = chain.lower()
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+
     try:
         if chain in ["sol"]:
-            if not rpc_url:
+            if not rpc_url and not has_pool(chain):
                 raise HTTPException(
                     status_code=400, detail="RPC URL harus diberikan untuk Solana"
                 )
-            return await get_solana_tx_status(tx_hash, rpc_url)
+            result = await get_solana_tx_status(tx_hash, rpc_url)
 
         elif chain in ["eth", "bnb", "polygon", "base"]:
-            if not rpc_url:
+            if not rpc_url and not has_pool(chain):
                 raise HTTPException(
                     status_code=400,
                     detail=f"RPC URL harus diberikan untuk {chain.upper()}",
                 )
             logger.info(f"🔹 Checking {chain.upper()} tx via RPC: {tx_hash}")
-            return await get_evm_tx_status(tx_hash, rpc_url)
+            result = await get_evm_tx_status(chain, tx_hash, rpc_url)
 
         elif chain == "trx":
-            return await get_trx_tx_status(tx_hash)
+            result = await get_trx_tx_status(tx_hash)
 
         else:
             raise HTTPException(
@@ -185,3 +304,13 @@ async def get_tx_status(
     except Exception as e:
         logger.error(f"❌ Failed to check tx_status [{chain}]: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+    # response langsung (tanpa jsonable_encoder): receipt web3 / objek solders
+    # dikonversi orjson dalam satu jalan
+    response = OrjsonResponse(result)
+    # 🗄️ tx final tidak berubah lagi → boleh di-cache gateway/client, sisanya no-store
+    if _is_final(result):
+        cache_headers(response.headers, CACHE_TX_FINAL_MAX_AGE)
+    else:
+        no_store(response.headers)
+    return response
@@ -0,0 +1,127 @@
+# 📍 routers/crypto/validate.py
+import os
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+from lib.wallet_validator import FAMILY_OF_CHAIN, check_addresses
+from lib.chains import disabled_reason
+from lib.json_response import OrjsonResponse
+
+validate_router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 🔹 batas alamat per request (body JSON ~50 byte per alamat)
+VALIDATE_BATCH_MAX = int(os.getenv("VALIDATE_BATCH_MAX", "50000"))
+
+
+# ===== Request Models =====
+class ValidateBatchRequest(BaseModel):
+    chain: str = Field(..., description="Chain: eth, bnb, bsc, polygon, base, sol, trx, ton")
+    addresses: list[str] = Field(..., description="Wallet addresses to validate")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "chain": "eth",
+                "addresses": [
+                    "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+                    "0xdAC17F958D2ee523a2206206994597C13D831eC7",
+                ],
+            }
+        }
+
+
+def _validate(chain: str, addresses: list[str]) -> tuple[OrjsonResponse, int]:
+    """Cek + encode response (orjson, tanpa jsonable_encoder) sekaligus, dijalankan di thread"""
+    checks = check_addresses(chain, addresses)
+    results = [
+        {"address": address, "valid": valid, "normalized": normalized, "reason": reason}
+        for address, (valid, normalized, reason) in zip(addresses, checks)
+    ]
+    valid_count = sum(1 for valid, _, _ in checks if valid)
+    response = OrjsonResponse(
+        {
+            "status": "success",
+            "chain": chain,
+            "total": len(checks),
+            "valid": valid_count,
+            "invalid": len(checks) - valid_count,
+            "results": results,
+        }
+    )
+    return response, valid_count
+
+
+@validate_router.post(
+    "/validate/batch",
+    summary="Validate Wallet Addresses (Batch)",
+    description=(
+        "Validate up to tens of thousands of wallet addresses for one chain in a single call.\n"
+        "- EVM (eth, bnb, bsc, polygon, base): 0x + 40 hex, EIP-55 checksum enforced for mixed case, "
+        "`normalized` is the checksummed address\n"
+        "- Solana (sol): base58 32-byte public key on the ed25519 curve\n"
+        "- TRON (trx): base58check address with 0x41 prefix\n"
+        "- TON (ton): format check only\n\n"
+        "Results are returned in the same order as `addresses`."
+    ),
+    responses={
+        200: {
+            "description": "Validation results",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "chain": "eth",
+                        "total": 2,
+                        "valid": 1,
+                        "invalid": 1,
+                        "results": [
+                            {
+                                "address": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+                                "valid": True,
+                                "normalized": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+                                "reason": None,
+                            },
+                            {
+                                "address": "0xdAC17F958D2ee523a2206206994597C13D831eC7",
+                                "valid": False,
+                                "normalized": None,
+                                "reason": "checksum EIP-55 tidak cocok",
+                            },
+                        ],
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Unsupported chain / too many addresses",
+            "content": {
+                "application/json": {
+                    "example": {"status": "error", "detail": "chain doge tidak didukung"}
+                }
+            },
+        },
+    },
+)
+async def validate_batch(body: ValidateBatchRequest):
+    chain = body.chain.lower()
+    if chain not in FAMILY_OF_CHAIN:
+        raise HTTPException(status_code=400, detail=f"chain {body.chain} tidak didukung")
+    disabled = disabled_reason(chain)
+    if disabled:
+        raise HTTPException(status_code=400, detail=disabled)
+    if len(body.addresses) > VALIDATE_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Maksimal {VALIDATE_BATCH_MAX} alamat per request, dapat {len(body.addresses)}",
+        )
+
+    # puluhan ribu alamat (keccak / ed25519 + encode) = ratusan ms CPU → di thread,
+    # event loop tetap melayani request lain
+    response, valid_count = await asyncio.to_thread(_validate, chain, body.addresses)
+    logger.info(
+        "🔹 Validasi batch %s: %d alamat, %d valid", chain, len(body.addresses), valid_count
+    )
+    return response
+
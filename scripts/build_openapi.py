@@ -0,0 +1,47 @@
+# 📍 scripts/build_openapi.py
+"""
+Bangun openapi.json dari app (jalankan saat build / sebelum deploy), supaya
+worker cukup memuat bytes jadi (lib/openapi_static.py).
+
+    python scripts/build_openapi.py            # tulis openapi.json
+    python scripts/build_openapi.py --check    # exit 1 kalau openapi.json basi (CI)
+"""
+import os
+import sys
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# warning "openapi.json basi" dari import main tidak relevan di sini
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+from main import app  # noqa: E402
+from lib.openapi_static import OPENAPI_PATH, serialize_schema  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="bandingkan saja, jangan tulis")
+    parser.add_argument("--output", default=OPENAPI_PATH)
+    args = parser.parse_args()
+
+    body = serialize_schema(app.openapi())
+    current = None
+    if os.path.exists(args.output):
+        with open(args.output, "rb") as f:
+            current = f.read()
+
+    if args.check:
+        if current != body:
+            print(f"❌ {args.output} basi, jalankan python scripts/build_openapi.py")
+            sys.exit(1)
+        print(f"✅ {args.output} up to date ({len(body)} byte)")
+        return
+
+    with open(args.output, "wb") as f:
+        f.write(body)
+    print(f"📄 {args.output} ditulis ({len(body)} byte)")
+
+
+if __name__ == "__main__":
+    main()
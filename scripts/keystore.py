@@ -0,0 +1,82 @@
+# 📍 scripts/keystore.py
+"""
+Kelola keystore signer hot wallet (lib/signer_registry.py): tiap alias disimpan
+sebagai keyfile Web3 Secret Storage v3 (terenkripsi password) + "family".
+
+    python scripts/keystore.py add hot1 evm          # private key dibaca dari prompt / stdin
+    python scripts/keystore.py add solhot sol --path /etc/crypto-api/keystore.json
+    python scripts/keystore.py list
+
+Password dari SIGNER_KEYSTORE_PASSWORD (atau prompt), path default
+SIGNER_KEYSTORE_PATH / keystore.json. Server memuat file ini saat startup.
+"""
+import os
+import sys
+import json
+import getpass
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from eth_keyfile import create_keyfile_json  # noqa: E402
+from lib.signer_registry import (  # noqa: E402
+    SIGNER_FAMILIES,
+    SIGNER_KEYSTORE_PATH,
+    SignerError,
+    decode_key,
+    derive_signer,
+)
+
+
+def read_keystore(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def add(args):
+    password = os.getenv("SIGNER_KEYSTORE_PASSWORD") or getpass.getpass("Password keystore: ")
+    raw = getpass.getpass("Private key: ") if sys.stdin.isatty() else sys.stdin.readline()
+    try:
+        key = decode_key(args.family, raw)
+        signer = derive_signer(args.family, key, alias=args.alias)
+    except (SignerError, ValueError) as e:
+        sys.exit(f"❌ {e}")
+
+    # sol: secret key 64 byte = seed + pubkey → cukup seed 32 byte (Keypair.from_seed di server)
+    key = key[:32]
+    keyfile = create_keyfile_json(key, password.encode("utf-8"), kdf="scrypt")
+    if args.family != "evm":
+        keyfile.pop("address", None)  # alamat ethereum dari key non-EVM tidak bermakna
+    keyfile["family"] = args.family
+
+    keystore = read_keystore(args.path)
+    keystore[args.alias.lower()] = keyfile
+    with open(args.path, "w") as f:
+        json.dump(keystore, f, indent=2)
+    os.chmod(args.path, 0o600)
+    print(f"🔑 {args.alias.lower()} ({args.family}) → {signer.address}, disimpan ke {args.path}")
+
+
+def list_aliases(args):
+    for alias, keyfile in read_keystore(args.path).items():
+        print(f"{alias:<20}{keyfile.get('family', 'evm')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=SIGNER_KEYSTORE_PATH or os.path.join(ROOT, "keystore.json"))
+    sub = parser.add_subparsers(dest="command", required=True)
+    add_parser = sub.add_parser("add", help="tambah / ganti alias")
+    add_parser.add_argument("alias")
+    add_parser.add_argument("family", choices=SIGNER_FAMILIES)
+    add_parser.set_defaults(func=add)
+    sub.add_parser("list", help="daftar alias").set_defaults(func=list_aliases)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()